@@ -20,12 +20,79 @@ SCREEN_WIDTH = 1280
 SCREEN_HEIGHT = 960
 FULLSCREEN = True
 
+# Render game (FPS) terpisah dari simulasi yang selalu 60 tick/detik.
+# GAME_SPEED > 1 = fast-forward (lebih banyak tick per frame).
+RENDER_FPS = 60
+GAME_SPEED = 1.0
+
+# Training mode visual: simulasi jalan secepatnya, layar di-render segini
+TRAINING_RENDER_FPS = 30
+
 DEFAULT_TARGET_LAPS = 3
 DEFAULT_AI_COUNT = 3
 DEFAULT_MODEL = "winner_genome.pkl"
 DEFAULT_MODEL_2 = "winner_map-2.pkl"
 MASKING_SUBFOLDER = "masking"
 
+# Radar AI pakai distance field (sphere tracing) bukan step 5 px.
+# Harus sama antara training dan game supaya input network konsisten.
+USE_DISTANCE_FIELD = False
+
+# Progress sepanjang track (field arc-length dari masking + checkpoint, di-cache
+# bersama map): fitness training, ranking leaderboard, dan motor yang tidak
+# maju (muter di tempat) dimatikan. Mengubah hasil training: model lama
+# dilatih dengan fitness jarak tempuh.
+USE_PROGRESS_FIELD = True
+
+# Simpan heatmap coverage populasi (cell 50 px yang dikunjungi, dari grid
+# kunjungan yang sama dengan novelty) per generasi ke logs/coverage-*.npy
+COVERAGE_HEATMAP = False
+
+# Collision juga cek garis dari posisi tick sebelumnya ke posisi baru, jadi
+# motor cepat tidak bisa tembus wall tipis di antara dua tick.
+# Mengubah hasil simulasi: model lama dilatih tanpa ini.
+SWEPT_COLLISION = True
+
+# Motor saling dorong kalau bersentuhan (spatial hash, biaya linear).
+# Training default tanpa contact: semua motor spawn di titik yang sama.
+MOTOR_CONTACT = True
+TRAINING_MOTOR_CONTACT = False
+
+# Input tambahan untuk network: jarak lawan terdekat (0-10 seperti radar).
+# Butuh num_inputs = 6 di config.txt dan model yang dilatih dengan ini.
+OPPONENT_RADAR = False
+
+# Event log terstruktur (logs/): 0 = mati, 1 = ringkasan generasi,
+# 2 = + lap/death/stuck/budget reset, 3 = + setiap checkpoint.
+# Format "jsonl" atau "binary" (core.event_log.read_events membaca keduanya).
+EVENT_LOG_LEVEL = 1
+EVENT_LOG_FORMAT = "jsonl"
+EVENT_LOG_THREADED = True   # Tulis file di thread background
+EVENT_LOG_ECHO = False      # Cetak juga event ke terminal (lewat sink, bukan di loop)
+
+# Budget simulasi training per generasi dalam tick (frame), setara 90 detik
+# di 60 FPS. Lap baru me-reset budget. Hasil tidak tergantung kecepatan mesin.
+GENERATION_TICK_BUDGET = 90 * 60
+
+# Early culling training: di tiap milestone (tick sejak awal generasi),
+# genome yang progress checkpoint-nya tertinggal dipensiunkan dan fitness-nya
+# dibekukan. "off", "halving" (sisakan CULL_KEEP_FRACTION motor hidup terbaik)
+# atau "percentile" (cull progress di bawah persentil CULL_PERCENTILE populasi).
+CULL_MODE = "off"
+CULL_MILESTONES = (10 * 60, 20 * 60, 40 * 60)
+CULL_KEEP_FRACTION = 0.5
+CULL_PERCENTILE = 25.0
+CULL_MIN_ALIVE = 10
+
+# Fitness cache genome identik (elite yang dibawa ke generasi berikut, clone
+# dalam satu generasi): jumlah genome unik yang diingat, 0 = mati. Otomatis
+# mati kalau motor saling mempengaruhi (contact / radar lawan).
+FITNESS_CACHE_SIZE = 4096
+
+# Kapasitas output cache per AI (input radar terkuantisasi -> output network).
+# 0 = tanpa cache.
+AI_OUTPUT_CACHE_SIZE = 4096
+
 # =============================================================================
 # MAP CONFIGURATIONS
 # =============================================================================
@@ -2,3 +2,4 @@
 AI Training components
 """
 from .trainer import NEATTrainer
+from .compiled_net import CompiledNetwork, NetworkBatch
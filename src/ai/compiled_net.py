@@ -0,0 +1,232 @@
+"""
+Compiled Network untuk NEAT
+===========================
+
+neat.nn.FeedForwardNetwork.activate() jalan node per node lewat dict
+dan list Python. Modul ini meng-compile network jadi program datar
+yang sudah urut topologis:
+
+- CompiledNetwork: satu network, di-generate jadi fungsi Python biasa
+  (hasil sama persis dengan activate()).
+- NetworkBatch: banyak network sekaligus, forward pass NumPy per level
+  topologis (hasil sama dengan activate() dalam toleransi float).
+"""
+
+import math
+from typing import Dict, List, Sequence, Tuple
+
+import numpy as np
+import neat
+
+
+# Kode activation yang didukung (sesuai activation_options di config.txt)
+ACT_RELU = 0
+ACT_TANH = 1
+ACT_SIGMOID = 2
+ACT_GAUSS = 3
+
+ACTIVATION_CODES = {
+    'relu': ACT_RELU,
+    'tanh': ACT_TANH,
+    'sigmoid': ACT_SIGMOID,
+    'gauss': ACT_GAUSS,
+}
+
+# Ekspresi scalar, rumus sama persis dengan neat.activations
+_SCALAR_EXPR = {
+    ACT_RELU: "({z} if {z} > 0.0 else 0.0)",
+    ACT_TANH: "_tanh(max(-60.0, min(60.0, 2.5 * {z})))",
+    ACT_SIGMOID: "(1.0 / (1.0 + _exp(-max(-60.0, min(60.0, 5.0 * {z})))))",
+    ACT_GAUSS: "_exp(-5.0 * max(-3.4, min(3.4, {z})) ** 2)",
+}
+
+
+def _activation_code(func) -> int:
+    """Kode activation dari fungsi neat (misal relu_activation -> ACT_RELU)."""
+    name = getattr(func, '__name__', '').replace('_activation', '')
+    if name not in ACTIVATION_CODES:
+        raise ValueError(f"Activation '{name}' belum didukung CompiledNetwork")
+    return ACTIVATION_CODES[name]
+
+
+def _apply_activation(code: int, z: np.ndarray) -> np.ndarray:
+    """Versi NumPy dari activation neat."""
+    if code == ACT_RELU:
+        return np.where(z > 0.0, z, 0.0)
+    if code == ACT_TANH:
+        return np.tanh(np.clip(2.5 * z, -60.0, 60.0))
+    if code == ACT_SIGMOID:
+        return 1.0 / (1.0 + np.exp(-np.clip(5.0 * z, -60.0, 60.0)))
+    return np.exp(-5.0 * np.clip(z, -3.4, 3.4) ** 2)
+
+
+class CompiledNetwork:
+    """
+    Network NEAT dalam bentuk program datar.
+
+    Setiap langkah program: (slot tujuan, kode activation, bias, response,
+    [(slot sumber, weight), ...]). Slot 0..num_inputs-1 adalah input.
+
+    Usage:
+        net = CompiledNetwork.create(genome, config)
+        output = net.activate(radar_data)
+    """
+
+    def __init__(self, num_inputs: int, steps: List[Tuple], output_slots: List[int]):
+        """
+        Args:
+            num_inputs: Jumlah input
+            steps: Program urut topologis (lihat docstring class)
+            output_slots: Slot untuk tiap output, -1 = output tanpa koneksi (0.0)
+        """
+        self.num_inputs = num_inputs
+        self.steps = steps
+        self.output_slots = output_slots
+        self._func = None
+
+    @classmethod
+    def from_network(cls, net: neat.nn.FeedForwardNetwork) -> "CompiledNetwork":
+        """Compile dari FeedForwardNetwork yang sudah dibuat neat."""
+        slots: Dict[int, int] = {key: i for i, key in enumerate(net.input_nodes)}
+        steps = []
+
+        for node, act_func, agg_func, bias, response, links in net.node_evals:
+            if getattr(agg_func, '__name__', '') != 'sum_aggregation':
+                raise ValueError("CompiledNetwork hanya mendukung aggregation 'sum'")
+            code = _activation_code(act_func)
+            inputs = [(slots[i], w) for i, w in links]
+            slots[node] = len(slots)
+            steps.append((slots[node], code, bias, response, inputs))
+
+        output_slots = [slots.get(key, -1) for key in net.output_nodes]
+        return cls(len(net.input_nodes), steps, output_slots)
+
+    @classmethod
+    def create(cls, genome, config) -> "CompiledNetwork":
+        """Compile langsung dari genome (setara FeedForwardNetwork.create)."""
+        return cls.from_network(neat.nn.FeedForwardNetwork.create(genome, config))
+
+    @property
+    def num_slots(self) -> int:
+        return self.num_inputs + len(self.steps)
+
+    def _compile(self):
+        """Generate fungsi Python: satu baris per node, tanpa dict lookup."""
+        lines = ["def _net(v):"]
+        lines.append(f"    v = list(v) + [0.0] * {len(self.steps)}")
+        for dst, code, bias, response, inputs in self.steps:
+            # Urutan penjumlahan sama dengan sum() di neat
+            terms = "".join(f" + v[{src}] * {w!r}" for src, w in inputs)
+            lines.append(f"    s = 0{terms}")
+            z = f"({bias!r} + {response!r} * s)"
+            lines.append(f"    z = {z}")
+            lines.append(f"    v[{dst}] = {_SCALAR_EXPR[code].format(z='z')}")
+        outputs = ", ".join(f"v[{slot}]" if slot >= 0 else "0.0" for slot in self.output_slots)
+        lines.append(f"    return [{outputs}]")
+
+        scope = {'_exp': math.exp, '_tanh': math.tanh}
+        exec("\n".join(lines), scope)
+        return scope['_net']
+
+    def activate(self, inputs: Sequence[float]) -> List[float]:
+        """Sama dengan FeedForwardNetwork.activate()."""
+        if len(inputs) != self.num_inputs:
+            raise RuntimeError(f"Expected {self.num_inputs} inputs, got {len(inputs)}")
+        if self._func is None:
+            self._func = self._compile()
+        return self._func(inputs)
+
+    def __getstate__(self):
+        # Fungsi hasil exec tidak bisa di-pickle, compile ulang di proses tujuan
+        state = self.__dict__.copy()
+        state['_func'] = None
+        return state
+
+
+class NetworkBatch:
+    """
+    Forward pass banyak CompiledNetwork sekaligus.
+
+    Semua node dari semua network dikelompokkan per level topologis,
+    jadi jumlah operasi NumPy tergantung kedalaman network, bukan
+    jumlah genome atau jumlah node.
+
+    Usage:
+        batch = NetworkBatch(nets)
+        outputs = batch.forward(inputs)   # (N, num_inputs) -> (N, num_outputs)
+    """
+
+    def __init__(self, nets: Sequence[CompiledNetwork]):
+        self.count = len(nets)
+        self.num_inputs = nets[0].num_inputs if nets else 0
+        self.num_outputs = len(nets[0].output_slots) if nets else 0
+
+        # Setiap network dapat stride slot yang sama, slot terakhir selalu 0.0
+        self.stride = max((net.num_slots for net in nets), default=0) + 1
+        zero_slot = self.stride - 1
+        self.values = np.zeros(self.count * self.stride, dtype=np.float64)
+
+        # Kelompokkan langkah per level (input = level 0)
+        levels: Dict[int, List] = {}
+        for n, net in enumerate(nets):
+            base = n * self.stride
+            depth = [0] * net.num_slots
+            for dst, code, bias, response, inputs in net.steps:
+                level = 1 + max((depth[src] for src, _ in inputs), default=0)
+                depth[dst] = level
+                levels.setdefault(level, []).append(
+                    (base + dst, code, bias, response,
+                     [(base + src, w) for src, w in inputs]))
+
+        self.levels = []
+        for level in sorted(levels):
+            steps = levels[level]
+            fan_in = max(1, max(len(step[4]) for step in steps))
+            src = np.full((len(steps), fan_in), 0, dtype=np.int64)
+            weight = np.zeros((len(steps), fan_in), dtype=np.float64)
+            for e, step in enumerate(steps):
+                # Padding: baca slot nol dari network yang sama, weight 0
+                src[e, :] = step[0] - step[0] % self.stride + zero_slot
+                for j, (s, w) in enumerate(step[4]):
+                    src[e, j] = s
+                    weight[e, j] = w
+
+            codes = np.array([step[1] for step in steps], dtype=np.int64)
+            groups = [(code, np.flatnonzero(codes == code)) for code in np.unique(codes).tolist()]
+            self.levels.append((
+                np.array([step[0] for step in steps], dtype=np.int64),
+                src, weight,
+                np.array([step[2] for step in steps], dtype=np.float64),
+                np.array([step[3] for step in steps], dtype=np.float64),
+                groups,
+            ))
+
+        self.output_index = np.array(
+            [[n * self.stride + (slot if slot >= 0 else zero_slot) for slot in net.output_slots]
+             for n, net in enumerate(nets)], dtype=np.int64).reshape(self.count, self.num_outputs)
+
+    def forward(self, inputs: np.ndarray) -> np.ndarray:
+        """
+        Args:
+            inputs: Array (N, num_inputs), baris ke-n untuk network ke-n
+
+        Returns:
+            Array (N, num_outputs)
+        """
+        values = self.values
+        grid = values.reshape(self.count, self.stride)
+        grid[:, :self.num_inputs] = inputs
+
+        for dst, src, weight, bias, response, groups in self.levels:
+            # Jumlahkan berurutan seperti sum() di neat
+            s = values[src[:, 0]] * weight[:, 0]
+            for j in range(1, src.shape[1]):
+                s += values[src[:, j]] * weight[:, j]
+            z = bias + response * s
+
+            out = np.empty_like(z)
+            for code, rows in groups:
+                out[rows] = _apply_activation(code, z[rows])
+            values[dst] = out
+
+        return values[self.output_index]
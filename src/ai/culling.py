@@ -0,0 +1,98 @@
+"""
+Early Culling untuk NEAT Training
+=================================
+
+Genome yang progress checkpoint-nya jauh tertinggal dari populasi
+dipensiunkan di tick milestone tertentu, jadi motor lemah tidak
+menghabiskan sisa budget generasi. Fitness-nya dibekukan di tick itu
+(motor mati tidak di-update lagi).
+
+Progress = lap * TOTAL_CHECKPOINTS + checkpoint_count, naik satu per
+checkpoint yang dilewati dengan urutan benar.
+
+Mode:
+- "halving": successive halving, di tiap milestone hanya `keep_fraction`
+  motor hidup terbaik (progress, lalu fitness) yang lanjut.
+- "percentile": motor hidup dengan progress di bawah persentil
+  `percentile` seluruh populasi (termasuk yang sudah mati) dipensiunkan.
+
+Keputusan diambil trainer dari progress gabungan semua shard, jadi hasil
+serial dan paralel tetap sama.
+"""
+
+from dataclasses import dataclass
+from typing import Tuple
+
+import numpy as np
+
+from core.vector_pool import TOTAL_CHECKPOINTS
+
+
+CULL_MODES = ("off", "halving", "percentile")
+
+
+def checkpoint_progress(lap_count, checkpoint_count):
+    """Progress checkpoint (skalar atau array) dari lap dan checkpoint_count."""
+    return lap_count * TOTAL_CHECKPOINTS + checkpoint_count
+
+
+@dataclass
+class CullPolicy:
+    """Konfigurasi culling per generasi."""
+    mode: str = "off"                               # Salah satu CULL_MODES
+    milestones: Tuple[int, ...] = (600, 1200, 2400)  # Tick sejak awal generasi
+    keep_fraction: float = 0.5                      # halving: porsi motor hidup yang lanjut
+    percentile: float = 25.0                        # percentile: batas progress populasi
+    min_alive: int = 10                             # Tidak pernah cull di bawah jumlah ini
+
+    def __post_init__(self):
+        if self.mode not in CULL_MODES:
+            raise ValueError(f"Mode culling tidak dikenal: {self.mode} (pilih {', '.join(CULL_MODES)})")
+        self.milestones = tuple(sorted(int(tick) for tick in self.milestones if tick > 0))
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off" and bool(self.milestones)
+
+    def next_milestone(self, tick: int) -> int:
+        """Milestone pertama setelah `tick`, -1 jika tidak ada lagi."""
+        for milestone in self.milestones:
+            if milestone > tick:
+                return milestone
+        return -1
+
+    def select(self, progress: np.ndarray, fitness: np.ndarray, alive: np.ndarray) -> np.ndarray:
+        """
+        Pilih motor yang dipensiunkan di milestone ini.
+
+        Args:
+            progress: Progress checkpoint per genome (seluruh populasi)
+            fitness: Fitness saat ini per genome (tie-break halving)
+            alive: Mask motor yang masih hidup
+
+        Returns:
+            Index genome (terurut) yang di-cull, hanya dari motor hidup
+        """
+        candidates = np.flatnonzero(alive)
+        keep = max(self.min_alive, 0)
+        if candidates.size <= keep:
+            return candidates[:0]
+
+        if self.mode == "halving":
+            keep = max(keep, int(np.ceil(candidates.size * self.keep_fraction)))
+            # Urut terbaik dulu: progress, fitness, lalu index (stabil, deterministik)
+            order = np.lexsort((candidates, -fitness[candidates], -progress[candidates]))
+            return np.sort(candidates[order[keep:]])
+
+        if self.mode == "percentile":
+            cutoff = np.percentile(progress, self.percentile)
+            behind = candidates[progress[candidates] < cutoff]
+            # Sisakan min_alive: yang paling tertinggal di-cull duluan, kalau
+            # seri index terbesar duluan (clone dengan index terkecil bertahan)
+            room = candidates.size - keep
+            if behind.size > room:
+                order = np.lexsort((-behind, fitness[behind], progress[behind]))
+                behind = np.sort(behind[order[:room]])
+            return behind
+
+        return candidates[:0]
@@ -0,0 +1,739 @@
+"""
+Evaluator untuk NEAT Training
+=============================
+
+Simulasi populasi dipecah jadi shard. Setiap ShardSimulator menjalankan
+sebagian genome tick demi tick dengan aturan yang sama seperti loop
+eval_genomes() lama (fitness, kill, win).
+
+Trainer menjalankan semua shard secara lockstep per potongan tick dan
+menentukan kapan generasi selesai dari laporan per tick. Karena itu hasil
+mode serial (satu shard lokal) dan mode paralel (satu shard per proses
+worker) sama persis.
+"""
+
+import multiprocessing as mp
+from dataclasses import dataclass
+from typing import List, Optional
+
+import numpy as np
+
+from core.game_manager import GameManager, GameConfig
+from core.batch_radar import BatchRadar
+from core.vector_pool import VectorMotorPool
+from core.motor_contact import MotorContacts
+from core.profiler import FrameProfiler
+from core.event_log import (EventLog, LEVEL_OFF, EVENT_CHECKPOINT, EVENT_LAP,
+                            EVENT_DEATH, EVENT_STUCK)
+from ai.compiled_net import NetworkBatch
+from ai.output_cache import OutputCache
+from ai.culling import checkpoint_progress
+
+
+# Motor mati kalau tidak menyentuh checkpoint selama ini (frame)
+MAX_TIME_BETWEEN_CHECKPOINTS = 20 * 60
+
+# Dengan progress field: motor mati kalau progress terjauhnya sepanjang track
+# tidak bertambah selama ini (frame), misal muter di tempat atau jalan mundur
+MAX_TIME_WITHOUT_PROGRESS = 5 * 60
+
+
+@dataclass
+class ShardReport:
+    """Ringkasan per tick dari satu shard untuk satu potongan simulasi."""
+    alive: np.ndarray            # Jumlah motor hidup di awal tick
+    max_lap: np.ndarray          # Lap tertinggi di shard setelah tick
+    winner: np.ndarray           # Index global winner pertama, -1 jika tidak ada
+    winner_distance: float = 0.0
+
+    # Statistik output cache sejak awal generasi (0 jika cache mati)
+    memo_hits: int = 0
+    memo_misses: int = 0
+    forwards: int = 0            # Forward pass yang benar-benar dijalankan
+    forwards_skipped: int = 0    # Tick tanpa forward (semua input kena cache)
+
+    # Event (EventLog record) dari potongan ini, urut per tick lalu per motor
+    events: Optional[List[tuple]] = None
+
+    # Detik per section profiler di potongan ini (None jika profiler mati)
+    profile: Optional[dict] = None
+
+
+class ShardSimulator:
+    """
+    Simulasi satu potongan populasi.
+
+    Backend bisa per Motor (default) atau VectorMotorPool (vectorized).
+
+    Usage:
+        shard = ShardSimulator(game, vectorized=True)
+        shard.start(nets, offset=0, target_laps=15)
+        report = shard.run(60)
+        fitness = shard.finish(end_tick, winner_index)
+    """
+
+    def __init__(self, game: GameManager, vectorized: bool = False, memo_size: int = 0,
+                 log_level: int = LEVEL_OFF, profile: bool = False):
+        """
+        Args:
+            game: GameManager yang track dan masking-nya sudah di-load
+            vectorized: Pakai VectorMotorPool (butuh zone grid)
+            memo_size: Kapasitas OutputCache per network, 0 = tanpa cache
+            log_level: Level EventLog, event dikirim lewat ShardReport.events
+            profile: Catat waktu per subsistem (ShardReport.profile)
+        """
+        self.game = game
+        self.batch_radar: Optional[BatchRadar] = None
+        self.pool: Optional[VectorMotorPool] = None
+
+        # Radar seluruh shard dihitung sekali per frame
+        if game.zone_grid is not None:
+            self.batch_radar = BatchRadar.from_zone_grid(
+                game.zone_grid, distance_field=game.distance_field)
+
+        if vectorized:
+            if game.zone_grid is None:
+                print("[WARN] Vectorized butuh masking, pakai simulasi per Motor")
+            else:
+                self.pool = VectorMotorPool(0, game.zone_grid,
+                                            distance_field=game.distance_field,
+                                            swept=game.config.swept_collision,
+                                            progress_field=game.progress_field)
+
+        # Contact antar motor / radar lawan, hanya di dalam shard ini
+        self.contacts: Optional[MotorContacts] = None
+        if game.config.motor_contact or game.config.opponent_radar:
+            self.contacts = MotorContacts(contact=game.config.motor_contact)
+            if self.pool is not None:
+                self.pool.contacts = self.contacts
+
+        self.nets: List = []
+        self.batch: Optional[NetworkBatch] = None
+        self.cars: List = []
+
+        # Motor dipakai ulang antar generasi (reset in-place, bukan Motor baru)
+        self.car_pool: List = []
+
+        # Output cache per network (input radar terkuantisasi -> output)
+        self.memo_size = max(0, memo_size)
+
+        # Event cuma di-buffer, trainer yang menulis ke file
+        self.events = EventLog(log_level)
+        self._log_motors = self.events.enabled(EVENT_LAP)
+        self._log_checkpoints = self.events.enabled(EVENT_CHECKPOINT)
+
+        # Profiler per subsistem, None = tanpa wrapper sama sekali
+        self.profiler: Optional[FrameProfiler] = None
+        if profile:
+            self.profiler = FrameProfiler()
+            if self.batch_radar is not None:
+                self.profiler.wrap(self.batch_radar, "update_motors", "radar")
+            if self.pool is not None:
+                self._instrument_pool()
+        self.caches: List[OutputCache] = []
+        self._outputs: List = []
+        self.forwards = 0
+        self.forwards_skipped = 0
+        self.offset = 0
+        self.target_laps = 15
+        self.tick = 0
+        self.finished = False
+        self.fitness = np.zeros(0, dtype=np.float64)
+
+        # Riwayat fitness potongan terakhir (untuk menentukan akhir generasi),
+        # atau seluruh generasi kalau keep_history (untuk FitnessRecord)
+        self.keep_history = False
+        self._chunk_start = 0
+        self._base_fitness = self.fitness
+        self._history: List[np.ndarray] = []
+
+    @property
+    def vectorized(self) -> bool:
+        return self.pool is not None
+
+    def create_car(self):
+        """Create a Motor for training"""
+        spawn_x, spawn_y = self.game.get_spawn_position()
+        car = self.game.create_motor(spawn_x, spawn_y, color="pink", invincible=False)
+        car.velocity = car.max_speed
+        car.external_radar = self.batch_radar is not None
+        if self.profiler is not None:
+            self.profiler.instrument_motor(car)
+        return car
+
+    def acquire_cars(self, count: int) -> List:
+        """
+        Ambil `count` motor siap start dari pool.
+
+        Motor lama di-reset di tempat; Motor baru hanya dibuat kalau
+        pool kurang (biasanya cuma di generasi pertama).
+        """
+        spawn_x, spawn_y = self.game.get_spawn_position()
+        for car in self.car_pool[:count]:
+            car.reset_state(spawn_x, spawn_y, self.game.config.spawn_angle)
+            car.velocity = car.max_speed
+
+        while len(self.car_pool) < count:
+            self.car_pool.append(self.create_car())
+        return self.car_pool[:count]
+
+    def start(self, nets: List, offset: int = 0, target_laps: int = 15,
+              generation: int = 0, keep_history: bool = False) -> None:
+        """
+        Mulai generasi baru untuk shard ini.
+
+        Args:
+            nets: CompiledNetwork per genome, urutan sama dengan genome
+            offset: Index global genome pertama di shard ini
+            target_laps: Lap untuk menang
+            generation: Nomor generasi (untuk event)
+            keep_history: Simpan fitness per tick seluruh generasi (outcomes())
+        """
+        self.nets = nets
+        self.batch = NetworkBatch(nets)
+        if self.profiler is not None:
+            self.profiler.wrap(self.batch, "forward", "network")
+        self.offset = offset
+        self.target_laps = target_laps
+        self.tick = 0
+        self.finished = False
+
+        count = len(nets)
+        self.fitness = np.zeros(count, dtype=np.float64)
+
+        # Riwayat per motor untuk FitnessRecord (tick mati, tick tiap lap)
+        self.death_tick = np.zeros(count, dtype=np.int64)
+        self.lap_ticks: List[List[int]] = [[] for _ in range(count)]
+        self._laps = np.zeros(count, dtype=np.int64)
+        self.keep_history = keep_history
+        self._chunk_start = 0
+        self._base_fitness = self.fitness.copy()
+        self._history = []
+
+        if self.memo_size:
+            self.caches = [OutputCache(self.memo_size) for _ in range(count)]
+            # Baris motor mati tidak dipakai, cukup diisi nol
+            self._outputs = [[0.0] * self.batch.num_outputs] * count
+        self.forwards = 0
+        self.forwards_skipped = 0
+        if self.contacts is not None:
+            self.contacts.reset()
+        self.events.generation = generation
+        self.events.drain()
+
+        if self.pool is not None:
+            spawn_x, spawn_y = self.game.get_spawn_position()
+            self.pool.reset(count, spawn_x, spawn_y, self.game.config.spawn_angle,
+                            velocity=self.pool.config.max_speed)
+            self.cars = []
+        else:
+            self.cars = self.acquire_cars(count)
+            for i, car in enumerate(self.cars):
+                car.checkpoint.events = self.events if self._log_motors else None
+                car.checkpoint.event_id = offset + i
+            self._inputs = np.zeros((count, self.batch.num_inputs), dtype=np.float64)
+
+    def run(self, ticks: int) -> ShardReport:
+        """
+        Simulasi `ticks` frame berikutnya.
+
+        Shard berhenti sendiri setelah ada winner; tick sisanya dilaporkan
+        sebagai tidak ada motor hidup.
+        """
+        if not self.keep_history:
+            self._chunk_start = self.tick
+            self._base_fitness = self.fitness.copy()
+            self._history = []
+
+        alive = np.zeros(ticks, dtype=np.int64)
+        max_lap = np.zeros(ticks, dtype=np.int64)
+        winner = np.full(ticks, -1, dtype=np.int64)
+        winner_distance = 0.0
+
+        for k in range(ticks):
+            if self.finished:
+                max_lap[k] = max_lap[k - 1] if k else self._max_lap()
+                continue
+
+            self.tick += 1
+            if self.pool is not None:
+                alive[k], local_winner = self._step_pool()
+            else:
+                alive[k], local_winner = self._step_motors()
+            self._history.append(self.fitness.copy())
+            max_lap[k] = self._max_lap()
+
+            if local_winner >= 0:
+                winner[k] = self.offset + local_winner
+                winner_distance = self._distance(local_winner)
+                self.finished = True
+
+        hits = sum(cache.hits for cache in self.caches)
+        misses = sum(cache.misses for cache in self.caches)
+        return ShardReport(alive, max_lap, winner, winner_distance,
+                           hits, misses, self.forwards, self.forwards_skipped,
+                           self.events.drain(),
+                           self.profiler.drain() if self.profiler is not None else None)
+
+    def fitness_at(self, tick: int) -> np.ndarray:
+        """Fitness semua motor di shard setelah `tick` (di riwayat yang disimpan)."""
+        if tick <= self._chunk_start or not self._history:
+            return self._base_fitness
+        return self._history[min(tick - self._chunk_start, len(self._history)) - 1]
+
+    def finish(self, end_tick: int, winner_index: int = -1) -> List[float]:
+        """
+        Fitness akhir shard untuk generasi yang selesai di `end_tick`.
+
+        Motor dengan index global setelah winner belum diproses di tick
+        terakhir (loop berhenti di winner), jadi pakai fitness tick sebelumnya.
+        """
+        fitness = self.fitness_at(end_tick).copy()
+        if winner_index >= 0:
+            cut = max(0, winner_index - self.offset + 1)
+            fitness[cut:] = self.fitness_at(end_tick - 1)[cut:]
+        return fitness.tolist()
+
+    def progress(self):
+        """
+        State untuk keputusan culling setelah tick terakhir.
+
+        Returns:
+            (progress checkpoint, fitness, mask hidup) per motor di shard
+        """
+        if self.pool is not None:
+            n = self.pool.size
+            progress = checkpoint_progress(self.pool.lap_count[:n], self.pool.checkpoint_count[:n])
+            alive = self.pool.alive[:n].copy()
+        else:
+            progress = np.array([checkpoint_progress(car.lap_count, car.checkpoint_count)
+                                 for car in self.cars], dtype=np.int64)
+            alive = np.array([car.alive for car in self.cars], dtype=bool)
+        return progress.astype(np.int64), self.fitness.copy(), alive
+
+    def cull(self, indices: List[int]) -> None:
+        """
+        Matikan motor dengan index global `indices` (yang bukan milik shard
+        ini diabaikan). Fitness-nya tetap nilai tick terakhir.
+        """
+        for index in indices:
+            i = index - self.offset
+            if not 0 <= i < len(self.nets):
+                continue
+            if self.pool is not None:
+                self.pool.alive[i] = False
+            else:
+                self.cars[i].alive = False
+            self.death_tick[i] = self.tick
+
+    def outcomes(self) -> List[tuple]:
+        """
+        (hidup, tick mati, tick lap, riwayat fitness) per motor di shard,
+        untuk fitness cache. Riwayat = fitness setelah tick 1 sampai tick
+        mati (atau tick sekarang), None tanpa keep_history.
+        """
+        _, _, alive = self.progress()
+        history = None
+        if self.keep_history:
+            history = np.array(self._history, dtype=np.float64).reshape(len(self._history), len(self.nets))
+        outcomes = []
+        for i in range(len(self.nets)):
+            end = self.tick if alive[i] else int(self.death_tick[i])
+            outcomes.append((bool(alive[i]), int(self.death_tick[i]), tuple(self.lap_ticks[i]),
+                             history[:end, i].copy() if history is not None else None))
+        return outcomes
+
+    def coverage(self) -> np.ndarray:
+        """Heatmap coverage VisitGrid (cells_y, cells_x) semua motor di shard."""
+        if self.pool is not None:
+            return self.pool.coverage()
+        return self.game.visit_grid.coverage([car.fitness_calc.visited for car in self.cars])
+
+    def _instrument_pool(self) -> None:
+        """Wrapper profiler untuk backend VectorMotorPool."""
+        pool = self.pool
+        profiler = self.profiler
+        profiler.wrap(pool, "_update_movers", "motor")
+        profiler.wrap(pool, "_apply_acceleration", "physics")
+        profiler.wrap(pool, "_apply_steering", "physics")
+        profiler.wrap(pool.zone_grid, "zones_at", "collision")
+        profiler.wrap(pool.zone_grid, "segments_hit_wall", "collision")
+        profiler.wrap(pool.radar, "compute", "radar")
+
+    # =========================================================================
+    # Backend
+    # =========================================================================
+
+    def _forward(self, inputs: np.ndarray, rows: List[int], keys: List) -> List:
+        """
+        Output network untuk baris `rows`, lewat output cache.
+
+        Forward pass batch hanya dijalankan kalau ada baris yang miss.
+        Hasil forward per baris deterministik, jadi output dari cache sama
+        persis dengan forward ulang.
+
+        Returns:
+            List output per network (hanya baris `rows` yang valid)
+        """
+        if not self.caches:
+            self.forwards += 1
+            return self.batch.forward(inputs).tolist()
+
+        caches = self.caches
+        outputs = self._outputs
+        missing = []
+        for row, key in zip(rows, keys):
+            value = caches[row].get(key)
+            if value is None:
+                missing.append((row, key))
+            else:
+                outputs[row] = value
+
+        if not missing:
+            self.forwards_skipped += 1
+            return outputs
+
+        self.forwards += 1
+        fresh = self.batch.forward(inputs)
+        for row, key in missing:
+            value = fresh[row].tolist()
+            caches[row].put(key, value)
+            outputs[row] = value
+        return outputs
+
+    def _step_motors(self):
+        """Satu frame untuk backend per Motor. Returns (alive_count, winner)."""
+        alive_count = 0
+        updated_cars = []
+        winner = -1
+
+        # Neural network decision, semua motor dalam satu forward pass
+        inputs = self._inputs
+        rows = []
+        keys = []
+        opponents = self.game.config.opponent_radar
+        track_progress = self.game.progress_field is not None
+        for i, car in enumerate(self.cars):
+            if car.alive:
+                data = car.get_radar_data()
+                if opponents:
+                    data = data + [self.contacts.opponent_reading(i)]
+                inputs[i] = data
+                rows.append(i)
+                keys.append(tuple(data))
+        outputs = self._forward(inputs, rows, keys)
+
+        for i, (car, output) in enumerate(zip(self.cars, outputs)):
+            if not car.alive:
+                continue
+
+            alive_count += 1
+
+            # Continuous control
+            steering = max(-1, min(1, output[0]))
+            throttle = max(0.3, min(1, output[1]))
+
+            car.set_ai_input(steering, throttle)
+            car.update()
+            if car.lap_count > self._laps[i]:
+                self._laps[i] = car.lap_count
+                self.lap_ticks[i].append(self.tick)
+            if car.alive and not car.respawning:
+                updated_cars.append(car)
+
+            # Calculate fitness (progress sepanjang track kalau ada field)
+            fitness = car.progress_gain if track_progress else car.distance_traveled
+            fitness += car.checkpoint_count * 200
+            if car.lap_count > 0:
+                fitness += car.lap_count * 2000
+            self.fitness[i] = fitness
+
+            if self._log_motors and not car.alive:
+                self.events.emit(EVENT_DEATH, car.time_spent, self.offset + i, fitness)
+
+            # Kill jika stuck
+            idle = car.time_spent - car.last_checkpoint_time
+            starved = idle > MAX_TIME_BETWEEN_CHECKPOINTS
+            if track_progress and car.progress_idle > MAX_TIME_WITHOUT_PROGRESS:
+                idle = car.progress_idle
+                starved = True
+            if starved:
+                if self._log_motors and car.alive:
+                    self.events.emit(EVENT_STUCK, car.time_spent, self.offset + i, idle)
+                car.alive = False
+            if not car.alive:
+                self.death_tick[i] = self.tick
+
+            # Check win (sisa motor tidak diproses lagi)
+            if car.lap_count >= self.target_laps:
+                return alive_count, i
+
+        if self.contacts is not None:
+            self.contacts.step(self.cars)
+
+        # Radar semua motor yang masih jalan, satu pass NumPy
+        if self.batch_radar is not None:
+            self.batch_radar.update_motors(updated_cars)
+
+        return alive_count, winner
+
+    def _step_pool(self):
+        """Satu frame untuk backend VectorMotorPool. Returns (alive_count, winner)."""
+        pool = self.pool
+        idx = np.flatnonzero(pool.alive[:pool.size])
+        if idx.size == 0:
+            return 0, -1
+
+        # Neural network decision, semua motor dalam satu forward pass
+        inputs = pool.radar_data()
+        if self.game.config.opponent_radar:
+            inputs = np.column_stack((inputs, self.contacts.opponent_readings(pool.size)))
+        if self.caches:
+            rows = idx.tolist()
+            keys = [tuple(row) for row in inputs[idx].tolist()]
+            outputs = np.array(self._forward(inputs, rows, keys), dtype=np.float64)
+        else:
+            self.forwards += 1
+            outputs = self.batch.forward(inputs)
+        steering = np.clip(outputs[:, 0], -1, 1)
+        throttle = np.clip(outputs[:, 1], 0.3, 1)
+
+        if self._log_motors:
+            before = (pool.lap_count[idx].copy(), pool.checkpoint_count[idx].copy(),
+                      pool.expected_checkpoint[idx].copy(), pool.lap_start_time[idx].copy())
+
+        pool.step(steering, throttle)
+
+        # Calculate fitness (progress sepanjang track kalau ada field)
+        laps = pool.lap_count[idx]
+        if pool.progress_field is not None:
+            progress = pool.progress_gain()[idx]
+        else:
+            progress = pool.distance_traveled[idx]
+        self.fitness[idx] = progress + pool.checkpoint_count[idx] * 200 + laps * 2000
+
+        # Kill jika stuck
+        idle = pool.time_spent[idx] - pool.last_checkpoint_time[idx]
+        starved = idle > MAX_TIME_BETWEEN_CHECKPOINTS
+        if pool.progress_field is not None:
+            no_progress = pool.progress_idle[idx] > MAX_TIME_WITHOUT_PROGRESS
+            idle = np.where(no_progress, pool.progress_idle[idx], idle)
+            starved |= no_progress
+        stuck = starved & pool.alive[idx]
+        died = ~pool.alive[idx]
+        pool.alive[idx[starved]] = False
+
+        for i in idx[laps > self._laps[idx]].tolist():
+            self.lap_ticks[i].append(self.tick)
+        self._laps[idx] = laps
+        self.death_tick[idx[~pool.alive[idx]]] = self.tick
+
+        winners = np.flatnonzero(laps >= self.target_laps)
+        winner = int(idx[winners[0]]) if winners.size else -1
+
+        if self._log_motors:
+            self._emit_pool_events(idx, before, died, stuck, idle, winner)
+        return idx.size, winner
+
+    def _emit_pool_events(self, idx, before, died, stuck, idle, winner) -> None:
+        """
+        Event backend pool dari selisih state sebelum/sesudah step.
+
+        Urutan dan isi sama dengan backend per Motor: per motor checkpoint
+        atau lap, lalu death, lalu stuck; motor setelah winner tidak
+        diproses (loop per Motor berhenti di winner).
+        """
+        pool = self.pool
+        events = self.events
+        prev_laps, prev_cps, prev_expected, prev_lap_start = before
+        lap = pool.lap_count[idx] != prev_laps
+        checkpoint = (pool.checkpoint_count[idx] != prev_cps) & ~lap
+        if not self._log_checkpoints:
+            checkpoint[:] = False
+
+        changed = np.flatnonzero(lap | checkpoint | died | stuck)
+        if winner >= 0:
+            changed = changed[idx[changed] <= winner]
+
+        time_spent = pool.time_spent[idx]
+        for j in changed.tolist():
+            motor = self.offset + int(idx[j])
+            tick = int(time_spent[j])
+            if lap[j]:
+                start = int(pool.lap_start_time[idx[j]])
+                events.emit(EVENT_LAP, start, motor, int(pool.lap_count[idx[j]]),
+                            start - int(prev_lap_start[j]))
+            elif checkpoint[j]:
+                events.emit(EVENT_CHECKPOINT, int(pool.last_checkpoint_time[idx[j]]), motor,
+                            int(prev_expected[j]), int(pool.expected_checkpoint[idx[j]]))
+            if died[j]:
+                events.emit(EVENT_DEATH, tick, motor, float(self.fitness[idx[j]]))
+            if stuck[j]:
+                events.emit(EVENT_STUCK, tick, motor, int(idle[j]))
+
+    def _max_lap(self) -> int:
+        if self.pool is not None:
+            return int(self.pool.lap_count[:self.pool.size].max(initial=0))
+        return max((car.lap_count for car in self.cars), default=0)
+
+    def _distance(self, index: int) -> float:
+        if self.pool is not None:
+            return float(self.pool.distance_traveled[index])
+        return self.cars[index].distance_traveled
+
+    def best_alive(self) -> int:
+        """Index lokal motor hidup dengan fitness tertinggi, -1 jika tidak ada."""
+        if self.pool is not None:
+            alive = self.pool.alive[:self.pool.size]
+        else:
+            alive = np.array([car.alive for car in self.cars], dtype=bool)
+        if not alive.any():
+            return -1
+        return int(np.argmax(np.where(alive, self.fitness, -np.inf)))
+
+    def position(self, index: int):
+        if self.pool is not None:
+            return self.pool.x[index], self.pool.y[index]
+        return self.cars[index].x, self.cars[index].y
+
+
+# =============================================================================
+# Parallel
+# =============================================================================
+
+def _worker_main(conn, base_dir: str, game_cfg: GameConfig, vectorized: bool,
+                 memo_size: int = 0, log_level: int = LEVEL_OFF,
+                 profile: bool = False) -> None:
+    """
+    Loop proses worker: load map sekali, lalu layani perintah shard.
+
+    Worker murni simulasi: tidak ada display, sprite, atau import pygame
+    (map di-mmap dari MapCache yang sudah diisi proses utama).
+    """
+    game = GameManager(base_dir, game_cfg)
+    game.load_track(render=False)
+    game.load_masking()
+    shard = ShardSimulator(game, vectorized=vectorized, memo_size=memo_size,
+                           log_level=log_level, profile=profile)
+    conn.send("ready")
+
+    while True:
+        try:
+            command, *args = conn.recv()
+        except EOFError:
+            break  # Proses utama sudah berhenti
+        if command == "start":
+            shard.start(*args)
+            conn.send(None)
+        elif command == "run":
+            conn.send(shard.run(*args))
+        elif command == "finish":
+            conn.send(shard.finish(*args))
+        elif command == "progress":
+            conn.send(shard.progress())
+        elif command == "outcomes":
+            conn.send(shard.outcomes())
+        elif command == "coverage":
+            conn.send(shard.coverage())
+        elif command == "cull":
+            shard.cull(*args)
+            conn.send(None)
+        else:
+            break
+
+    conn.close()
+
+
+class ParallelEvaluator:
+    """
+    Sekumpulan proses worker, masing-masing memegang satu ShardSimulator.
+
+    Interface-nya sama dengan list ShardSimulator dari sisi trainer:
+    start() membagi network per worker, run()/finish() dikirim ke semua.
+    """
+
+    def __init__(self, workers: int, base_dir: str, game_cfg: GameConfig,
+                 vectorized: bool = False, memo_size: int = 0,
+                 log_level: int = LEVEL_OFF, profile: bool = False):
+        ctx = mp.get_context("spawn")
+        self.workers = workers
+        self.connections = []
+        self.processes = []
+
+        for _ in range(workers):
+            parent_conn, child_conn = ctx.Pipe()
+            process = ctx.Process(target=_worker_main,
+                                  args=(child_conn, base_dir, game_cfg, vectorized, memo_size,
+                                        log_level, profile),
+                                  daemon=True)
+            process.start()
+            child_conn.close()
+            self.connections.append(parent_conn)
+            self.processes.append(process)
+
+        for conn in self.connections:
+            conn.recv()  # Tunggu semua worker selesai load map
+
+        self.offsets: List[int] = []
+
+    def start(self, nets: List, target_laps: int, generation: int = 0,
+              keep_history: bool = False) -> None:
+        """Bagi network jadi potongan berurutan, satu per worker."""
+        bounds = np.linspace(0, len(nets), self.workers + 1).astype(int)
+        self.offsets = bounds[:-1].tolist()
+        for conn, lo, hi in zip(self.connections, bounds[:-1], bounds[1:]):
+            conn.send(("start", nets[lo:hi], int(lo), target_laps, generation, keep_history))
+        for conn in self.connections:
+            conn.recv()
+
+    def run(self, ticks: int) -> List[ShardReport]:
+        for conn in self.connections:
+            conn.send(("run", ticks))
+        return [conn.recv() for conn in self.connections]
+
+    def progress(self):
+        """progress() semua worker digabung sesuai urutan genome."""
+        for conn in self.connections:
+            conn.send(("progress",))
+        parts = [conn.recv() for conn in self.connections]
+        return tuple(np.concatenate(arrays) for arrays in zip(*parts))
+
+    def cull(self, indices: List[int]) -> None:
+        for conn in self.connections:
+            conn.send(("cull", indices))
+        for conn in self.connections:
+            conn.recv()
+
+    def outcomes(self) -> List[tuple]:
+        for conn in self.connections:
+            conn.send(("outcomes",))
+        outcomes: List[tuple] = []
+        for conn in self.connections:
+            outcomes.extend(conn.recv())
+        return outcomes
+
+    def coverage(self) -> np.ndarray:
+        """coverage() semua worker dijumlahkan (layout VisitGrid sama)."""
+        for conn in self.connections:
+            conn.send(("coverage",))
+        return sum(conn.recv() for conn in self.connections)
+
+    def finish(self, end_tick: int, winner_index: int = -1) -> List[float]:
+        for conn in self.connections:
+            conn.send(("finish", end_tick, winner_index))
+        fitness: List[float] = []
+        for conn in self.connections:
+            fitness.extend(conn.recv())
+        return fitness
+
+    def close(self) -> None:
+        for conn in self.connections:
+            try:
+                conn.send(("close",))
+                conn.close()
+            except (BrokenPipeError, OSError):
+                pass
+        for process in self.processes:
+            process.join(timeout=5)
+        self.connections = []
+        self.processes = []
@@ -0,0 +1,243 @@
+"""
+Fitness Cache untuk NEAT Training
+=================================
+
+Simulasi training deterministik (tanpa noise) dan, selama contact antar
+motor dan radar lawan mati, satu genome tidak mempengaruhi motor lain.
+Jadi genome yang strukturnya sama (elite yang dibawa ke generasi berikut,
+clone dalam satu generasi) tidak perlu disimulasikan ulang.
+
+- genome_hash(): hash struktural (node, koneksi, weight, bias, response,
+  activation, aggregation).
+- FitnessRecord: hasil satu genome, cukup untuk "memutar ulang" efeknya
+  ke generasi (tick mati, tick lap, progress di milestone culling).
+- FitnessCache: LRU hash -> FitnessRecord per konteks map/aturan.
+- ReplayedGenomes: genome cache-hit di dalam loop generasi trainer.
+- GenerationPlan: pembagian genome satu generasi (simulasi, clone, replay).
+
+Panjang generasi tetap tergantung populasi (budget di-reset lap baru).
+Generasi yang berhenti lebih awal dijawab dari riwayat fitness per tick
+di record. Generasi yang berjalan melewati akhir rekaman motor yang masih
+hidup langsung dihentikan, lalu diulang dengan genome itu saja yang
+disimulasikan, jadi fitness selalu sama dengan simulasi penuh.
+"""
+
+import hashlib
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+import numpy as np
+
+
+# Kapasitas default (jumlah genome unik)
+DEFAULT_CAPACITY = 4096
+
+
+def genome_hash(genome) -> str:
+    """Hash struktural genome NEAT (hex), sama untuk genome yang identik."""
+    digest = hashlib.blake2b(digest_size=16)
+    for key in sorted(genome.nodes):
+        node = genome.nodes[key]
+        digest.update(repr((key, node.bias, node.response, node.activation,
+                            node.aggregation)).encode())
+    digest.update(b"|")
+    for key in sorted(genome.connections):
+        conn = genome.connections[key]
+        digest.update(repr((key, conn.weight, conn.enabled)).encode())
+    return digest.hexdigest()
+
+
+@dataclass
+class FitnessRecord:
+    """Hasil simulasi satu genome dalam satu generasi."""
+    fitness: float                   # Fitness di tick terakhir rekaman
+    progress: int                    # Progress checkpoint di tick terakhir
+    ticks: int                       # Tick mati, atau tick akhir generasi jika hidup
+    alive: bool                      # Masih hidup di akhir generasi
+    lap_ticks: Tuple[int, ...] = ()  # Tick saat lap ke-1, ke-2, ... selesai
+    # Milestone culling -> (progress, fitness) saat motor masih hidup
+    snapshots: Dict[int, Tuple[int, float]] = field(default_factory=dict)
+    # Fitness setelah tick ke-1 .. ke-`ticks` (float64)
+    history: Optional[np.ndarray] = None
+
+    def fitness_at(self, tick: int) -> float:
+        """Fitness setelah tick ke-`tick` (setelah rekaman berakhir = fitness akhir)."""
+        if tick >= self.ticks or self.history is None:
+            return self.fitness
+        if tick <= 0:
+            return 0.0
+        return float(self.history[tick - 1])
+
+
+class FitnessCache:
+    """
+    LRU hash genome -> FitnessRecord.
+
+    Konteks (map, aturan simulasi) diganti lewat set_context(); record
+    dari konteks lain otomatis tidak dipakai.
+
+    Usage:
+        cache = FitnessCache(4096)
+        cache.set_context("map-2|swept=True")
+        record = cache.get(genome_hash(genome))
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        self.capacity = max(1, capacity)
+        self.context = ""
+        self._entries: "OrderedDict[Tuple[str, str], FitnessRecord]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def set_context(self, context: str) -> None:
+        self.context = context
+
+    def get(self, key: str) -> Optional[FitnessRecord]:
+        record = self._entries.get((self.context, key))
+        if record is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end((self.context, key))
+        self.hits += 1
+        return record
+
+    def put(self, key: str, record: FitnessRecord) -> None:
+        self._entries[(self.context, key)] = record
+        self._entries.move_to_end((self.context, key))
+        while len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def discard(self, key: str) -> None:
+        self._entries.pop((self.context, key), None)
+
+
+class ReplayedGenomes:
+    """
+    Genome cache-hit yang diputar ulang per tick dari FitnessRecord.
+
+    Tick dihitung sama seperti ShardReport: alive() untuk awal tick ke-n
+    (1-based), max_lap() setelah tick ke-n.
+
+    Record motor yang hidup di akhir rekaman hanya berlaku sampai tick
+    `horizon`. Record yang tidak bisa menjawab tick yang diminta masuk ke
+    `stale` (posisi), genome-nya harus disimulasikan.
+    """
+
+    def __init__(self, indices: List[int], records: List[FitnessRecord]):
+        """
+        Args:
+            indices: Index genome (global) per record
+            records: FitnessRecord per genome
+        """
+        self.indices = indices
+        self.records = records
+        self.frozen: Dict[int, float] = {}  # Posisi -> fitness saat di-cull
+        self.stale: List[int] = []
+
+        # Tick terakhir genome hidup (inf = hidup sampai akhir rekaman)
+        self._ends = np.array([np.inf if record.alive else record.ticks for record in records])
+        self._frozen_progress: Dict[int, int] = {}
+        self._build_laps()
+
+    def mark_uncovered(self, tick: int) -> List[int]:
+        """Masukkan record hidup yang rekamannya berakhir sebelum `tick` ke stale."""
+        self.stale = [j for j, record in enumerate(self.records)
+                      if self._ends[j] == np.inf and record.ticks < tick]
+        return self.stale
+
+    def _build_laps(self) -> None:
+        """
+        Lap tertinggi kumulatif per tick (lap setelah cull tidak dihitung),
+        dan horizon: tick terakhir yang dicakup semua record.
+        """
+        self.horizon = min((record.ticks for j, record in enumerate(self.records)
+                            if self._ends[j] == np.inf), default=np.inf)
+        events = sorted((tick, lap + 1) for j, record in enumerate(self.records)
+                        for lap, tick in enumerate(record.lap_ticks) if tick <= self._ends[j])
+        self._lap_ticks = np.array([tick for tick, _ in events], dtype=np.int64)
+        self._lap_max = np.maximum.accumulate(
+            np.array([lap for _, lap in events], dtype=np.int64))
+
+    def __len__(self) -> int:
+        return len(self.records)
+
+    def alive(self, tick: int) -> int:
+        """Jumlah genome hidup di awal tick ke-`tick`."""
+        return int(np.count_nonzero(self._ends >= tick))
+
+    def max_lap(self, tick: int) -> int:
+        """Lap tertinggi setelah tick ke-`tick`."""
+        count = int(np.searchsorted(self._lap_ticks, tick, side="right"))
+        return int(self._lap_max[count - 1]) if count else 0
+
+    def cull_state(self, tick: int):
+        """
+        (progress, fitness, alive) di milestone `tick`, sama dengan
+        ShardSimulator.progress(). Record tanpa snapshot untuk milestone
+        ini (selain tepat di akhir rekaman) masuk ke stale.
+        """
+        count = len(self.records)
+        progress = np.zeros(count, dtype=np.int64)
+        fitness = np.zeros(count, dtype=np.float64)
+        alive = self._ends > tick
+        for j, record in enumerate(self.records):
+            if j in self.frozen:
+                progress[j], fitness[j] = self._frozen_progress[j], self.frozen[j]
+            elif alive[j]:
+                snapshot = record.snapshots.get(tick)
+                if snapshot is None:
+                    if tick != record.ticks:
+                        self.stale.append(j)
+                    snapshot = (record.progress, record.fitness)
+                progress[j], fitness[j] = snapshot
+            else:
+                progress[j], fitness[j] = record.progress, record.fitness
+        return progress, fitness, alive
+
+    def cull(self, positions: List[int], tick: int, progress: np.ndarray,
+             fitness: np.ndarray) -> None:
+        """Bekukan record di `positions` pada milestone `tick`."""
+        for j in positions:
+            self.frozen[j] = float(fitness[j])
+            self._frozen_progress[j] = int(progress[j])
+            self._ends[j] = tick
+        self._build_laps()
+
+    def finish(self, end_tick: int, winner_index: int = -1) -> List[float]:
+        """
+        Fitness akhir per record untuk generasi yang selesai di `end_tick`.
+
+        Genome dengan index setelah winner (`winner_index`, index genome)
+        belum diproses di tick terakhir, jadi pakai fitness tick sebelumnya.
+        """
+        fitness = []
+        for j, record in enumerate(self.records):
+            if j in self.frozen:
+                fitness.append(self.frozen[j])
+            elif 0 <= winner_index < self.indices[j]:
+                fitness.append(record.fitness_at(end_tick - 1))
+            else:
+                fitness.append(record.fitness_at(end_tick))
+        return fitness
+
+
+@dataclass
+class GenerationPlan:
+    """Pembagian genome satu generasi."""
+    simulate: List[int] = field(default_factory=list)        # Index genome yang disimulasikan
+    clone_of: Dict[int, int] = field(default_factory=dict)   # Index clone -> posisi di simulate
+    replay: Optional[ReplayedGenomes] = None                 # Genome cache-hit
+    keys: List[str] = field(default_factory=list)            # genome_hash per genome
+
+    # Diisi saat culling
+    culled: Set[int] = field(default_factory=set)            # Posisi simulate yang di-cull
+    frozen: Dict[int, Tuple[int, float]] = field(default_factory=dict)  # Clone -> (progress, fitness)
+
+    @property
+    def skipped(self) -> int:
+        """Jumlah genome yang tidak disimulasikan."""
+        return len(self.clone_of) + len(self.replay or ())
@@ -0,0 +1,105 @@
+"""
+Output Cache untuk Network AI
+=============================
+
+Input network adalah radar terkuantisasi (Radar.get_data: int 0-10 per
+ray), jadi satu network hanya pernah melihat sedikit kombinasi input dan
+frame berurutan sering mengulang input yang sama. Output untuk input yang
+sama selalu sama, jadi bisa di-cache per network.
+
+- OutputCache: LRU terbatas (input -> output) dengan statistik hit rate.
+- MemoizedNetwork: pembungkus net.activate() pakai OutputCache.
+"""
+
+from collections import OrderedDict
+from typing import Hashable, List, Optional, Sequence
+
+
+# Kapasitas default per network (jumlah kombinasi input)
+DEFAULT_CAPACITY = 4096
+
+
+class OutputCache:
+    """
+    Cache LRU output network, key = input terkuantisasi (hashable).
+
+    Usage:
+        cache = OutputCache(4096)
+        output = cache.get(key)
+        if output is None:
+            output = net.activate(inputs)
+            cache.put(key, output)
+    """
+
+    def __init__(self, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            capacity: Jumlah entry maksimum, yang paling lama tidak dipakai dibuang
+        """
+        self.capacity = max(1, capacity)
+        self._entries: "OrderedDict[Hashable, List[float]]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable) -> Optional[List[float]]:
+        """Output tersimpan untuk key, None jika belum ada (dihitung miss)."""
+        value = self._entries.get(key)
+        if value is None:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def put(self, key: Hashable, value: List[float]) -> None:
+        """Simpan output (jangan diubah setelah disimpan)."""
+        self._entries[key] = value
+        if len(self._entries) > self.capacity:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Kosongkan cache dan statistik (misal untuk network baru)."""
+        self._entries.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def lookups(self) -> int:
+        return self.hits + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Rasio hit (0-1), 0 jika belum ada lookup."""
+        return self.hits / self.lookups if self.lookups else 0.0
+
+
+class MemoizedNetwork:
+    """
+    Network dengan output cache, interface sama dengan activate().
+
+    Usage:
+        net = MemoizedNetwork(CompiledNetwork.create(genome, config))
+        output = net.activate(radar_data)
+        print(net.cache.hit_rate)
+    """
+
+    def __init__(self, net, capacity: int = DEFAULT_CAPACITY):
+        """
+        Args:
+            net: Network apa pun dengan activate(inputs)
+            capacity: Kapasitas OutputCache
+        """
+        self.net = net
+        self.cache = OutputCache(capacity)
+
+    def activate(self, inputs: Sequence[float]) -> List[float]:
+        """Output network, dari cache jika input sama pernah dihitung."""
+        key = tuple(inputs)
+        output = self.cache.get(key)
+        if output is None:
+            output = self.net.activate(inputs)
+            self.cache.put(key, output)
+        return output
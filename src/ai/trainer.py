@@ -1,6 +1,9 @@
 """
 NEAT Trainer untuk Mio Karbu
 ============================
+
+Mode headless tidak meng-import pygame: simulasi cukup pakai core
+(Python/NumPy), pygame hanya dipakai sebagai adapter render di mode visual.
 """
 
 import os
@@ -8,8 +11,9 @@ import sys
 import time
 import pickle
 import neat
-import pygame
-from typing import List, Optional
+import numpy as np
+from dataclasses import dataclass, field
+from typing import List, Optional, Set, TYPE_CHECKING
 
 # Path setup
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -18,10 +22,36 @@ sys.path.insert(0, os.path.join(BASE_DIR, "config"))
 
 # Import modules
 from core.game_manager import GameManager, GameConfig
-from core.display_manager import DisplayManager
 from core.motor import Motor
+from core.radar import RadarConfig
+from core.event_log import EventLog, EVENT_BUDGET_RESET, EVENT_GENERATION, EVENT_CULL
+from core.profiler import FrameProfiler
+from ai.evaluator import ShardSimulator, ParallelEvaluator
+from ai.compiled_net import CompiledNetwork
+from ai.culling import CullPolicy
+from ai.fitness_cache import (FitnessCache, FitnessRecord, GenerationPlan, ReplayedGenomes,
+                              genome_hash)
 import game_config as cfg
 
+if TYPE_CHECKING:
+    from core.display_manager import DisplayManager
+
+
+@dataclass
+class GenerationResult:
+    """Hasil satu percobaan simulasi generasi (lihat NEATTrainer._simulate)."""
+    end_tick: int
+    fitness: List[float]         # Per genome, urutan sama dengan genomes
+    valid: bool                  # False = dihentikan, record cache tidak cukup (lihat stale)
+    alive: int                   # Motor hidup di tick terakhir
+    car_ticks: int               # Motor-tick yang benar-benar disimulasikan
+    winner: int                  # Index genome winner, -1 jika tidak ada
+    winner_distance: float
+    culls: List[tuple]           # (tick, di-cull, bertahan) per milestone
+    reports: List                # ShardReport potongan terakhir
+    events: List[tuple]          # Event generasi ini (index motor = index genome)
+    stale: List[str] = field(default_factory=list)  # genome_hash yang harus disimulasikan
+
 
 class NEATTrainer:
     """
@@ -30,17 +60,49 @@ class NEATTrainer:
     """
     
     def __init__(self, config_path: str, track_name: str = None,
-                 headless: bool = False, render_interval: int = 1):
+                 headless: bool = False, render_interval: int = 1,
+                 use_distance_field: bool = None, vectorized: bool = False,
+                 workers: int = 1, tick_budget: int = None, memo_size: int = 0,
+                 render_fps: int = None, log_level: int = None, log_format: str = None,
+                 profile: bool = False, cull: str = None, fitness_cache: int = None,
+                 use_progress_field: bool = None, coverage: bool = None):
         """
         Args:
             config_path: Path ke neat config file
             track_name: Key map dari MAP_SETTINGS ("map-2" atau "new-4")
             headless: Training tanpa visualisasi (lebih cepat)
             render_interval: Render setiap N frame
+            use_distance_field: Radar sphere tracing, None = ikut game_config
+            vectorized: Simulasi populasi pakai VectorMotorPool (array NumPy)
+            workers: Jumlah proses evaluasi paralel (>1 selalu headless)
+            tick_budget: Tick per generasi (reset tiap lap baru), None = ikut game_config
+            memo_size: Kapasitas output cache per network, 0 = tanpa cache
+            render_fps: FPS render mode visual (simulasi tetap secepatnya),
+                None = ikut game_config
+            log_level: Level EventLog (0-3), None = ikut game_config
+            log_format: "jsonl" atau "binary", None = ikut game_config
+            profile: Catat waktu per subsistem per generasi ke logs/profile-*.csv/json
+            cull: Mode early culling ("off", "halving", "percentile"),
+                None = ikut game_config
+            fitness_cache: Kapasitas fitness cache (genome unik), 0 = mati,
+                None = ikut game_config
+            use_progress_field: Fitness & deteksi stuck pakai progress
+                sepanjang track, None = ikut game_config
+            coverage: Simpan heatmap coverage VisitGrid per generasi ke
+                logs/coverage-*.npy, None = ikut game_config
         """
         self.config_path = config_path
-        self.headless = headless
+        self.workers = max(1, workers)
+        self.headless = headless or self.workers > 1
         self.render_interval = max(1, render_interval)
+        self.render_fps = max(1, render_fps or cfg.TRAINING_RENDER_FPS)
+        self.vectorized = vectorized
+        self.tick_budget = max(1, tick_budget or cfg.GENERATION_TICK_BUDGET)
+        self.memo_size = max(0, memo_size)
+        self.log_level = cfg.EVENT_LOG_LEVEL if log_level is None else log_level
+        self.cull = CullPolicy(mode=cull or cfg.CULL_MODE, milestones=cfg.CULL_MILESTONES,
+                               keep_fraction=cfg.CULL_KEEP_FRACTION,
+                               percentile=cfg.CULL_PERCENTILE, min_alive=cfg.CULL_MIN_ALIVE)
         
         # Pilih map dari MAP_SETTINGS
         self.map_key = track_name or cfg.DEFAULT_MAP_KEY
@@ -62,11 +124,49 @@ class NEATTrainer:
             spawn_angle=self.map_data["spawn_angle"],
             masking_file=self.map_data["masking_file"],
             masking_subfolder=cfg.MASKING_SUBFOLDER,
+            use_distance_field=(cfg.USE_DISTANCE_FIELD if use_distance_field is None
+                                else use_distance_field),
+            use_progress_field=(cfg.USE_PROGRESS_FIELD if use_progress_field is None
+                                else use_progress_field),
+            swept_collision=cfg.SWEPT_COLLISION,
+            motor_contact=cfg.TRAINING_MOTOR_CONTACT,
+            opponent_radar=cfg.OPPONENT_RADAR,
         )
         
+        # Fitness cache genome identik (hanya kalau motor tidak saling
+        # mempengaruhi: tanpa contact dan radar lawan)
+        cache_size = cfg.FITNESS_CACHE_SIZE if fitness_cache is None else fitness_cache
+        self.fitness_cache: Optional[FitnessCache] = None
+        if cache_size > 0 and not (self.game_cfg.motor_contact or self.game_cfg.opponent_radar):
+            self.fitness_cache = FitnessCache(cache_size)
+        
         # Managers
         self.game: Optional[GameManager] = None
-        self.display: Optional[DisplayManager] = None
+        self.display: Optional["DisplayManager"] = None  # None di mode headless
+        
+        # Evaluasi: satu shard lokal (serial) atau proses worker (paralel)
+        self.shard: Optional[ShardSimulator] = None
+        self.parallel: Optional[ParallelEvaluator] = None
+        self.chunk_ticks = 60  # Tick per sinkronisasi shard (headless)
+        
+        # Event log (file dibuat saat event pertama ditulis)
+        log_format = log_format or cfg.EVENT_LOG_FORMAT
+        extension = "bin" if log_format == "binary" else "jsonl"
+        self.log_path = os.path.join(
+            BASE_DIR, "logs", f"train-{self.map_key}-{time.strftime('%Y%m%d-%H%M%S')}.{extension}")
+        self.events = EventLog(self.log_level, self.log_path, log_format,
+                               threaded=cfg.EVENT_LOG_THREADED, echo=cfg.EVENT_LOG_ECHO)
+        
+        # Profiler per subsistem (None = tanpa instrumentasi)
+        self.profiler: Optional[FrameProfiler] = FrameProfiler() if profile else None
+        self.profile_path = os.path.join(
+            BASE_DIR, "logs", f"profile-{self.map_key}-{time.strftime('%Y%m%d-%H%M%S')}")
+        
+        # Heatmap coverage per generasi (None = tidak dicatat)
+        record_coverage = cfg.COVERAGE_HEATMAP if coverage is None else coverage
+        self.coverage_maps: Optional[List[np.ndarray]] = [] if record_coverage else None
+        self.coverage_path = os.path.join(
+            BASE_DIR, "logs", f"coverage-{self.map_key}-{time.strftime('%Y%m%d-%H%M%S')}.npy")
         
         # Training state
         self.generation = 0
@@ -77,157 +177,471 @@ class NEATTrainer:
         self.target_laps = 15
     
     def setup(self):
-        """Initialize pygame, display, dan load assets"""
+        """Initialize display (mode visual saja) dan load assets"""
         # Create managers
         self.game = GameManager(BASE_DIR, self.game_cfg)
-        self.display = DisplayManager(fullscreen=False, width=1280, height=960)
-        
-        # Initialize display
-        self.display.init(title="NEAT Training - Mio Karbu", headless=self.headless)
         
         if self.headless:
             print("[HEADLESS MODE] Training tanpa visualisasi - lebih cepat!")
-        elif self.render_interval > 1:
-            print(f"[REDUCED RENDER] Render setiap {self.render_interval} frame")
+        else:
+            from core.display_manager import DisplayManager
+            
+            self.display = DisplayManager(fullscreen=False, width=1280, height=960)
+            self.display.init(title="NEAT Training - Mio Karbu")
+            if self.profiler is not None:
+                self.profiler.wrap(self, "_update_view", "render")
+                self.profiler.wrap(self, "_handle_events", "events")
+            print(f"[RENDER] {self.render_fps} FPS, simulasi tetap jalan secepatnya")
+            
+            if self.render_interval > 1:
+                print(f"[REDUCED RENDER] Render setiap {self.render_interval} frame")
+        
+        # Mode paralel: tiap worker load track & masking sendiri. Masking
+        # di-load sekali di sini dulu supaya MapCache sudah terisi dan
+        # worker cukup mmap.
+        if self.workers > 1:
+            self.game.load_track(render=False)
+            self.game.load_masking()
+            print(f"[PARALLEL] Evaluasi genome di {self.workers} proses worker")
+            self.parallel = ParallelEvaluator(self.workers, BASE_DIR, self.game_cfg,
+                                              vectorized=self.vectorized,
+                                              memo_size=self.memo_size,
+                                              log_level=self.log_level,
+                                              profile=self.profiler is not None)
+            return
         
         # Load assets via GameManager
-        self.game.load_track()
+        track_image = self.game.load_track(render=not self.headless)
+        if self.display is not None:
+            self.display.set_track(track_image, (self.game.map_width, self.game.map_height))
         self.game.load_masking()
-    
-    def create_car(self) -> Motor:
-        """Create a Motor for training"""
-        spawn_x, spawn_y = self.game.get_spawn_position()
-        car = self.game.create_motor(spawn_x, spawn_y, color="pink", invincible=False)
-        car.velocity = car.max_speed
-        return car
+        
+        self.shard = ShardSimulator(self.game, vectorized=self.vectorized,
+                                    memo_size=self.memo_size, log_level=self.log_level,
+                                    profile=self.profiler is not None)
+        if self.shard.vectorized:
+            print("[VECTORIZED] Populasi disimulasikan dengan VectorMotorPool")
     
     def eval_genomes(self, genomes, config):
         """
         Evaluate semua genome dalam satu generasi.
         Callback untuk NEAT.
+        
+        Genome yang hasilnya ada di fitness cache diputar ulang dari
+        record, clone dalam generasi cukup disimulasikan sekali. Kalau
+        generasi berjalan melewati akhir rekaman sebuah record, simulasi
+        langsung dihentikan dan diulang dengan genome itu disimulasikan.
         """
         self.generation += 1
-        
-        # Create cars dan networks
-        cars: List[Motor] = []
-        nets: List[neat.nn.FeedForwardNetwork] = []
-        
+        self.events.generation = self.generation
         for genome_id, genome in genomes:
-            net = neat.nn.FeedForwardNetwork.create(genome, config)
-            nets.append(net)
             genome.fitness = 0
-            
-            car = self.create_car()
-            cars.append(car)
         
-        # Timing
-        max_gen_time = 90  # 60 detik per generasi
         gen_start_time = time.time()
+        plan = self._plan_generation(genomes)
+        result = self._simulate(plan, genomes, config)
+        excluded = set()
+        while not result.valid:
+            excluded.update(result.stale)
+            print(f"[FITCACHE] Rekaman {len(result.stale)} genome berakhir di tick "
+                  f"{result.end_tick}, ulang dengan genome itu disimulasikan")
+            plan = self._plan_generation(genomes, exclude=excluded)
+            result = self._simulate(plan, genomes, config)
+        self.events.extend(result.events)
+        
+        # Kecepatan simulasi
+        end_tick = result.end_tick
+        elapsed = max(time.time() - gen_start_time, 1e-9)
+        print(f"[SIM] {end_tick} tick dalam {elapsed:.2f}s | "
+              f"{end_tick / elapsed:.0f} tick/s | {result.car_ticks / elapsed:.0f} motor-tick/s")
+        if plan.skipped:
+            print(f"[FITCACHE] {plan.skipped}/{len(genomes)} genome tidak disimulasikan "
+                  f"(cache {len(plan.replay or ())}, clone {len(plan.clone_of)}) | "
+                  f"{len(self.fitness_cache or ())} record")
+        if result.culls:
+            self._print_cull_stats(result.culls, end_tick)
+        if self.memo_size:
+            self._print_memo_stats(result.reports)
+        if self.profiler is not None:
+            self._write_profile(end_tick, result.car_ticks, elapsed)
+        if self.coverage_maps is not None:
+            self._write_coverage(len(plan.simulate))
+        
+        fitness = result.fitness
+        for (genome_id, genome), value in zip(genomes, fitness):
+            genome.fitness = value
+        
+        self.events.emit(EVENT_GENERATION, end_tick, -1, result.alive, max(fitness, default=0.0),
+                         float(np.mean(fitness)) if fitness else 0.0, elapsed)
+        self.events.flush()
+        
+        if result.winner >= 0:
+            genome = genomes[result.winner][1]
+            net = neat.nn.FeedForwardNetwork.create(genome, config)
+            self._handle_winner(genome, net, result.winner_distance, config)
+    
+    def _plan_generation(self, genomes, exclude: Set[str] = frozenset()) -> GenerationPlan:
+        """
+        Bagi genome: disimulasikan, clone dari genome lain, atau cache-hit.
+        
+        Args:
+            exclude: genome_hash yang record-nya tidak dipakai (disimulasikan)
+        """
+        plan = GenerationPlan()
+        if self.fitness_cache is None:
+            plan.simulate = list(range(len(genomes)))
+            return plan
+        
+        # Record hanya berlaku untuk map dan aturan simulasi yang sama
+        self.fitness_cache.set_context(
+            f"{self.map_key}|{self.game_cfg.masking_file}|swept={self.game_cfg.swept_collision}"
+            f"|field={self.game_cfg.use_distance_field}|progress={self.game_cfg.use_progress_field}"
+            f"|laps={self.target_laps}|cull={self.cull}")
+        
+        first = {}
+        replay_indices, records = [], []
+        for i, (genome_id, genome) in enumerate(genomes):
+            key = genome_hash(genome)
+            plan.keys.append(key)
+            record = self.fitness_cache.get(key) if key not in exclude else None
+            if record is not None:
+                replay_indices.append(i)
+                records.append(record)
+            elif key in first:
+                plan.clone_of[i] = first[key]
+            else:
+                first[key] = len(plan.simulate)
+                plan.simulate.append(i)
+        if records:
+            plan.replay = ReplayedGenomes(replay_indices, records)
+        return plan
+    
+    def _simulate(self, plan: GenerationPlan, genomes, config) -> GenerationResult:
+        """
+        Jalankan satu generasi untuk genome di plan.simulate.
+        
+        Semua shard di-step bersamaan per potongan tick. Akhir generasi
+        (budget tick habis, semua mati, atau winner) ditentukan dari laporan
+        per tick, jadi hasil serial dan paralel sama. Potongan tick berhenti
+        tepat di milestone culling.
+        """
+        # Create networks (compiled, di-forward sekaligus per shard)
+        nets: List[CompiledNetwork] = [CompiledNetwork.create(genomes[i][1], config)
+                                       for i in plan.simulate]
+        evaluator = self.parallel if self.parallel is not None else self.shard
+        # Riwayat fitness per tick hanya perlu untuk record fitness cache
+        keep_history = self.fitness_cache is not None
+        if self.parallel is not None:
+            self.parallel.start(nets, self.target_laps, self.generation, keep_history)
+        else:
+            self.shard.start(nets, 0, self.target_laps, self.generation, keep_history)
+        
+        # Event di-buffer dulu, baru ditulis kalau generasi ini valid
+        events = EventLog(self.log_level)
+        events.generation = self.generation
+        replay = plan.replay
+        
+        # Budget tick, di-reset setiap ada lap baru
+        budget_start = 0
         best_lap_count = 0
         
-        # Main loop
-        frame_count = 0
-        running = True
+        # Visual mode: sinkron tiap frame supaya bisa render
+        chunk_ticks = self.chunk_ticks if self.headless else 1
         
-        while running:
-            frame_count += 1
-            
-            # Check max time
-            if time.time() - gen_start_time > max_gen_time:
+        tick = 0
+        alive = 0
+        car_ticks = 0
+        last_render = 0.0
+        end_tick = None
+        winner = -1
+        winner_distance = 0.0
+        next_cull = self.cull.next_milestone(0) if self.cull.enabled else -1
+        culls = []
+        snapshots = {}
+        reports = []
+        
+        while end_tick is None:
+            # Check budget (chunk tidak melewati sisa budget)
+            chunk = min(chunk_ticks, budget_start + self.tick_budget - tick)
+            if chunk <= 0:
+                end_tick = tick
                 break
+            if next_cull > 0:
+                chunk = min(chunk, next_cull - tick)
             
-            # Event handling (jika tidak headless)
-            if not self.headless:
-                for event in pygame.event.get():
-                    if event.type == pygame.QUIT:
-                        pygame.quit()
-                        sys.exit(0)
+            reports = evaluator.run(chunk) if self.parallel is not None else [self.shard.run(chunk)]
+            for report in reports:
+                events.extend([record[:3] + (plan.simulate[record[3]],) + record[4:]
+                               if record[3] >= 0 else record for record in report.events])
+                if report.profile is not None:
+                    self.profiler.merge(report.profile)
             
-            # Update cars
-            alive_count = 0
-            
-            for i, (car, net, (genome_id, genome)) in enumerate(zip(cars, nets, genomes)):
-                if not car.alive:
-                    continue
-                
-                alive_count += 1
+            for k in range(chunk):
+                t = tick + k
                 
-                # Neural network decision
-                radar_data = car.get_radar_data()
-                output = net.activate(radar_data)
+                # Record yang masih hidup di akhir rekamannya tidak tahu tick ini
+                if replay is not None and t + 1 > replay.horizon:
+                    replay.mark_uncovered(t + 1)
+                    return self._stale_result(plan, t, car_ticks)
                 
-                # Continuous control
-                steering = max(-1, min(1, output[0]))
-                throttle = max(0.3, min(1, output[1]))
+                # All dead?
+                alive = sum(int(report.alive[k]) for report in reports)
+                car_ticks += alive
+                if replay is not None:
+                    alive += replay.alive(t + 1)
+                if alive == 0:
+                    end_tick = t
+                    break
                 
-                car.set_ai_input(steering, throttle)
-                car.update()
+                # Reset budget jika lap baru
+                lap = max(int(report.max_lap[k]) for report in reports)
+                if replay is not None:
+                    lap = max(lap, replay.max_lap(t + 1))
+                if lap > best_lap_count:
+                    best_lap_count = lap
+                    budget_start = t + 1
+                    events.emit(EVENT_BUDGET_RESET, t + 1, -1, best_lap_count)
                 
-                # Calculate fitness
-                fitness = car.distance_traveled
-                fitness += car.checkpoint_count * 200
-                if car.lap_count > 0:
-                    fitness += car.lap_count * 2000
-                
-                # Kill jika stuck
-                max_time_between_checkpoints = 20 * 60
-                time_since_last_checkpoint = car.time_spent - car.last_checkpoint_time
-                if time_since_last_checkpoint > max_time_between_checkpoints:
-                    car.alive = False
-                
-                genome.fitness = fitness
-                
-                # Reset timer jika lap baru
-                if car.lap_count > best_lap_count:
-                    best_lap_count = car.lap_count
-                    gen_start_time = time.time()
-                    print(f"[TIMER RESET] Lap {best_lap_count} completed!")
-                
-                # Check win
-                if car.lap_count >= self.target_laps:
-                    self._handle_winner(genome, net, car, config)
-                    return
-            
-            # All dead?
-            if alive_count == 0:
-                break
+                # Check win: winner dengan index genome terkecil
+                for report in reports:
+                    if report.winner[k] >= 0 and (winner < 0 or report.winner[k] < winner):
+                        winner = int(report.winner[k])
+                        winner_distance = report.winner_distance
+                if winner >= 0:
+                    end_tick = t + 1
+                    break
             
-            # Camera follow best car
-            best_car = self._get_best_car(cars, genomes)
-            if best_car:
-                self.display.update_camera(
-                    best_car.x, best_car.y,
-                    self.game.map_width, self.game.map_height
-                )
+            tick += chunk
             
-            # Render
-            if not self.headless and frame_count % self.render_interval == 0:
-                self._render(cars, alive_count, len(cars))
+            if end_tick is None and tick == next_cull:
+                culls.append(self._cull_genomes(tick, plan, events, snapshots))
+                next_cull = self.cull.next_milestone(tick)
+                if replay is not None and replay.stale:
+                    return self._stale_result(plan, tick, car_ticks)
             
-            self.display.clock.tick(0)  # Unlimited FPS
+            # Visual: simulasi tidak menunggu layar, render cuma tiap 1/render_fps detik
+            if end_tick is None and not self.headless:
+                now = time.perf_counter()
+                frame_dt = now - last_render
+                if frame_dt >= 1.0 / self.render_fps and tick % self.render_interval == 0:
+                    self._handle_events()
+                    self._update_view(len(nets), frame_dt)
+                    last_render = now
+        
+        # Fitness akhir: hasil simulasi, clone, lalu replay dari cache
+        simulated = evaluator.finish(end_tick, winner)
+        fitness = [0.0] * len(genomes)
+        for position, index in enumerate(plan.simulate):
+            fitness[index] = simulated[position]
+        if plan.clone_of:
+            # Clone setelah winner belum diproses di tick terakhir (sama seperti finish())
+            winner_index = plan.simulate[winner] if winner >= 0 else len(genomes)
+            previous = evaluator.finish(end_tick - 1) if winner >= 0 else simulated
+            for index, position in plan.clone_of.items():
+                frozen = plan.frozen.get(index)
+                if frozen is not None:
+                    fitness[index] = frozen[1]
+                elif index > winner_index:
+                    fitness[index] = previous[position]
+                else:
+                    fitness[index] = simulated[position]
+        if replay is not None:
+            winner_index = plan.simulate[winner] if winner >= 0 else -1
+            for index, value in zip(replay.indices, replay.finish(end_tick, winner_index)):
+                fitness[index] = value
+        
+        if winner < 0 and self.fitness_cache is not None:
+            self._store_records(plan, evaluator, simulated, end_tick, snapshots)
+        
+        return GenerationResult(
+            end_tick=end_tick, fitness=fitness, valid=True, alive=alive, car_ticks=car_ticks,
+            winner=plan.simulate[winner] if winner >= 0 else -1,
+            winner_distance=winner_distance, culls=culls, reports=reports,
+            events=events.drain())
     
-    def _get_best_car(self, cars: List[Motor], genomes) -> Optional[Motor]:
-        """Get car with highest fitness"""
-        best_car = None
-        best_fitness = -1
+    def _stale_result(self, plan: GenerationPlan, tick: int, car_ticks: int) -> GenerationResult:
+        """Hasil generasi yang dihentikan di `tick` karena record di replay.stale."""
+        stale = [plan.keys[plan.replay.indices[j]] for j in plan.replay.stale]
+        return GenerationResult(
+            end_tick=tick, fitness=[], valid=False, alive=0, car_ticks=car_ticks,
+            winner=-1, winner_distance=0.0, culls=[], reports=[], events=[], stale=stale)
+    
+    def _cull_genomes(self, tick: int, plan: GenerationPlan, events: EventLog, snapshots: dict):
+        """
+        Culling di milestone `tick` dari progress seluruh populasi (hasil
+        semua shard, clone, dan replay cache).
         
-        for car, (genome_id, genome) in zip(cars, genomes):
-            if car.alive and genome.fitness > best_fitness:
-                best_fitness = genome.fitness
-                best_car = car
+        Returns:
+            (tick, jumlah di-cull, jumlah yang bertahan)
+        """
+        evaluator = self.parallel if self.parallel is not None else self.shard
+        sim_progress, sim_fitness, sim_alive = evaluator.progress()
+        for position in np.flatnonzero(sim_alive).tolist():
+            snapshots.setdefault(position, {})[tick] = (int(sim_progress[position]),
+                                                       float(sim_fitness[position]))
+        
+        total = len(plan.simulate) + len(plan.clone_of) + len(plan.replay or ())
+        progress = np.zeros(total, dtype=np.int64)
+        fitness = np.zeros(total, dtype=np.float64)
+        alive = np.zeros(total, dtype=bool)
+        progress[plan.simulate] = sim_progress
+        fitness[plan.simulate] = sim_fitness
+        alive[plan.simulate] = sim_alive
+        for index, position in plan.clone_of.items():
+            if index in plan.frozen:
+                progress[index], fitness[index] = plan.frozen[index]
+            else:
+                progress[index] = sim_progress[position]
+                fitness[index] = sim_fitness[position]
+                alive[index] = sim_alive[position]
+        if plan.replay is not None:
+            replay_state = plan.replay.cull_state(tick)
+            for array, values in zip((progress, fitness, alive), replay_state):
+                array[plan.replay.indices] = values
         
-        return best_car
+        culled = self.cull.select(progress, fitness, alive)
+        if culled.size:
+            culled_set = set(culled.tolist())
+            positions = [p for p, index in enumerate(plan.simulate) if index in culled_set]
+            if positions:
+                evaluator.cull(positions)
+                plan.culled.update(positions)
+            for index in plan.clone_of:
+                if index in culled_set:
+                    plan.frozen[index] = (int(progress[index]), float(fitness[index]))
+            if plan.replay is not None:
+                replayed = [j for j, index in enumerate(plan.replay.indices) if index in culled_set]
+                if replayed:
+                    plan.replay.cull(replayed, tick, *replay_state[:2])
+            for i in culled.tolist():
+                events.emit(EVENT_CULL, tick, i, int(progress[i]), float(fitness[i]))
+        return tick, int(culled.size), int(alive.sum()) - int(culled.size)
+    
+    def _store_records(self, plan: GenerationPlan, evaluator, simulated: List[float],
+                       end_tick: int, snapshots: dict):
+        """Simpan hasil genome yang disimulasikan (kecuali yang di-cull) ke fitness cache."""
+        progress, _, _ = evaluator.progress()
+        for position, (alive, death_tick, lap_ticks, history) in enumerate(evaluator.outcomes()):
+            if position in plan.culled:
+                continue  # Mati karena populasi, bukan hasil genome sendiri
+            self.fitness_cache.put(plan.keys[plan.simulate[position]], FitnessRecord(
+                fitness=simulated[position], progress=int(progress[position]),
+                ticks=end_tick if alive else death_tick, alive=alive, lap_ticks=lap_ticks,
+                snapshots=snapshots.get(position, {}), history=history))
+    
+    def _print_cull_stats(self, culls, end_tick: int):
+        """Jumlah cull/bertahan per milestone dan perkiraan motor-tick yang dihemat."""
+        # Batas atas: motor yang di-cull dianggap akan hidup sampai akhir generasi
+        saved = sum(culled * (end_tick - tick) for tick, culled, _ in culls)
+        steps = " | ".join(f"tick {tick}: -{culled}, bertahan {survivors}"
+                           for tick, culled, survivors in culls)
+        print(f"[CULL] {steps} | hemat <= {saved} motor-tick")
+    
+    def _print_memo_stats(self, reports):
+        """Hit rate output cache generasi ini (laporan shard terakhir)."""
+        hits = sum(report.memo_hits for report in reports)
+        lookups = hits + sum(report.memo_misses for report in reports)
+        forwards = sum(report.forwards for report in reports)
+        skipped = sum(report.forwards_skipped for report in reports)
+        hit_rate = hits / lookups * 100 if lookups else 0.0
+        print(f"[MEMO] hit rate {hit_rate:.1f}% ({hits}/{lookups}) | "
+              f"forward dilewati {skipped}/{forwards + skipped} tick")
+    
+    def _write_profile(self, ticks: int, car_ticks: int, elapsed: float):
+        """Ringkasan profiler generasi ini ke CSV + JSON dan satu baris di terminal."""
+        row = self.profiler.end_generation(self.generation, frames=ticks,
+                                           motor_ticks=car_ticks, elapsed_s=round(elapsed, 4))
+        self.profiler.write_csv(self.profile_path + ".csv")
+        self.profiler.write_json(self.profile_path + ".json")
+        
+        sections = sorted(((key[:-3], value) for key, value in row.items()
+                           if key.endswith("_ms") and value > 0), key=lambda item: -item[1])
+        print("[PROFILE] " + " | ".join(f"{name} {value:.0f}ms" for name, value in sections))
+    
+    def _write_coverage(self, simulated: int):
+        """
+        Heatmap coverage generasi ini (jumlah motor per cell VisitGrid) ke
+        logs/coverage-*.npy, array (generasi, cells_y, cells_x). Genome
+        dari fitness cache dan clone tidak ikut (tidak disimulasikan).
+        """
+        evaluator = self.parallel if self.parallel is not None else self.shard
+        heatmap = evaluator.coverage()
+        self.coverage_maps.append(heatmap.astype(np.uint16))
+        os.makedirs(os.path.dirname(self.coverage_path), exist_ok=True)
+        np.save(self.coverage_path, np.stack(self.coverage_maps))
+        
+        print(f"[COVERAGE] {np.count_nonzero(heatmap)}/{heatmap.size} cell dikunjungi | "
+              f"rata-rata {heatmap.sum() / max(simulated, 1):.0f} cell/genome")
+    
+    def _handle_events(self):
+        """Event pygame mode visual (window close = stop training)."""
+        import pygame
+        
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                pygame.quit()
+                sys.exit(0)
+    
+    def _update_view(self, total: int, frame_dt: float):
+        """Camera follow best car dan render (mode serial visual)."""
+        shard = self.shard
+        best = shard.best_alive()
+        if best >= 0:
+            best_x, best_y = shard.position(best)
+            self.display.update_camera(
+                best_x, best_y,
+                self.game.map_width, self.game.map_height,
+                dt=min(frame_dt, 0.1)
+            )
+        
+        if shard.vectorized:
+            alive = int(shard.pool.alive[:shard.pool.size].sum())
+            self._render_pool(alive, total)
+        else:
+            alive = sum(1 for car in shard.cars if car.alive)
+            self._render(shard.cars, alive, total)
     
     def _render(self, cars: List[Motor], alive: int, total: int):
         """Render frame"""
-        self.display.render_track(self.game.track_surface)
+        import pygame
+        
+        self.display.render_track()
         
         # Draw alive cars
         for car in cars:
             if car.alive:
                 self.display.render_motor(car)
         
-        # Draw info
+        best_lap = max((car.lap_count for car in cars if car.alive), default=0)
+        self._render_info(alive, total, best_lap)
+        
+        pygame.display.flip()
+    
+    def _render_pool(self, alive: int, total: int):
+        """Render frame untuk mode vectorized (motor digambar sebagai panah)."""
+        import pygame
+        
+        self.display.render_track()
+        
+        pool = self.shard.pool
+        cam_x = int(self.display.camera_x)
+        cam_y = int(self.display.camera_y)
+        
+        for i in np.flatnonzero(pool.alive[:pool.size]).tolist():
+            x = pool.x[i] - cam_x
+            y = pool.y[i] - cam_y
+            angle = pool.angle[i]
+            nose = (x + np.cos(angle) * 30, y + np.sin(angle) * 30)
+            pygame.draw.line(self.display.screen, (255, 105, 180), (x, y), nose, 4)
+            pygame.draw.circle(self.display.screen, (255, 105, 180), (int(x), int(y)), 12)
+        
+        best_lap = int(pool.lap_count[:pool.size][pool.alive[:pool.size]].max(initial=0))
+        self._render_info(alive, total, best_lap)
+        
+        pygame.display.flip()
+    
+    def _render_info(self, alive: int, total: int, best_lap: int):
+        """Draw info generasi, jumlah hidup dan best lap."""
         if self.display.font_large:
             # Generation
             text = self.display.font_large.render(
@@ -244,16 +658,13 @@ class NEATTrainer:
             self.display.screen.blit(text, rect)
             
             # Best lap
-            best_lap = max((car.lap_count for car in cars if car.alive), default=0)
             text = self.display.font_small.render(
                 f"Best Lap: {best_lap}/{self.target_laps}", True, (0, 255, 0)
             )
             rect = text.get_rect(center=(self.display.width // 2, 240))
             self.display.screen.blit(text, rect)
-        
-        pygame.display.flip()
     
-    def _handle_winner(self, genome, net, car: Motor, config):
+    def _handle_winner(self, genome, net, distance: float, config):
         """Handle ketika ada winner"""
         self.winner_found = True
         
@@ -261,7 +672,7 @@ class NEATTrainer:
         print("TRAINING BERHASIL!")
         print(f"Motor menyelesaikan {self.target_laps} lap!")
         print(f"Generation: {self.generation}")
-        print(f"Distance: {int(car.distance_traveled)}")
+        print(f"Distance: {int(distance)}")
         print("=" * 60)
         
         # Save models
@@ -302,6 +713,12 @@ class NEATTrainer:
             self.config_path
         )
         
+        # Radar lawan menambah satu input network
+        expected_inputs = RadarConfig().num_radars + (1 if self.game_cfg.opponent_radar else 0)
+        if config.genome_config.num_inputs != expected_inputs:
+            raise ValueError(f"num_inputs di {self.config_path} = {config.genome_config.num_inputs}, "
+                             f"harus {expected_inputs} (OPPONENT_RADAR={self.game_cfg.opponent_radar})")
+        
         # Create or restore population
         if checkpoint_path and os.path.exists(checkpoint_path):
             print(f"Resuming from checkpoint: {checkpoint_path}")
@@ -322,12 +739,20 @@ class NEATTrainer:
         )
 
         # Run evolution
-        winner = population.run(self.eval_genomes, generations)
+        try:
+            winner = population.run(self.eval_genomes, generations)
+        finally:
+            if self.parallel is not None:
+                self.parallel.close()
+            self.events.close()
+            if os.path.exists(self.log_path):
+                print(f"Event log: {self.log_path}")
 
         # Save best genome jika belum ada winner
         if winner and not self.winner_found:
             winner_net = neat.nn.FeedForwardNetwork.create(winner, config)
             self._save_model(winner, winner_net, 'best')
 
-        self.display.quit()
+        if self.display is not None:
+            self.display.quit()
         return winner
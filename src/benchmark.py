@@ -0,0 +1,421 @@
+"""
+Micro-benchmark Simulasi
+========================
+
+Benchmark hot path simulasi satu per satu (radar, collision, physics, progress track,
+fitness) plus satu generasi penuh NEATTrainer.eval_genomes headless.
+
+Semua case pakai map asli map-2 (ai_masking-5.png) dengan posisi sampel
+di track dari seed tetap, jadi hasil antar commit bisa dibandingkan.
+Hasil (ops/detik dan persentil waktu per operasi) disimpan ke JSON.
+
+Usage:
+    cd src
+    python benchmark.py                           # Semua case
+    python benchmark.py --only radar collision    # Case yang namanya mengandung kata ini
+    python benchmark.py --quick                   # Batch lebih sedikit
+    python benchmark.py --compare ../logs/bench-<commit>-<waktu>.json
+"""
+
+import contextlib
+import io
+import json
+import math
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+from typing import Callable, Dict, List, Optional
+
+import numpy as np
+
+# Setup path
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(BASE_DIR, "src"))
+sys.path.insert(0, os.path.join(BASE_DIR, "config"))
+
+from core.game_manager import GameManager, GameConfig
+from core.distance_field import DistanceField
+from core.progress_field import ProgressField
+from core.batch_radar import BatchRadar
+from core.collision import CollisionHandler
+from core.physics import PhysicsEngine, PhysicsConfig
+from core.radar import FitnessCalculator
+from core.zone_grid import ZONE_TRACK
+import game_config as cfg
+
+
+BENCH_MAP = "map-2"
+SEED = 1234
+SAMPLE_POSITIONS = 1000
+POPULATION_BATCH = 150
+
+
+def measure(function: Callable[[], None], ops: int, batches: int, warmup: int = 2) -> dict:
+    """
+    Jalankan `function` (= `ops` operasi) berkali-kali.
+
+    Returns:
+        dict ops_per_sec + persentil waktu per operasi (mikrodetik,
+        rata-rata per batch, jadi noise timer tidak mendominasi)
+    """
+    for _ in range(warmup):
+        function()
+
+    per_op = []
+    total = 0.0
+    for _ in range(batches):
+        start = time.perf_counter()
+        function()
+        elapsed = time.perf_counter() - start
+        total += elapsed
+        per_op.append(elapsed / ops)
+
+    us = np.array(per_op) * 1e6
+    return {
+        "ops_per_sec": round(ops * batches / total, 2),
+        "mean_us": round(float(us.mean()), 3),
+        "p50_us": round(float(np.percentile(us, 50)), 3),
+        "p90_us": round(float(np.percentile(us, 90)), 3),
+        "p99_us": round(float(np.percentile(us, 99)), 3),
+        "min_us": round(float(us.min()), 3),
+        "batches": batches,
+        "ops_per_batch": ops,
+    }
+
+
+class BenchmarkSuite:
+    """Setup map sekali, lalu tiap case diukur terpisah."""
+
+    def __init__(self, batches: int = 30, generations: int = 3):
+        self.batches = batches
+        self.generations = generations
+        self.map_data = cfg.MAP_SETTINGS[BENCH_MAP]
+
+        self.game_cfg = GameConfig(
+            track_name=self.map_data["track_file"],
+            track_scale=cfg.TRACK_SCALE,
+            original_track_width=cfg.ORIGINAL_TRACK_WIDTH,
+            original_track_height=cfg.ORIGINAL_TRACK_HEIGHT,
+            spawn_x=self.map_data["spawn_x"],
+            spawn_y=self.map_data["spawn_y"],
+            spawn_angle=self.map_data["spawn_angle"],
+            masking_file=self.map_data["masking_file"],
+            masking_subfolder=cfg.MASKING_SUBFOLDER,
+        )
+
+        with contextlib.redirect_stdout(io.StringIO()):
+            self.game = GameManager(BASE_DIR, self.game_cfg)
+            self.game.load_track(render=False)
+            self.game.load_masking()
+        self.zone_grid = self.game.zone_grid
+        self.distance_field = DistanceField.load_or_build(self.zone_grid, self.game.map_cache)
+
+        # Posisi sampel di track (seed tetap), heading acak
+        rng = np.random.default_rng(SEED)
+        xs, ys = [], []
+        while len(xs) < SAMPLE_POSITIONS:
+            cx = rng.uniform(0, self.game.map_width, SAMPLE_POSITIONS)
+            cy = rng.uniform(0, self.game.map_height, SAMPLE_POSITIONS)
+            track = self.zone_grid.zones_at(cx, cy) == ZONE_TRACK
+            xs.extend(cx[track].tolist())
+            ys.extend(cy[track].tolist())
+        self.xs = xs[:SAMPLE_POSITIONS]
+        self.ys = ys[:SAMPLE_POSITIONS]
+        self.angles = rng.uniform(0, 2 * math.pi, SAMPLE_POSITIONS).tolist()
+        self.steering = rng.uniform(-1, 1, SAMPLE_POSITIONS).tolist()
+
+        # Posisi tick sebelumnya (untuk swept collision), ~kecepatan maksimum
+        self.prev_xs = [x - math.cos(a) * 10 for x, a in zip(self.xs, self.angles)]
+        self.prev_ys = [y - math.sin(a) * 10 for y, a in zip(self.ys, self.angles)]
+
+        self._masking_surface = None
+        self.results: Dict[str, dict] = {}
+
+    def masking_surface(self):
+        """Masking di-scale ke ukuran map (jalur lama tanpa ZoneGrid)."""
+        if self._masking_surface is None:
+            import pygame
+
+            path = os.path.join(self.game.assets_dir, "tracks", cfg.MASKING_SUBFOLDER,
+                                self.map_data["masking_file"])
+            masking = pygame.image.load(path)
+            self._masking_surface = pygame.transform.scale(
+                masking, (self.game.map_width, self.game.map_height))
+        return self._masking_surface
+
+    def cases(self) -> Dict[str, Callable[[], dict]]:
+        return {
+            "radar.update": self.bench_radar_surface,
+            "radar.update_from_grid": self.bench_radar_grid,
+            "radar.update_from_field": self.bench_radar_field,
+            "batch_radar.compute": self.bench_batch_radar,
+            "collision.check_masking_collision": self.bench_collision_grid,
+            "collision.check_masking_collision.swept": self.bench_collision_swept,
+            "collision.check_masking_collision.surface": self.bench_collision_surface,
+            "physics.apply_steering": self.bench_physics_steering,
+            "fitness.update": self.bench_fitness,
+            "progress_field.progress": self.bench_progress,
+            "eval_genomes.serial": lambda: self.bench_eval_genomes(vectorized=False),
+            "eval_genomes.vectorized": lambda: self.bench_eval_genomes(vectorized=True),
+        }
+
+    def run(self, only: Optional[List[str]] = None) -> Dict[str, dict]:
+        for name, case in self.cases().items():
+            if only and not any(word in name for word in only):
+                continue
+            result = case()
+            self.results[name] = result
+            print(f"{name:44s} {result['ops_per_sec']:>12,.1f} ops/s | "
+                  f"p50 {result['p50_us']:>10.2f} us | p90 {result['p90_us']:>10.2f} us | "
+                  f"p99 {result['p99_us']:>10.2f} us")
+        return self.results
+
+    # =========================================================================
+    # Case
+    # =========================================================================
+
+    def _motor(self):
+        x, y = self.game.get_spawn_position()
+        return self.game.create_motor(x, y, invincible=False)
+
+    def bench_radar_surface(self) -> dict:
+        radar = self._motor().radar
+        surface = self.masking_surface()
+        count = 100
+        samples = list(zip(self.xs, self.ys, self.angles))[:count]
+
+        def run():
+            for x, y, angle in samples:
+                radar.update(x, y, angle, surface)
+        return measure(run, count, max(3, self.batches // 5))
+
+    def bench_radar_grid(self) -> dict:
+        radar = self._motor().radar
+        grid = self.zone_grid
+        samples = list(zip(self.xs, self.ys, self.angles))
+
+        def run():
+            for x, y, angle in samples:
+                radar.update_from_grid(x, y, angle, grid)
+        return measure(run, len(samples), self.batches)
+
+    def bench_radar_field(self) -> dict:
+        radar = self._motor().radar
+        field = self.distance_field
+        samples = list(zip(self.xs, self.ys, self.angles))
+
+        def run():
+            for x, y, angle in samples:
+                radar.update_from_field(x, y, angle, field)
+        return measure(run, len(samples), self.batches)
+
+    def bench_batch_radar(self) -> dict:
+        """Satu operasi = radar untuk POPULATION_BATCH motor sekaligus."""
+        radar = BatchRadar.from_zone_grid(self.zone_grid)
+        xs = np.array(self.xs)
+        ys = np.array(self.ys)
+        angles = np.array(self.angles)
+        chunks = [slice(i, i + POPULATION_BATCH)
+                  for i in range(0, SAMPLE_POSITIONS - POPULATION_BATCH + 1, POPULATION_BATCH)]
+
+        def run():
+            for chunk in chunks:
+                radar.compute(xs[chunk], ys[chunk], angles[chunk])
+        return measure(run, len(chunks), self.batches)
+
+    def _collision(self, swept: bool) -> CollisionHandler:
+        motor = self._motor()
+        motor.collision.swept = swept
+        return motor.collision
+
+    def bench_collision_grid(self) -> dict:
+        collision = self._collision(swept=False)
+        samples = list(zip(self.xs, self.ys, self.angles))
+
+        def run():
+            for x, y, angle in samples:
+                collision.check_masking_collision(x, y, angle)
+        return measure(run, len(samples), self.batches)
+
+    def bench_collision_swept(self) -> dict:
+        collision = self._collision(swept=True)
+        samples = list(zip(self.xs, self.ys, self.angles, self.prev_xs, self.prev_ys))
+
+        def run():
+            for x, y, angle, prev_x, prev_y in samples:
+                collision.check_masking_collision(x, y, angle, prev_x, prev_y)
+        return measure(run, len(samples), self.batches)
+
+    def bench_collision_surface(self) -> dict:
+        motor = self._motor()
+        collision = CollisionHandler(length=motor.length, width=motor.width)
+        collision.set_masking_surface(self.masking_surface())
+        samples = list(zip(self.xs, self.ys, self.angles))
+
+        def run():
+            for x, y, angle in samples:
+                collision.check_masking_collision(x, y, angle)
+        return measure(run, len(samples), self.batches)
+
+    def bench_physics_steering(self) -> dict:
+        motor = self._motor()
+        physics = PhysicsEngine(PhysicsConfig(length=motor.length, width=motor.width))
+        inputs = [(steer, i % 4 == 0) for i, steer in enumerate(self.steering)]
+
+        def run():
+            physics.reset()
+            physics.state.velocity = physics.config.max_speed * 0.8
+            for steer, drift in inputs:
+                physics.apply_steering(steer, drift)
+        return measure(run, len(inputs), self.batches)
+
+    def bench_fitness(self) -> dict:
+        """Lintasan random walk dari spawn (langkah ~ kecepatan motor)."""
+        rng = np.random.default_rng(SEED)
+        x0, y0 = self.game.get_spawn_position()
+        steps = rng.normal(0, 6, (SAMPLE_POSITIONS, 2)).cumsum(axis=0)
+        path = [(x0 + dx, y0 + dy, turn) for (dx, dy), turn
+                in zip(steps.tolist(), rng.normal(0, 0.02, SAMPLE_POSITIONS).tolist())]
+
+        def run():
+            fitness = FitnessCalculator(x0, y0)
+            for x, y, turn in path:
+                fitness.update(x, y, turn)
+        return measure(run, len(path), self.batches)
+
+    def bench_progress(self) -> dict:
+        """Lookup progress lap-aware di posisi sampel (checkpoint acak)."""
+        field = self.game.progress_field
+        if field is None:
+            field = ProgressField.load_or_build(self.zone_grid, self.game.map_cache)
+        rng = np.random.default_rng(SEED)
+        checkpoints = rng.integers(0, 5, SAMPLE_POSITIONS).tolist()
+        xs, ys = self.xs, self.ys
+
+        def run():
+            for x, y, checkpoint in zip(xs, ys, checkpoints):
+                field.progress(x, y, 0, checkpoint)
+        return measure(run, len(xs), self.batches)
+
+    def bench_eval_genomes(self, vectorized: bool) -> dict:
+        """
+        Satu operasi = satu generasi penuh (populasi config.txt, seed tetap).
+
+        Genome yang sama dievaluasi ulang tiap batch (fitness cache mati,
+        jadi kerja per batch identik).
+        """
+        import neat
+        from ai.trainer import NEATTrainer
+
+        config_path = os.path.join(BASE_DIR, "config.txt")
+        with contextlib.redirect_stdout(io.StringIO()):
+            trainer = NEATTrainer(config_path, track_name=BENCH_MAP, headless=True,
+                                  vectorized=vectorized, log_level=0, fitness_cache=0)
+            trainer.setup()
+            config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction,
+                                 neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
+            random.seed(SEED)
+            genomes = list(neat.Population(config).population.items())
+
+        def run():
+            with contextlib.redirect_stdout(io.StringIO()):
+                trainer.eval_genomes(genomes, config)
+        result = measure(run, 1, self.generations, warmup=1)
+        result["population"] = len(genomes)
+        return result
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], cwd=BASE_DIR,
+                                       stderr=subprocess.DEVNULL, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def compare(results: Dict[str, dict], baseline_path: str) -> None:
+    """Cetak rasio ops/detik terhadap file hasil sebelumnya (>1 = lebih cepat)."""
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = json.load(f)
+    print(f"\nDibandingkan dengan {baseline_path} (commit {baseline['meta'].get('commit')})")
+    for name, result in results.items():
+        old = baseline["results"].get(name)
+        if old is None:
+            print(f"{name:44s} (baru)")
+            continue
+        ratio = result["ops_per_sec"] / old["ops_per_sec"]
+        print(f"{name:44s} {old['ops_per_sec']:>12,.1f} -> {result['ops_per_sec']:>12,.1f} "
+              f"ops/s  x{ratio:.2f}")
+
+
+def main():
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Micro-benchmark hot path simulasi")
+
+    parser.add_argument(
+        '--only',
+        nargs='+',
+        default=None,
+        help='Jalankan case yang namanya mengandung salah satu kata ini (misal radar collision)'
+    )
+
+    parser.add_argument(
+        '--quick',
+        action='store_true',
+        help='Batch lebih sedikit (cek cepat, persentil kurang stabil)'
+    )
+
+    parser.add_argument(
+        '--output', '-o',
+        type=str,
+        default=None,
+        help='File JSON hasil (default: logs/bench-<commit>-<waktu>.json)'
+    )
+
+    parser.add_argument(
+        '--compare', '-c',
+        type=str,
+        default=None,
+        help='File JSON hasil sebelumnya untuk dibandingkan'
+    )
+
+    args = parser.parse_args()
+
+    commit = git_commit()
+    suite = BenchmarkSuite(batches=8 if args.quick else 30,
+                           generations=1 if args.quick else 3)
+    print(f"Benchmark {BENCH_MAP} ({suite.map_data['masking_file']}) | commit {commit} | seed {SEED}")
+    results = suite.run(args.only)
+
+    output = args.output or os.path.join(
+        BASE_DIR, "logs", f"bench-{commit}-{time.strftime('%Y%m%d-%H%M%S')}.json")
+    folder = os.path.dirname(output)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
+    with open(output, "w", encoding="utf-8") as f:
+        json.dump({
+            "meta": {
+                "commit": commit,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+                "map": BENCH_MAP,
+                "masking": suite.map_data["masking_file"],
+                "seed": SEED,
+                "python": platform.python_version(),
+                "numpy": np.__version__,
+                "machine": platform.machine(),
+                "quick": args.quick,
+            },
+            "results": results,
+        }, f, indent=2)
+    print(f"\nHasil tersimpan: {output}")
+
+    if args.compare:
+        compare(results, args.compare)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,8 @@
 """
 Core game components
+
+Modul simulasi (physics, collision, radar, zone grid, pool) tidak
+meng-import pygame; pygame hanya dipakai saat render/decode gambar.
 """
 # from .ai_car import AICar
 from .motor import Motor
@@ -11,3 +14,4 @@ from .physics import PhysicsConfig, PhysicsState, PhysicsEngine
 from .collision import CollisionHandler
 from .checkpoint import CheckpointState, CheckpointTracker
 from .radar import RadarConfig, Radar, AIState, FitnessCalculator
+from .zone_grid import ZoneGrid
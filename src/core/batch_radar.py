@@ -0,0 +1,144 @@
+"""
+Batch Radar Module
+==================
+
+Radar untuk seluruh populasi motor sekaligus dalam satu pass NumPy.
+Hasilnya setara Radar.update_from_grid() per motor (step 5 px,
+berhenti di wall atau di luar map), tapi tanpa loop Python per sample.
+Jika ada DistanceField, pakai sphere tracing (setara update_from_field()).
+"""
+
+from typing import List, Optional, Sequence, Tuple
+
+import numpy as np
+
+from core.radar import RadarConfig
+from core.zone_grid import ZoneGrid
+from core.distance_field import DistanceField
+
+
+class BatchRadar:
+    """
+    Raycast N motor x num_radars ray di atas wall bitmap.
+
+    Usage:
+        batch = BatchRadar.from_zone_grid(game.zone_grid)
+        dist = batch.compute(xs, ys, angles)   # (N, num_radars)
+        batch.update_motors(cars)              # isi motor.radar.radars
+    """
+
+    def __init__(self, wall_bitmap: np.ndarray, config: RadarConfig = None,
+                 step: int = 5, distance_field: Optional[DistanceField] = None,
+                 x_index: Optional[np.ndarray] = None,
+                 y_index: Optional[np.ndarray] = None):
+        """
+        Args:
+            wall_bitmap: Array bool (height, width), True = wall
+            config: RadarConfig (sudut ray dan max_length)
+            step: Jarak antar sample dalam pixel
+            distance_field: Optional, kalau ada pakai sphere tracing
+            x_index, y_index: Optional, index world -> pixel bitmap per sumbu
+                (bitmap resolusi masking, lihat ZoneGrid)
+        """
+        self.config = config or RadarConfig()
+        self.distance_field = distance_field
+        self.walls = np.ascontiguousarray(wall_bitmap, dtype=bool)
+        self.x_index = x_index
+        self.y_index = y_index
+        if x_index is not None:
+            self.width, self.height = len(x_index), len(y_index)
+        else:
+            self.height, self.width = self.walls.shape
+        self.step = step
+
+        # Jarak sample: 0, 5, 10, ... < max_length
+        self.lengths = np.arange(0, self.config.max_length, step, dtype=np.float64)
+        self.angle_offsets = np.asarray(self.config.radar_angles, dtype=np.float64)
+
+    @classmethod
+    def from_zone_grid(cls, zone_grid: ZoneGrid, config: RadarConfig = None,
+                       distance_field: Optional[DistanceField] = None) -> "BatchRadar":
+        """Buat BatchRadar dari ZoneGrid (wall = ZONE_WALL), di resolusi masking."""
+        return cls(zone_grid.native_wall_mask(), config, distance_field=distance_field,
+                   x_index=zone_grid.x_index, y_index=zone_grid.y_index)
+
+    def compute(self, xs: Sequence[float], ys: Sequence[float],
+                angles: Sequence[float]) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Hitung semua ray untuk semua motor.
+
+        Args:
+            xs, ys: Posisi motor, shape (N,)
+            angles: Sudut motor dalam radians, shape (N,)
+
+        Returns:
+            (distances, end_x, end_y), masing-masing int shape (N, num_radars)
+        """
+        xs = np.asarray(xs, dtype=np.float64)
+        ys = np.asarray(ys, dtype=np.float64)
+        angles = np.asarray(angles, dtype=np.float64)
+
+        # Sudut ray, rumus sama dengan Radar.update()
+        angle_deg = 360 - np.degrees(angles)
+        ray_angles = np.radians(360 - (angle_deg[:, None] + self.angle_offsets[None, :]))
+        cos_a = np.cos(ray_angles)[:, :, None]
+        sin_a = np.sin(ray_angles)[:, :, None]
+
+        if self.distance_field is not None:
+            _, end_x, end_y = self.distance_field.trace_batch(
+                xs[:, None], ys[:, None], cos_a[:, :, 0], sin_a[:, :, 0],
+                self.config.max_length)
+            dx = end_x - xs[:, None]
+            dy = end_y - ys[:, None]
+            return np.sqrt(dx * dx + dy * dy).astype(np.int64), end_x, end_y
+
+        # Semua sample sekaligus: (N, R, K)
+        sample_x = (xs[:, None, None] + cos_a * self.lengths).astype(np.int64)
+        sample_y = (ys[:, None, None] + sin_a * self.lengths).astype(np.int64)
+
+        inside = (sample_x >= 0) & (sample_x < self.width) & \
+                 (sample_y >= 0) & (sample_y < self.height)
+        blocked = ~inside
+        if self.x_index is not None:
+            blocked[inside] = self.walls[self.y_index[sample_y[inside]],
+                                         self.x_index[sample_x[inside]]]
+        else:
+            blocked[inside] = self.walls[sample_y[inside], sample_x[inside]]
+
+        # Sample pertama yang kena wall; kalau tidak ada, sample terakhir
+        num_samples = self.lengths.shape[0]
+        hit = blocked.any(axis=2)
+        stop = np.where(hit, blocked.argmax(axis=2), num_samples - 1)
+
+        end_x = np.take_along_axis(sample_x, stop[:, :, None], axis=2)[:, :, 0]
+        end_y = np.take_along_axis(sample_y, stop[:, :, None], axis=2)[:, :, 0]
+
+        dx = end_x - xs[:, None]
+        dy = end_y - ys[:, None]
+        distances = np.sqrt(dx * dx + dy * dy).astype(np.int64)
+
+        return distances, end_x, end_y
+
+    def update_motors(self, motors: List) -> np.ndarray:
+        """
+        Hitung radar untuk list motor dan tulis ke motor.radar.radars.
+
+        Returns:
+            Matrix jarak (N, num_radars)
+        """
+        if not motors:
+            return np.zeros((0, len(self.angle_offsets)), dtype=np.int64)
+
+        xs = [m.x for m in motors]
+        ys = [m.y for m in motors]
+        angles = [m.angle for m in motors]
+        distances, end_x, end_y = self.compute(xs, ys, angles)
+
+        for motor, dist_row, ex_row, ey_row in zip(
+                motors, distances.tolist(), end_x.tolist(), end_y.tolist()):
+            radars = motor.radar.radars
+            radars.clear()
+            for dist, ex, ey in zip(dist_row, ex_row, ey_row):
+                radars.append(((ex, ey), dist))
+
+        return distances
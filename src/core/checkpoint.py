@@ -1,5 +1,8 @@
 import math
 from dataclasses import dataclass
+from typing import Optional
+
+from core.event_log import EventLog, EVENT_CHECKPOINT, EVENT_LAP
 
 @dataclass
 class CheckpointState:
@@ -30,6 +33,10 @@ class CheckpointTracker:
         # Init state bersih tanpa parameter koordinat aneh-aneh
         self.state = CheckpointState()
         
+        # Event checkpoint/lap (pengganti print), None = tidak dicatat
+        self.events: Optional[EventLog] = None
+        self.event_id = 0
+        
     def process_checkpoint(self, x: float, y: float, checkpoint_num: int, current_time: int) -> bool:
         """
         Dipanggil saat motor menyentuh warna checkpoint.
@@ -54,15 +61,20 @@ class CheckpointTracker:
         # KASUS SPESIAL: TRANSISI LAP (Dari CP Terakhir ke CP 1)
         # Jika kita mengharapkan CP 1, dan kita sudah melewati minimal 4 checkpoint sebelumnya
         if checkpoint_num == 1 and self.state.checkpoint_count >= self.state.total_checkpoints:
+            lap_time = current_time - self.state.lap_start_time
             self._handle_lap_complete(current_time)
-            print(f"[LAP] FINISH! New Lap Count: {self.state.lap_count}")
+            if self.events is not None:
+                self.events.emit(EVENT_LAP, current_time, self.event_id,
+                                 self.state.lap_count, lap_time)
             return True
 
         # KASUS NORMAL: Checkpoint Biasa (1->2, 2->3, 3->4)
         self.state.checkpoint_count += 1
         self.state.expected_checkpoint = (self.state.expected_checkpoint % self.state.total_checkpoints) + 1
         
-        print(f"[CP] Passed CP-{checkpoint_num}. Next: {self.state.expected_checkpoint}")
+        if self.events is not None:
+            self.events.emit(EVENT_CHECKPOINT, current_time, self.event_id,
+                             checkpoint_num, self.state.expected_checkpoint)
         return True
 
     def _handle_lap_complete(self, current_time: int):
@@ -101,4 +113,4 @@ class CheckpointTracker:
     def reset(self, start_x: float = None, start_y: float = None) -> None:
         if start_x: self.start_x = start_x
         if start_y: self.start_y = start_y
-        self.state = CheckpointState() # Reset ke 0
\ No newline at end of file
+        self.state.__init__() # Reset ke 0 (in-place)
\ No newline at end of file
@@ -7,8 +7,12 @@ Digunakan dengan composition pattern oleh Motor class.
 """
 
 import math
-from typing import List, Tuple, Optional
-import pygame
+from typing import List, Tuple, Optional, TYPE_CHECKING
+
+from core.zone_grid import ZoneGrid, ZONE_WALL, ZONE_SLOW, ZONE_OUT, checkpoint_number
+
+if TYPE_CHECKING:
+    import pygame
 
 
 class CollisionHandler:
@@ -32,18 +36,22 @@ class CollisionHandler:
         
         # Surfaces
         self.track = None
-        self.track_surface: Optional[pygame.Surface] = None
-        self.masking_surface: Optional[pygame.Surface] = None
+        self.track_surface: Optional["pygame.Surface"] = None
+        self.masking_surface: Optional["pygame.Surface"] = None
+        self.zone_grid: Optional[ZoneGrid] = None
+        
+        # Cek juga garis dari posisi sebelumnya (anti tembus wall tipis)
+        self.swept = True
     
     def set_track(self, track) -> None:
         """Set Track object untuk collision detection."""
         self.track = track
     
-    def set_track_surface(self, surface: pygame.Surface) -> None:
+    def set_track_surface(self, surface: "pygame.Surface") -> None:
         """Set pygame.Surface langsung untuk collision."""
         self.track_surface = surface
     
-    def set_masking_surface(self, surface: pygame.Surface) -> None:
+    def set_masking_surface(self, surface: "pygame.Surface") -> None:
         """
         Set masking surface untuk advanced collision.
         
@@ -56,6 +64,15 @@ class CollisionHandler:
         """
         self.masking_surface = surface
     
+    def set_zone_grid(self, zone_grid: ZoneGrid) -> None:
+        """
+        Set ZoneGrid hasil klasifikasi masking.
+        
+        Jika ada, check_masking_collision() membaca label zona dari grid
+        dan tidak lagi klasifikasi warna pixel per frame.
+        """
+        self.zone_grid = zone_grid
+    
     def get_collision_corners(self, x: float, y: float, angle: float) -> List[Tuple[float, float]]:
         """
         Get 4 corner points untuk collision detection.
@@ -93,10 +110,16 @@ class CollisionHandler:
         collision_size = min(self.length, self.width) * 0.6
         return self.track.check_collision(x, y, collision_size, collision_size)
     
-    def check_masking_collision(self, x: float, y: float, angle: float) -> dict:
+    def check_masking_collision(self, x: float, y: float, angle: float,
+                                prev_x: float = None, prev_y: float = None) -> dict:
         """
         Check collision menggunakan masking surface.
         
+        Jika prev_x/prev_y diberikan (dan swept aktif, pakai ZoneGrid),
+        lintasan 4 corner dari posisi sebelumnya juga dicek: wall yang
+        dilewati di tengah jalan dihitung collided walaupun corner di
+        posisi akhir aman.
+        
         Returns dict dengan info:
         - 'collided': True jika nabrak wall
         - 'out_of_bounds': True jika keluar map
@@ -112,6 +135,15 @@ class CollisionHandler:
             'on_track': True
         }
         
+        if self.zone_grid is not None:
+            result = self._check_zone_grid(x, y, angle, result)
+            if self.swept and prev_x is not None and not result['collided'] and \
+               self._swept_hits_wall(x, y, angle, prev_x, prev_y):
+                result['collided'] = True
+                result['slow_zone'] = False
+                result['checkpoint'] = 0
+            return result
+        
         if self.masking_surface is None:
             return result
         
@@ -144,6 +176,67 @@ class CollisionHandler:
         
         return result
     
+    def _check_zone_grid(self, x: float, y: float, angle: float, result: dict) -> dict:
+        """Versi check_masking_collision() yang membaca ZoneGrid."""
+        zone_at = self.zone_grid.zone_at
+        length = self.length * 0.4
+        width = self.width * 0.4
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        
+        for dx, dy in ((-length/2, -width/2), (length/2, -width/2),
+                       (length/2, width/2), (-length/2, width/2)):
+            zone = zone_at(x + (dx * cos_a - dy * sin_a), y + (dx * sin_a + dy * cos_a))
+            
+            if zone == ZONE_OUT:
+                result['out_of_bounds'] = True
+                result['collided'] = True
+                return result
+            if zone == ZONE_WALL:
+                result['collided'] = True
+                return result
+            if zone == ZONE_SLOW:
+                result['slow_zone'] = True
+            else:
+                cp = checkpoint_number(zone)
+                if cp:
+                    result['checkpoint'] = cp
+        
+        return result
+    
+    def _swept_hits_wall(self, x: float, y: float, angle: float,
+                         prev_x: float, prev_y: float) -> bool:
+        """
+        Apakah lintasan salah satu corner dari posisi sebelumnya kena wall.
+        
+        Angle tidak berubah selama gerak satu tick, jadi tiap corner cukup
+        digeser sejauh (x - prev_x, y - prev_y).
+        """
+        length = self.length * 0.4
+        width = self.width * 0.4
+        
+        # Early-out: tidak ada wall di sekitar hitbox sepanjang gerak tick ini
+        reach = math.hypot(length, width) / 2 + 1
+        x_min, x_max = (x, prev_x) if x < prev_x else (prev_x, x)
+        y_min, y_max = (y, prev_y) if y < prev_y else (prev_y, y)
+        if not self.zone_grid.area_has_wall(x_min - reach, y_min - reach,
+                                            x_max + reach, y_max + reach):
+            return False
+        
+        segment_hits_wall = self.zone_grid.segment_hits_wall
+        cos_a = math.cos(angle)
+        sin_a = math.sin(angle)
+        shift_x = prev_x - x
+        shift_y = prev_y - y
+        
+        for dx, dy in ((-length/2, -width/2), (length/2, -width/2),
+                       (length/2, width/2), (-length/2, width/2)):
+            cx = x + (dx * cos_a - dy * sin_a)
+            cy = y + (dx * sin_a + dy * cos_a)
+            if segment_hits_wall(cx + shift_x, cy + shift_y, cx, cy):
+                return True
+        return False
+    
     def _classify_color(self, r: int, g: int, b: int) -> str:
         """
         Klasifikasi warna dari masking.
@@ -178,6 +271,6 @@ class CollisionHandler:
         # Slow zone (white/gray)
         return 'slow'
     
-    def get_surface_for_radar(self) -> Optional[pygame.Surface]:
+    def get_surface_for_radar(self) -> Optional["pygame.Surface"]:
         """Get surface yang dipakai untuk radar (masking preferred)."""
         return self.masking_surface or self.track_surface
@@ -3,6 +3,12 @@
 import pygame
 from typing import List, Optional, Tuple
 
+from core.zone_grid import stretch_index
+
+
+# Ukuran tile track (pixel), render cuma blit tile yang kelihatan
+TRACK_TILE_SIZE = 512
+
 
 class DisplayManager:
     """
@@ -40,6 +46,10 @@ class DisplayManager:
         self.camera_x: float = 0
         self.camera_y: float = 0
         self.camera_smoothness: float = 0.15
+        
+        # Tile track (format display), satu-satunya salinan track ukuran map
+        self.tile_size = TRACK_TILE_SIZE
+        self.track_tiles: List[List[pygame.Surface]] = []
     
     def init(self, title: str = "Mio Karbu", headless: bool = False):
         """
@@ -75,50 +85,106 @@ class DisplayManager:
             self.font_small = pygame.font.Font(None, 32)
     
     def update_camera(self, target_x: float, target_y: float,
-                      map_width: int, map_height: int):
+                      map_width: int, map_height: int, dt: float = None):
         """
         Update camera position dengan smooth follow.
         
         Args:
             target_x, target_y: Posisi target (biasanya player)
             map_width, map_height: Ukuran map untuk clamping
+            dt: Detik sejak update sebelumnya, None = satu frame 60 FPS
+                (smoothing jadi sama di FPS berapa pun)
         """
+        smoothness = self.camera_smoothness
+        if dt is not None:
+            smoothness = 1.0 - (1.0 - smoothness) ** (dt * 60.0)
+        
         # Target camera position (center on target)
         target_cam_x = target_x - self.width / 2
         target_cam_y = target_y - self.height / 2
         
         # Smooth interpolation (lerp)
-        self.camera_x += (target_cam_x - self.camera_x) * self.camera_smoothness
-        self.camera_y += (target_cam_y - self.camera_y) * self.camera_smoothness
+        self.camera_x += (target_cam_x - self.camera_x) * smoothness
+        self.camera_y += (target_cam_y - self.camera_y) * smoothness
         
         # Clamp to map bounds
         self.camera_x = max(0, min(map_width - self.width, self.camera_x))
         self.camera_y = max(0, min(map_height - self.height, self.camera_y))
     
-    def render_track(self, track_surface: pygame.Surface):
+    def set_track(self, track_image: pygame.Surface,
+                  size: Optional[Tuple[int, int]] = None):
         """
-        Render track dengan camera offset.
+        Potong track jadi tile yang sudah convert() ke format display.
+        
+        Tile di-scale langsung dari gambar asli dengan index per sumbu yang
+        sama dengan pygame.transform.scale, jadi hasilnya identik tanpa
+        pernah membuat surface track ukuran map. Dipanggil sekali setelah
+        track di-load.
         
         Args:
-            track_surface: Surface track yang sudah di-scale
+            track_image: Surface track (resolusi asli atau sudah di-scale)
+            size: Ukuran map (width, height), None = ukuran track_image
         """
-        self.screen.blit(
-            track_surface, 
-            (-int(self.camera_x), -int(self.camera_y))
-        )
+        tile = self.tile_size
+        src_w, src_h = track_image.get_size()
+        map_w, map_h = size or (src_w, src_h)
+        x_index = stretch_index(src_w, map_w)
+        y_index = stretch_index(src_h, map_h)
+        
+        if track_image.get_bitsize() < 24:
+            # PNG indexed/16-bit: pixels3d butuh surface 24/32-bit
+            track_image = track_image.convert()
+        
+        pixels = pygame.surfarray.pixels3d(track_image)  # (width, height, 3)
+        try:
+            self.track_tiles = []
+            for y in range(0, map_h, tile):
+                rows = y_index[y:y + tile]
+                row = []
+                for x in range(0, map_w, tile):
+                    rgb = pixels[x_index[x:x + tile]][:, rows]
+                    row.append(pygame.surfarray.make_surface(rgb).convert())
+                self.track_tiles.append(row)
+        finally:
+            del pixels  # Lepas lock surface
+    
+    def render_track(self):
+        """
+        Render track (tile dari set_track) dengan camera offset.
+        
+        Hanya tile yang overlap viewport yang di-blit, jadi biayanya
+        tergantung ukuran layar, bukan ukuran map.
+        """
+        size = self.tile_size
+        cam_x = int(self.camera_x)
+        cam_y = int(self.camera_y)
+        
+        rows = len(self.track_tiles)
+        cols = len(self.track_tiles[0]) if rows else 0
+        col_start = max(0, cam_x // size)
+        col_end = min(cols, (cam_x + self.width - 1) // size + 1)
+        row_start = max(0, cam_y // size)
+        row_end = min(rows, (cam_y + self.height - 1) // size + 1)
+        
+        for row in range(row_start, row_end):
+            tiles = self.track_tiles[row]
+            for col in range(col_start, col_end):
+                self.screen.blit(tiles[col], (col * size - cam_x, row * size - cam_y))
     
-    def render_motor(self, motor, show_radar: bool = False):
+    def render_motor(self, motor, show_radar: bool = False, alpha: float = 1.0):
         """
         Render satu motor.
         
         Args:
             motor: Motor instance
             show_radar: True untuk menampilkan radar lines
+            alpha: Interpolasi posisi antar tick (lihat FixedTimestep.alpha)
         """
         motor.draw(
             self.screen, 
             int(self.camera_x), 
-            int(self.camera_y)
+            int(self.camera_y),
+            alpha=alpha
         )
         
         if show_radar and hasattr(motor, 'radar'):
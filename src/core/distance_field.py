@@ -0,0 +1,222 @@
+"""
+Distance Field Module
+=====================
+
+Distance field (jarak ke wall terdekat per pixel) untuk radar O(1)-ish.
+Radar tidak lagi jalan per 5 px, tapi loncat sejauh jarak aman
+(sphere tracing), jadi biayanya tidak naik seiring max_length.
+
+Field dihitung sekali dari masking lalu di-cache ke disk lewat MapCache.
+"""
+
+from typing import Tuple
+
+import numpy as np
+
+
+# Jarak maksimum yang disimpan (pixel). Di atas ini nilai di-clip,
+# cukup untuk loncatan besar di tengah track.
+DEFAULT_MAX_DISTANCE = 64
+
+# Margin aman: posisi ray dan center pixel bisa beda sampai sqrt(2)/2
+SAFETY_MARGIN = 1.5
+
+
+def _vertical_distance(free: np.ndarray, cap: int) -> np.ndarray:
+    """Jarak ke pixel blocked terdekat di kolom yang sama (border = blocked)."""
+    height = free.shape[0]
+    idx = np.arange(height, dtype=np.int32)[:, None]
+
+    above = np.where(free, np.int32(-1), idx)
+    np.maximum.accumulate(above, axis=0, out=above)
+
+    below = np.where(free, np.int32(height), idx)
+    below = np.minimum.accumulate(below[::-1], axis=0)[::-1]
+
+    dist = np.minimum(idx - above, below - idx)
+    return np.minimum(dist, cap + 1).astype(np.float32)
+
+
+def compute_distance_field(wall_mask: np.ndarray,
+                           max_distance: int = DEFAULT_MAX_DISTANCE,
+                           chunk: int = 256) -> np.ndarray:
+    """
+    Euclidean distance transform dari wall mask, di-clip ke max_distance.
+
+    Nilai exact untuk jarak <= max_distance, dan tidak pernah lebih besar
+    dari jarak asli (aman untuk sphere tracing). Luar map dianggap wall.
+
+    Args:
+        wall_mask: Array bool (height, width), True = wall
+        max_distance: Batas jarak yang disimpan (<= 255)
+        chunk: Ukuran potongan baris/kolom supaya memori tetap kecil
+
+    Returns:
+        Array uint8 (height, width), floor dari jarak
+    """
+    max_distance = min(int(max_distance), 255)
+    free = ~np.asarray(wall_mask, dtype=bool)
+    height, width = free.shape
+
+    try:
+        import cv2
+    except ImportError:
+        cv2 = None
+
+    if cv2 is not None:
+        padded = np.zeros((height + 2, width + 2), dtype=np.uint8)
+        padded[1:-1, 1:-1] = free
+        dist = cv2.distanceTransform(padded, cv2.DIST_L2, cv2.DIST_MASK_PRECISE)
+        dist = dist[1:-1, 1:-1]
+        return np.floor(np.minimum(dist, max_distance)).astype(np.uint8)
+
+    # Fallback NumPy: EDT separable (kolom lalu baris) dengan offset terbatas
+    g2 = np.empty((height, width), dtype=np.float32)
+    for start in range(0, width, chunk):
+        stop = min(width, start + chunk)
+        g = _vertical_distance(free[:, start:stop], max_distance)
+        g2[:, start:stop] = g * g
+
+    cols = np.arange(width, dtype=np.float32)
+    border2 = np.minimum((cols + 1) ** 2, (width - cols) ** 2)
+
+    result = np.empty((height, width), dtype=np.uint8)
+    for start in range(0, height, chunk):
+        stop = min(height, start + chunk)
+        g2_rows = g2[start:stop]
+        d2 = np.minimum(g2_rows, border2[None, :])
+        for k in range(1, max_distance + 1):
+            k2 = np.float32(k * k)
+            np.minimum(d2[:, k:], g2_rows[:, :-k] + k2, out=d2[:, k:])
+            np.minimum(d2[:, :-k], g2_rows[:, k:] + k2, out=d2[:, :-k])
+        dist = np.sqrt(d2)
+        result[start:stop] = np.floor(np.minimum(dist, max_distance)).astype(np.uint8)
+
+    return result
+
+
+class DistanceField:
+    """
+    Lookup jarak ke wall terdekat + raycast sphere tracing.
+
+    Koordinat query adalah koordinat world, sama dengan ZoneGrid.
+    """
+
+    def __init__(self, distances: np.ndarray, min_step: float = 1.0):
+        """
+        Args:
+            distances: Array uint8 (height, width), 0 = wall
+            min_step: Step minimum sphere tracing (pixel)
+        """
+        self.distances = np.ascontiguousarray(distances, dtype=np.uint8)
+        self.height, self.width = self.distances.shape
+        self.min_step = min_step
+        self._cells = memoryview(self.distances).cast('B')
+
+    @classmethod
+    def from_wall_mask(cls, wall_mask: np.ndarray,
+                       max_distance: int = DEFAULT_MAX_DISTANCE) -> "DistanceField":
+        return cls(compute_distance_field(wall_mask, max_distance))
+
+    @classmethod
+    def load_or_build(cls, zone_grid, cache=None,
+                      max_distance: int = DEFAULT_MAX_DISTANCE) -> "DistanceField":
+        """
+        Load field dari MapCache (mmap), atau hitung baru dari zone grid.
+
+        Args:
+            zone_grid: ZoneGrid map
+            cache: Optional MapCache, None = selalu hitung
+            max_distance: Batas jarak yang disimpan
+        """
+        def build():
+            return compute_distance_field(zone_grid.wall_mask(), max_distance)
+
+        if cache is None:
+            return cls(build())
+        return cls(cache.get_or_build(f"distance-c{max_distance}", build))
+
+    def distance_at(self, x: float, y: float) -> int:
+        """Jarak ke wall terdekat di posisi (x, y), 0 jika wall/luar map."""
+        ix = int(x)
+        iy = int(y)
+        if ix < 0 or ix >= self.width or iy < 0 or iy >= self.height:
+            return 0
+        return self._cells[iy * self.width + ix]
+
+    def trace(self, x: float, y: float, cos_a: float, sin_a: float,
+              max_length: float) -> Tuple[float, int, int]:
+        """
+        Sphere tracing satu ray sampai kena wall/luar map atau max_length.
+
+        Returns:
+            (jarak tempuh, end_x, end_y)
+        """
+        cells = self._cells
+        width = self.width
+        height = self.height
+        min_step = self.min_step
+
+        t = 0.0
+        while t < max_length:
+            ix = int(x + cos_a * t)
+            iy = int(y + sin_a * t)
+            if ix < 0 or ix >= width or iy < 0 or iy >= height:
+                return t, ix, iy
+
+            d = cells[iy * width + ix]
+            if d == 0:
+                return t, ix, iy
+
+            step = d - SAFETY_MARGIN
+            t += step if step > min_step else min_step
+
+        t = float(max_length)
+        return t, int(x + cos_a * t), int(y + sin_a * t)
+
+    def trace_batch(self, xs: np.ndarray, ys: np.ndarray, cos_a: np.ndarray,
+                    sin_a: np.ndarray, max_length: float
+                    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Versi vectorized dari trace() untuk banyak ray sekaligus.
+
+        Args:
+            xs, ys, cos_a, sin_a: Array dengan shape sama (misal N x R)
+
+        Returns:
+            (t, end_x, end_y) dengan shape yang sama
+        """
+        xs, ys, cos_a, sin_a = np.broadcast_arrays(
+            np.asarray(xs, dtype=np.float64), np.asarray(ys, dtype=np.float64),
+            np.asarray(cos_a, dtype=np.float64), np.asarray(sin_a, dtype=np.float64))
+
+        t = np.zeros(xs.shape, dtype=np.float64)
+        end_x = np.zeros(xs.shape, dtype=np.int64)
+        end_y = np.zeros(xs.shape, dtype=np.int64)
+        active = np.ones(xs.shape, dtype=bool)
+
+        while True:
+            idx = np.nonzero(active)
+            if idx[0].size == 0:
+                break
+
+            t_act = t[idx]
+            reached = t_act >= max_length
+            t_act[reached] = max_length
+
+            ix = (xs[idx] + cos_a[idx] * t_act).astype(np.int64)
+            iy = (ys[idx] + sin_a[idx] * t_act).astype(np.int64)
+            end_x[idx] = ix
+            end_y[idx] = iy
+
+            inside = (ix >= 0) & (ix < self.width) & (iy >= 0) & (iy < self.height)
+            d = np.zeros(ix.shape, dtype=np.float64)
+            d[inside] = self.distances[iy[inside], ix[inside]]
+
+            done = reached | (d == 0)
+            t_act = np.where(done, t_act, t_act + np.maximum(d - SAFETY_MARGIN, self.min_step))
+            t[idx] = t_act
+
+            active[idx] = ~done
+
+        return t, end_x, end_y
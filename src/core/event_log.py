@@ -0,0 +1,251 @@
+"""
+Event Log Module
+================
+
+Stream event terstruktur (checkpoint, lap, death, stuck, cull, ringkasan
+generasi) pengganti print() di loop simulasi.
+
+- emit() cuma menambah tuple ke buffer; event di bawah level verbosity
+  langsung dibuang.
+- Buffer ditulis per batch ke JSON Lines atau log binary (struct, ukuran
+  record tetap per jenis event), opsional lewat thread background supaya
+  loop simulasi tidak pernah menunggu I/O.
+- Tanpa path, buffer cukup diambil dengan drain() (worker training
+  mengirim event ke proses utama lewat ShardReport).
+
+Format record: (kind, generation, tick, motor, *values). `tick` untuk
+event motor adalah time_spent motor tersebut, motor = -1 untuk event
+tingkat generasi.
+
+Usage:
+    events = EventLog(LEVEL_EVENTS, path="logs/train.jsonl", threaded=True)
+    events.emit(EVENT_LAP, tick, motor_id, lap, lap_time)
+    events.close()
+"""
+
+import json
+import os
+import queue
+import struct
+import sys
+import threading
+from typing import Dict, Iterator, List, Optional, Tuple
+
+
+# Level verbosity
+LEVEL_OFF = 0        # Tidak ada event
+LEVEL_SUMMARY = 1    # Ringkasan generasi
+LEVEL_EVENTS = 2     # + lap, death, stuck, cull, budget reset
+LEVEL_DEBUG = 3      # + setiap checkpoint
+
+# Jenis event
+EVENT_CHECKPOINT = 1
+EVENT_LAP = 2
+EVENT_DEATH = 3
+EVENT_STUCK = 4
+EVENT_BUDGET_RESET = 5
+EVENT_GENERATION = 6
+EVENT_CULL = 7
+
+# Header semua record (nama field, format struct)
+HEADER_FIELDS = (("generation", "H"), ("tick", "I"), ("motor", "i"))
+
+# kind -> (nama, level minimum, field tambahan)
+EVENT_SCHEMAS: Dict[int, Tuple[str, int, Tuple[Tuple[str, str], ...]]] = {
+    EVENT_CHECKPOINT: ("checkpoint", LEVEL_DEBUG, (("checkpoint", "B"), ("next", "B"))),
+    EVENT_LAP: ("lap", LEVEL_EVENTS, (("lap", "H"), ("lap_time", "I"))),
+    EVENT_DEATH: ("death", LEVEL_EVENTS, (("fitness", "d"),)),
+    EVENT_STUCK: ("stuck", LEVEL_EVENTS, (("idle_ticks", "I"),)),
+    EVENT_BUDGET_RESET: ("budget_reset", LEVEL_EVENTS, (("lap", "H"),)),
+    EVENT_GENERATION: ("generation", LEVEL_SUMMARY, (("alive", "I"), ("best_fitness", "d"),
+                                                     ("mean_fitness", "d"), ("elapsed", "d"))),
+    EVENT_CULL: ("cull", LEVEL_EVENTS, (("progress", "H"), ("fitness", "d"))),
+}
+
+FORMATS = ("jsonl", "binary")
+
+# Magic di awal file binary (versi format di byte terakhir)
+BINARY_MAGIC = b"MKEV\x01"
+
+_STRUCTS = {
+    kind: struct.Struct("<B" + "".join(fmt for _, fmt in HEADER_FIELDS + fields))
+    for kind, (_, _, fields) in EVENT_SCHEMAS.items()
+}
+
+
+def encode_jsonl(record: tuple) -> str:
+    """Satu record -> satu baris JSON (tanpa newline)."""
+    kind = record[0]
+    name, _, fields = EVENT_SCHEMAS[kind]
+    data = {"event": name}
+    for (field, _), value in zip(HEADER_FIELDS + fields, record[1:]):
+        data[field] = value
+    return json.dumps(data, separators=(",", ":"))
+
+
+def encode_binary(record: tuple) -> bytes:
+    """Satu record -> bytes (kind 1 byte + field sesuai EVENT_SCHEMAS)."""
+    return _STRUCTS[record[0]].pack(*record)
+
+
+def format_text(record: tuple) -> str:
+    """Satu record -> baris ringkas untuk terminal."""
+    kind = record[0]
+    name, _, fields = EVENT_SCHEMAS[kind]
+    pairs = " ".join(f"{field}={value}" for (field, _), value
+                     in zip(HEADER_FIELDS + fields, record[1:]))
+    return f"[{name.upper()}] {pairs}"
+
+
+def read_events(path: str) -> Iterator[dict]:
+    """
+    Baca log (JSON Lines atau binary, dideteksi dari header).
+
+    Returns:
+        Iterator dict per event, field sama dengan encode_jsonl()
+    """
+    with open(path, "rb") as f:
+        magic = f.read(len(BINARY_MAGIC))
+        if magic != BINARY_MAGIC:
+            f.seek(0)
+            for line in f:
+                if line.strip():
+                    yield json.loads(line)
+            return
+
+        while True:
+            code = f.read(1)
+            if not code:
+                return
+            kind = code[0]
+            layout = _STRUCTS[kind]
+            record = layout.unpack(code + f.read(layout.size - 1))
+            yield json.loads(encode_jsonl(record))
+
+
+class EventLog:
+    """
+    Buffer event + sink file (JSON Lines / binary).
+
+    File baru dibuat saat batch pertama ditulis, jadi level rendah tidak
+    meninggalkan file kosong.
+    """
+
+    def __init__(self, level: int = LEVEL_EVENTS, path: Optional[str] = None,
+                 fmt: str = "jsonl", threaded: bool = False,
+                 buffer_size: int = 1024, echo: bool = False):
+        """
+        Args:
+            level: LEVEL_*, event dengan level lebih tinggi dibuang
+            path: File output, None = cuma buffer (ambil dengan drain())
+            fmt: "jsonl" atau "binary"
+            threaded: Tulis file (dan echo) di thread background
+            buffer_size: Jumlah record sebelum buffer di-flush otomatis
+            echo: Cetak juga ringkasan tiap event ke stdout (lewat sink)
+        """
+        if fmt not in FORMATS:
+            raise ValueError(f"Format log tidak dikenal: {fmt} (pilih {', '.join(FORMATS)})")
+
+        self.level = level
+        self.path = path
+        self.fmt = fmt
+        self.echo = echo
+        self.buffer_size = max(1, buffer_size)
+        self.generation = 0
+        self.counts: Dict[int, int] = {kind: 0 for kind in EVENT_SCHEMAS}
+
+        # kind -> aktif di level ini (lookup cepat di emit)
+        self._enabled = {kind: schema[1] <= level for kind, schema in EVENT_SCHEMAS.items()}
+        self._buffer: List[tuple] = []
+        self._file = None
+
+        self._queue: Optional[queue.Queue] = None
+        self._thread: Optional[threading.Thread] = None
+        if threaded and (path is not None or echo):
+            self._queue = queue.Queue()
+            self._thread = threading.Thread(target=self._writer_loop, name="EventLog",
+                                            daemon=True)
+            self._thread.start()
+
+    def enabled(self, kind: int) -> bool:
+        """Apakah event `kind` dicatat di level ini."""
+        return self._enabled[kind]
+
+    def emit(self, kind: int, tick: int, motor: int, *values) -> None:
+        """Catat satu event (tanpa I/O kecuali buffer penuh)."""
+        if not self._enabled[kind]:
+            return
+        self._buffer.append((kind, self.generation, tick, motor) + values)
+        self.counts[kind] += 1
+        if len(self._buffer) >= self.buffer_size and (self.path is not None or self.echo):
+            self.flush()
+
+    def extend(self, records: List[tuple]) -> None:
+        """Tambah record yang sudah jadi (misal hasil drain() di worker)."""
+        for record in records:
+            if self._enabled[record[0]]:
+                self._buffer.append(record)
+                self.counts[record[0]] += 1
+        if len(self._buffer) >= self.buffer_size and (self.path is not None or self.echo):
+            self.flush()
+
+    def drain(self) -> List[tuple]:
+        """Ambil dan kosongkan buffer (tanpa menulis apa pun)."""
+        records = self._buffer
+        self._buffer = []
+        return records
+
+    def flush(self) -> None:
+        """Kirim buffer ke sink (thread background atau langsung)."""
+        if not self._buffer:
+            return
+        records = self.drain()
+        if self.path is None and not self.echo:
+            return
+        if self._queue is not None:
+            self._queue.put(records)
+        else:
+            self._write(records)
+
+    def close(self) -> None:
+        """Flush sisa buffer, hentikan thread, tutup file."""
+        self.flush()
+        if self._thread is not None:
+            self._queue.put(None)
+            self._thread.join()
+            self._thread = None
+            self._queue = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def _writer_loop(self) -> None:
+        while True:
+            records = self._queue.get()
+            if records is None:
+                break
+            self._write(records)
+
+    def _write(self, records: List[tuple]) -> None:
+        if self.path is not None:
+            if self._file is None:
+                self._open()
+            if self.fmt == "binary":
+                self._file.write(b"".join(encode_binary(record) for record in records))
+            else:
+                self._file.write("".join(encode_jsonl(record) + "\n" for record in records))
+            self._file.flush()
+
+        if self.echo:
+            sys.stdout.write("".join(format_text(record) + "\n" for record in records))
+            sys.stdout.flush()
+
+    def _open(self) -> None:
+        folder = os.path.dirname(self.path)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        if self.fmt == "binary":
+            self._file = open(self.path, "wb")
+            self._file.write(BINARY_MAGIC)
+        else:
+            self._file = open(self.path, "w", encoding="utf-8")
@@ -4,13 +4,37 @@ Game Manager Module
 
 Mengelola loading dan setup game assets (track, masking, spawn).
 Digunakan oleh main.py dan trainer.py.
+
+pygame hanya di-import saat benar-benar decode gambar (render track atau
+masking yang belum ada di MapCache), jadi worker training headless tidak
+perlu pygame sama sekali.
 """
 
 import os
-import pygame
-from typing import Tuple, Optional
+import struct
+from typing import Tuple, Optional, TYPE_CHECKING
 from dataclasses import dataclass
 
+from core.zone_grid import ZoneGrid
+from core.distance_field import DistanceField
+from core.progress_field import ProgressField
+from core.visit_grid import VisitGrid, get_visit_grid
+from core.map_cache import MapCache
+
+if TYPE_CHECKING:
+    import pygame
+
+
+def _read_image_size(path: str) -> Tuple[int, int]:
+    """Ukuran gambar (width, height), untuk PNG cukup baca header IHDR."""
+    with open(path, 'rb') as f:
+        header = f.read(24)
+    if header[:8] == b'\x89PNG\r\n\x1a\n' and header[12:16] == b'IHDR':
+        return struct.unpack('>II', header[16:24])
+    
+    import pygame
+    return pygame.image.load(path).get_size()
+
 
 @dataclass
 class GameConfig:
@@ -32,6 +56,23 @@ class GameConfig:
     masking_file: str = "ai_masking-4.png"
     masking_subfolder: str = "masking"
     
+    # Radar sphere tracing pakai distance field
+    use_distance_field: bool = False
+    
+    # Progress sepanjang track (ProgressField) untuk fitness, ranking, stuck
+    use_progress_field: bool = True
+    
+    # Cache artefak map (zone grid, distance field) di <base_dir>/cache/maps
+    use_map_cache: bool = True
+    
+    # Swept collision (garis antar posisi dicek ke wall, anti tunneling)
+    swept_collision: bool = True
+    
+    # Interaksi antar motor (MotorContacts): dorongan saat bersentuhan dan
+    # input radar lawan terdekat (network butuh num_radars + 1 input)
+    motor_contact: bool = False
+    opponent_radar: bool = False
+    
     # Display
     fullscreen: bool = True
     screen_width: int = 1280
@@ -44,7 +85,7 @@ class GameManager:
     
     Menangani:
     - Loading track surface
-    - Loading masking surface
+    - Loading masking (ZoneGrid resolusi asli)
     - Kalkulasi spawn position
     - Create Motor instances
     """
@@ -61,23 +102,37 @@ class GameManager:
         self.assets_dir = os.path.join(base_dir, "assets")
         self.config = config or GameConfig()
         
-        # Surfaces
-        self.track_surface: Optional[pygame.Surface] = None
-        self.masking_surface: Optional[pygame.Surface] = None
+        # Surfaces (masking_surface hanya di-set manual, load_masking
+        # cukup membangun ZoneGrid). track_surface ukuran map hanya dibuat
+        # kalau masking tidak ada (fallback radar), render pakai tile display.
+        self.track_surface: Optional["pygame.Surface"] = None
+        self._track_path: Optional[str] = None
+        self.masking_surface: Optional["pygame.Surface"] = None
+        self.zone_grid: Optional[ZoneGrid] = None
+        self.distance_field: Optional[DistanceField] = None
+        self.progress_field: Optional[ProgressField] = None
+        self.visit_grid: Optional[VisitGrid] = None  # Di-set saat load_track (ukuran map)
+        self.map_cache: Optional[MapCache] = None
+        self.cache_root = os.path.join(base_dir, "cache", "maps")
         
         # Map dimensions (setelah scaling)
         self.map_width: int = 0 
         self.map_height: int = 0
     
-    def load_track(self, track_name: str = None) -> pygame.Surface:
+    def load_track(self, track_name: str = None, render: bool = True) -> Optional["pygame.Surface"]:
         """
-        Load dan scale track surface.
+        Load track dan hitung ukuran map (setelah scale).
+        
+        Gambar track tidak di-scale di sini: DisplayManager.set_track
+        membuat tile ukuran map langsung dari gambar asli.
         
         Args:
             track_name: Nama track (tanpa .png), atau None untuk pakai config
+            render: False = cuma hitung ukuran map tanpa decode gambar
+                (headless training tidak butuh surface track)
             
         Returns:
-            Scaled track surface
+            Surface track resolusi asli, atau None jika render=False
         """
         if track_name is None:
             track_name = self.config.track_name
@@ -87,32 +142,48 @@ class GameManager:
         if not os.path.exists(track_path):
             raise FileNotFoundError(f"Track tidak ditemukan: {track_path}")
         
-        # Load dan scale
-        self.track_surface = pygame.image.load(track_path)
-        original_w, original_h = self.track_surface.get_size()
+        if not render:
+            original_w, original_h = _read_image_size(track_path)
+            self.map_width = int(original_w * self.config.track_scale)
+            self.map_height = int(original_h * self.config.track_scale)
+            self.track_surface = None
+            self._track_path = None
+            self.visit_grid = get_visit_grid(self.map_width, self.map_height)
+            
+            print(f"Track      : {track_name}.png (tanpa render)")
+            print(f"Map Size   : {self.map_width}x{self.map_height} (scaled {self.config.track_scale}x)")
+            return None
+        
+        import pygame
+        
+        track_image = pygame.image.load(track_path)
+        original_w, original_h = track_image.get_size()
         
         self.map_width = int(original_w * self.config.track_scale)
         self.map_height = int(original_h * self.config.track_scale)
-        
-        self.track_surface = pygame.transform.scale(
-            self.track_surface,
-            (self.map_width, self.map_height)
-        )
+        self.visit_grid = get_visit_grid(self.map_width, self.map_height)
+        self.track_surface = None
+        self._track_path = track_path
         
         print(f"Track      : {track_name}.png")
         print(f"Map Size   : {self.map_width}x{self.map_height} (scaled {self.config.track_scale}x)")
         
-        return self.track_surface
+        return track_image
     
-    def load_masking(self, masking_file: str = None) -> Optional[pygame.Surface]:
+    def load_masking(self, masking_file: str = None) -> Optional[ZoneGrid]:
         """
-        Load dan scale masking surface.
+        Load masking dan bangun ZoneGrid sekali.
+        
+        Masking tidak di-scale ke ukuran map: ZoneGrid disimpan di resolusi
+        asli (1 byte/pixel) dan koordinat world dipetakan saat query.
+        Kalau ada di MapCache, grid (dan distance field) cukup di-mmap
+        tanpa decode PNG.
         
         Args:
             masking_file: Nama file masking, atau None untuk pakai config
             
         Returns:
-            Scaled masking surface, atau None jika tidak ditemukan
+            ZoneGrid, atau None jika masking tidak ditemukan
         """
         if masking_file is None:
             masking_file = self.config.masking_file
@@ -126,17 +197,49 @@ class GameManager:
         
         if not os.path.exists(masking_path):
             print(f"Masking    : Not found at {masking_path}")
+            if self._track_path is not None:
+                # Tanpa masking, radar raycast di track surface ukuran map
+                import pygame
+                self.track_surface = pygame.transform.scale(
+                    pygame.image.load(self._track_path),
+                    (self.map_width, self.map_height)
+                )
             return None
         
-        self.masking_surface = pygame.image.load(masking_path)
-        self.masking_surface = pygame.transform.scale(
-            self.masking_surface,
-            (self.map_width, self.map_height)
-        )
+        map_size = (self.map_width, self.map_height)
+        if self.config.use_map_cache:
+            self.map_cache = MapCache.for_source(self.cache_root, masking_path,
+                                                 self.config.track_scale, map_size)
+        
+        zones = self.map_cache.load("zones") if self.map_cache else None
+        if zones is not None:
+            self.zone_grid = ZoneGrid(zones, map_size, walls=self.map_cache.load("walls"))
+            source = "cache"
+        else:
+            import pygame
+            
+            # Klasifikasi warna cukup sekali di sini, bukan per frame per motor
+            masking = pygame.image.load(masking_path)
+            self.zone_grid = ZoneGrid.from_surface(masking, map_size)
+            del masking
+            source = "png"
+            
+            if self.map_cache:
+                self.map_cache.save("zones", self.zone_grid.zones)
+                self.map_cache.save("walls", self.zone_grid.native_wall_mask())
+        
+        print(f"Masking    : Loaded ({self.zone_grid.native_width}x{self.zone_grid.native_height}"
+              f" -> {self.map_width}x{self.map_height}, {source})")
         
-        print(f"Masking    : Loaded ({self.map_width}x{self.map_height})")
+        if self.config.use_distance_field:
+            self.distance_field = DistanceField.load_or_build(self.zone_grid, self.map_cache)
+            print(f"Dist Field : Loaded (max {self.distance_field.distances.max()} px)")
         
-        return self.masking_surface
+        if self.config.use_progress_field:
+            self.progress_field = ProgressField.load_or_build(self.zone_grid, self.map_cache)
+            print(f"Progress   : Loaded (lap {self.progress_field.lap_length:.0f} px)")
+        
+        return self.zone_grid
     
     def get_spawn_position(self) -> Tuple[int, int]:
         """
@@ -185,6 +288,19 @@ class GameManager:
         if self.masking_surface is not None:
             motor.set_masking_surface(self.masking_surface)
         
+        if self.zone_grid is not None:
+            motor.set_zone_grid(self.zone_grid)
+        
+        if self.distance_field is not None:
+            motor.set_distance_field(self.distance_field)
+        
+        if self.visit_grid is not None:
+            motor.set_visit_grid(self.visit_grid)
+        
+        if self.progress_field is not None:
+            motor.set_progress_field(self.progress_field)
+        
+        motor.collision.swept = self.config.swept_collision
         motor.invincible = invincible
         
         return motor
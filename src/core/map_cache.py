@@ -0,0 +1,120 @@
+"""
+Map Cache Module
+================
+
+Cache on-disk untuk artefak map hasil precompute (zone grid, wall bitmap,
+distance field, dll). Disimpan sebagai .npy biasa dan di-load dengan
+mmap, jadi startup game dan spawn worker training tidak perlu decode
+PNG atau hitung ulang apa pun.
+
+Layout:
+    cache/maps/v{CACHE_VERSION}/{stem}-{hash}-x{scale}-{width}x{height}/
+        meta.json
+        zones.npy
+        walls.npy
+        distance-c64.npy
+        progress.npy, progress-lengths.npy
+
+Key direktori = hash isi file masking + scale + ukuran world, jadi
+masking yang diedit otomatis dapat cache baru. Naikkan CACHE_VERSION
+kalau format atau aturan klasifikasi berubah.
+"""
+
+import hashlib
+import json
+import os
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+
+CACHE_VERSION = 1
+
+
+def file_digest(path: str, chunk_size: int = 1 << 20) -> str:
+    """SHA-1 hex dari isi file."""
+    sha = hashlib.sha1()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            sha.update(chunk)
+    return sha.hexdigest()
+
+
+class MapCache:
+    """
+    Satu direktori cache untuk satu kombinasi (gambar sumber, scale, ukuran).
+
+    Usage:
+        cache = MapCache.for_source(cache_root, masking_path, 3.0, (w, h))
+        zones = cache.load("zones")              # None kalau belum ada
+        field = cache.get_or_build("distance-c64", build_fn)
+    """
+
+    def __init__(self, directory: str):
+        self.directory = directory
+        self._meta: Optional[dict] = None
+
+    @classmethod
+    def for_source(cls, cache_root: str, source_path: str, scale: float,
+                   size: Tuple[int, int]) -> "MapCache":
+        """
+        Args:
+            cache_root: Root cache (misal <project>/cache/maps)
+            source_path: Gambar sumber (masking)
+            scale: TRACK_SCALE
+            size: Ukuran world (width, height)
+        """
+        stem = os.path.splitext(os.path.basename(source_path))[0]
+        digest = file_digest(source_path)[:16]
+        width, height = size
+        name = f"{stem}-{digest}-x{scale:g}-{width}x{height}"
+        cache = cls(os.path.join(cache_root, f"v{CACHE_VERSION}", name))
+        cache._meta = {
+            'version': CACHE_VERSION,
+            'source': os.path.basename(source_path),
+            'sha1': digest,
+            'scale': scale,
+            'size': [width, height],
+        }
+        return cache
+
+    def path(self, name: str) -> str:
+        return os.path.join(self.directory, f"{name}.npy")
+
+    def load(self, name: str) -> Optional[np.ndarray]:
+        """Load artefak sebagai memmap read-only, None jika belum ada/rusak."""
+        path = self.path(name)
+        if not os.path.exists(path):
+            return None
+        try:
+            return np.load(path, mmap_mode='r')
+        except (OSError, ValueError) as e:
+            print(f"[WARN] Cache map rusak, dihitung ulang: {path} ({e})")
+            return None
+
+    def save(self, name: str, array: np.ndarray) -> None:
+        """
+        Simpan artefak secara atomic (tulis file sementara lalu rename),
+        aman kalau beberapa proses worker menulis bersamaan.
+        """
+        try:
+            os.makedirs(self.directory, exist_ok=True)
+            meta_path = os.path.join(self.directory, "meta.json")
+            if self._meta and not os.path.exists(meta_path):
+                with open(meta_path, 'w') as f:
+                    json.dump(self._meta, f, indent=2)
+
+            tmp_path = f"{self.path(name)}.{os.getpid()}.tmp"
+            with open(tmp_path, 'wb') as f:
+                np.save(f, np.ascontiguousarray(array))
+            os.replace(tmp_path, self.path(name))
+        except OSError as e:
+            print(f"[WARN] Gagal simpan cache map '{name}': {e}")
+
+    def get_or_build(self, name: str, build: Callable[[], np.ndarray]) -> np.ndarray:
+        """Load artefak dari cache, atau panggil build() lalu simpan."""
+        array = self.load(name)
+        if array is None:
+            array = build()
+            self.save(name, array)
+        return array
@@ -1,13 +1,16 @@
 
-import pygame
 import math
 import os
-from typing import Optional, List, Tuple
+from typing import Optional, List, Tuple, TYPE_CHECKING
 
 from core.physics import PhysicsConfig, PhysicsEngine
 from core.collision import CollisionHandler
 from core.checkpoint import CheckpointTracker
 from core.radar import Radar, FitnessCalculator, RadarConfig
+from core.sprite_cache import get_motor_rotations, heading_index
+
+if TYPE_CHECKING:
+    import pygame
 
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 ASSETS_DIR = os.path.join(BASE_DIR, "assets")
@@ -41,14 +44,15 @@ class Motor:
         self.radar = Radar(RadarConfig())
         self.fitness_calc = FitnessCalculator(start_x=x, start_y=y)
         
-        # Sprite Setup (Single Image)
-        self.frames: List[pygame.Surface] = []
+        # Sprite Setup (Single Image). Di-load saat draw() pertama, jadi
+        # simulasi headless tidak pernah menyentuh pygame/sprite.
+        self.frames: List["pygame.Surface"] = []
         self.current_frame = 0
         self.use_sprite = False
         self.surface = None
         self.total_frames = 0
-        
-        self._load_single_sprite(color)
+        self.rotations: List["pygame.Surface"] = []  # Sprite per heading (cache)
+        self.sprite_loaded = False
         
         # State
         self.alive = True
@@ -59,6 +63,9 @@ class Motor:
         self.start_angle = 0
         self.steering_input = 0
         
+        # True jika radar dihitung dari luar (BatchRadar untuk seluruh populasi)
+        self.external_radar = False
+        
         # Respawn state (untuk animasi kelap-kelip dan stun)
         self.respawning = False
         self.respawn_timer = 0  # Frame counter untuk stun
@@ -69,32 +76,26 @@ class Motor:
         self.track_surface = None
         self.masking_surface = None
         self.rect = None
+        
+        # (x, y, angle) di awal tick terakhir, untuk interpolasi render
+        self.prev_state = (x, y, self.angle)
     
     def _load_single_sprite(self, color: str) -> None:
         """
-        Load SATU gambar saja (misal: pink.png).
-        Tidak ada loop animasi.
+        Ambil SATU gambar saja (misal: pink.png) dari sprite cache,
+        sudah di-rotate ke semua heading. Tidak ada loop animasi.
+        Butuh display pygame (convert_alpha).
         """
-        self.frames = []
-        self.use_sprite = False
+        import pygame
         
-        # Path: assets/motor/pink.png
-        sprite_path = os.path.join(ASSETS_DIR, "motor", f"{color}.png")
+        self.sprite_loaded = True
+        rotations = get_motor_rotations(color, (self.length, self.width))
         
-        if os.path.exists(sprite_path):
-            try:
-                # Load & Process
-                frame = pygame.image.load(sprite_path).convert_alpha()
-                rotated = pygame.transform.rotate(frame, -90) # Sesuaikan rotasi asli asset
-                scaled = pygame.transform.scale(rotated, (self.length, self.width))
-                
-                self.frames.append(scaled)
-                self.use_sprite = True
-                self.total_frames = 1
-            except Exception as e:
-                print(f"[ERROR] Gagal load sprite {color}: {e}")
-        else:
-            print(f"[WARN] Sprite tidak ditemukan: {sprite_path}")
+        # Surface dipakai bersama semua motor warna ini, bukan milik motor
+        self.rotations = rotations or []
+        self.frames = self.rotations[:1]
+        self.use_sprite = bool(self.rotations)
+        self.total_frames = len(self.frames)
             
         # Fallback jika gagal load
         if not self.use_sprite:
@@ -136,6 +137,8 @@ class Motor:
     
     def handle_input(self, keys) -> None:
         """Handle keyboard input untuk player."""
+        import pygame
+        
         # Jika sedang respawning (stun), blokir input
         if self.respawning:
             return
@@ -190,9 +193,10 @@ class Motor:
                 elif not self.collision.check_track_collision(self.x, new_y): self.y = new_y
                 else: self.physics.state.velocity *= 0.5
              else: self.x, self.y = new_x, new_y
-        elif self.masking_surface is not None:
+        elif self.masking_surface is not None or self.collision.zone_grid is not None:
             self.x, self.y = new_x, new_y
-            result = self.collision.check_masking_collision(self.x, self.y, self.angle)
+            result = self.collision.check_masking_collision(self.x, self.y, self.angle,
+                                                            prev_x, prev_y)
             if result['out_of_bounds']:
                 if not self.invincible: self.alive = False; self.is_alive = False
                 else: self.x, self.y = prev_x, prev_y; self.physics.state.velocity *= -0.3
@@ -226,25 +230,68 @@ class Motor:
         
         # AI Update
         self.fitness_calc.update(self.x, self.y, self.angle - prev_angle)
+        self.fitness_calc.update_progress(self.x, self.y, self.lap_count, self.checkpoint_count)
         lap_result = self.checkpoint.check_lap(self.x, self.y, self.time_spent, self.invincible, "AI")
         if lap_result['should_die']: self.alive = False; self.is_alive = False
         
-        surface = self.collision.get_surface_for_radar()
-        if surface: self.radar.update(self.x, self.y, self.angle, surface)
+        # Radar di-skip kalau sudah diisi dari luar (BatchRadar)
+        if not self.external_radar:
+            if self.radar.distance_field is not None:
+                self.radar.update_from_field(self.x, self.y, self.angle, self.radar.distance_field)
+            elif self.collision.zone_grid is not None:
+                self.radar.update_from_grid(self.x, self.y, self.angle, self.collision.zone_grid)
+            else:
+                surface = self.collision.get_surface_for_radar()
+                if surface: self.radar.update(self.x, self.y, self.angle, surface)
         if self.fitness_calc.is_stuck(30) and not self.invincible: self.alive = False; self.is_alive = False
         self.is_alive = self.alive
 
     def reset(self, x: float = None, y: float = None, angle: float = None) -> None:
+        self.reset_state(x, y, angle)
+        self.stop_all_sounds()
+        self.start_engine()
+    
+    def reset_state(self, x: float = None, y: float = None, angle: float = None) -> None:
+        """
+        Reset state simulasi in-place, hasilnya sama dengan Motor baru.
+        
+        Tidak menyentuh audio maupun sprite, jadi aman dipakai untuk
+        memakai ulang motor training antar generasi.
+        """
         self.x = x if x is not None else self.start_x
         self.y = y if y is not None else self.start_y
         self.angle = angle if angle is not None else self.start_angle
         self.alive = True; self.is_alive = True
+        self.respawning = False
+        self.respawn_timer = 0
+        self.steering_input = 0
         self.physics.reset()
         self.checkpoint.reset(self.x, self.y)
         self.fitness_calc.reset(self.x, self.y)
         self.radar.radars.clear()
-        self.stop_all_sounds()
-        self.start_engine()
+        self.prev_state = (self.x, self.y, self.angle)
+    
+    def begin_tick(self) -> None:
+        """Simpan posisi sebelum tick simulasi (sebelum input & update)."""
+        self.prev_state = (self.x, self.y, self.angle)
+    
+    def render_position(self, alpha: float = 1.0) -> Tuple[float, float, float]:
+        """
+        Posisi untuk render, interpolasi antara awal tick terakhir dan
+        posisi sekarang.
+        
+        Args:
+            alpha: 0 = awal tick, 1 = posisi sekarang
+            
+        Returns:
+            Tuple (x, y, angle)
+        """
+        if alpha >= 1.0 or self.respawning:
+            return self.x, self.y, self.angle
+        prev_x, prev_y, prev_angle = self.prev_state
+        return (prev_x + (self.x - prev_x) * alpha,
+                prev_y + (self.y - prev_y) * alpha,
+                prev_angle + (self.angle - prev_angle) * alpha)
     
     @property
     def velocity(self) -> float: return self.physics.state.velocity
@@ -258,6 +305,22 @@ class Motor:
     @distance_traveled.setter
     def distance_traveled(self, value: float): self.fitness_calc.state.distance_traveled = value
     
+    @property
+    def track_progress(self) -> float: return self.fitness_calc.state.track_progress
+    
+    @property
+    def progress_gain(self) -> float: return self.fitness_calc.progress_gain
+    
+    @property
+    def progress_idle(self) -> int: return self.fitness_calc.state.progress_idle
+    
+    @property
+    def race_progress(self) -> float:
+        """Key ranking: progress track, atau jarak tempuh kalau tanpa progress field."""
+        if self.fitness_calc.progress_field is None:
+            return self.distance_traveled
+        return self.track_progress
+    
     @property
     def lap_count(self) -> int: return self.checkpoint.state.lap_count
     
@@ -293,6 +356,8 @@ class Motor:
     @property
     def total_rotation(self) -> float: return self.fitness_calc.state.total_rotation
     @property
+    def novelty(self) -> int: return self.fitness_calc.state.novelty
+    @property
     def expected_checkpoint(self) -> int: return self.checkpoint.state.expected_checkpoint
     @property
     def on_checkpoint(self) -> bool: return self.checkpoint.state.on_checkpoint
@@ -300,6 +365,10 @@ class Motor:
     def set_track(self, t): self.track = t; self.collision.set_track(t); 
     def set_track_surface(self, s): self.track_surface = s; self.collision.set_track_surface(s)
     def set_masking_surface(self, s): self.masking_surface = s; self.collision.set_masking_surface(s)
+    def set_zone_grid(self, g): self.collision.set_zone_grid(g)
+    def set_distance_field(self, f): self.radar.distance_field = f
+    def set_progress_field(self, f): self.fitness_calc.set_progress_field(f)
+    def set_visit_grid(self, g): self.fitness_calc.set_visit_grid(g)
     def get_state(self): return (self.x, self.y, self.angle, self.velocity, self.alive)
     def get_radar_data(self): return self.radar.get_data()
     def get_speed_kmh(self): return self.physics.get_speed_kmh()
@@ -308,8 +377,13 @@ class Motor:
         self.physics.apply_acceleration(t)
         self.angle += self.physics.apply_steering(self.steering_input)
 
-    def draw(self, screen, camera_or_x, camera_y: int = None) -> None:
-        """Render motor."""
+    def draw(self, screen, camera_or_x, camera_y: int = None, alpha: float = 1.0) -> None:
+        """Render motor (alpha = interpolasi tick, lihat render_position)."""
+        import pygame
+        
+        if not self.sprite_loaded:
+            self._load_single_sprite(self.color)
+        
         # Skip render saat respawn blink (kelap-kelip)
         if self.respawning:
             # Blink: visible setiap setengah interval
@@ -321,12 +395,11 @@ class Motor:
         else:
             cam_x, cam_y = camera_or_x.x, camera_or_x.y
         
-        if self.use_sprite and self.frames:
-            current_surface = self.frames[0]
+        x, y, angle = self.render_position(alpha)
+        if self.use_sprite and self.rotations:
+            rotated = self.rotations[heading_index(angle, len(self.rotations))]
         else:
-            current_surface = self.surface
-        
-        rotated = pygame.transform.rotate(current_surface, -math.degrees(self.angle))
-        rect = rotated.get_rect(center=(self.x - cam_x, self.y - cam_y))
+            rotated = pygame.transform.rotate(self.surface, -math.degrees(angle))
+        rect = rotated.get_rect(center=(x - cam_x, y - cam_y))
         screen.blit(rotated, rect)
         self.rect = rect
\ No newline at end of file
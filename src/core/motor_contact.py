@@ -0,0 +1,164 @@
+"""
+Motor Contact Module
+====================
+
+Interaksi antar motor di atas SpatialHash:
+
+- Contact: motor yang center-nya lebih dekat dari `distance` didorong
+  menjauh (masing-masing setengah overlap) dan kecepatannya diredam.
+- Radar lawan: jarak ke motor lain terdekat, skala 0-10 sama dengan
+  Radar.get_data(), bisa ditambahkan sebagai input network.
+
+Posisi di-sync ke grid sekali per tick (incremental), jadi biaya per
+tick linear terhadap jumlah motor. Motor mati dan yang sedang respawn
+dikeluarkan dari grid (tidak bisa ditabrak).
+"""
+
+from dataclasses import dataclass
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from core.spatial_hash import SpatialHash
+from core.zone_grid import ZONE_WALL, ZONE_OUT
+
+
+@dataclass
+class ContactConfig:
+    """Konfigurasi contact dan radar lawan."""
+    distance: float = 30.0       # Jarak center minimum (~ hitbox motor)
+    damping: float = 0.7         # Faktor kecepatan setelah tabrakan
+    sensor_range: float = 300.0  # Jangkauan radar lawan (sama dengan radar wall)
+    cell_size: float = 100.0     # Cell SpatialHash (>= distance)
+
+
+class MotorContacts:
+    """
+    Contact dan radar lawan untuk satu kelompok motor.
+
+    Key di grid adalah index motor di list (atau slot VectorMotorPool).
+
+    Usage:
+        contacts = MotorContacts()
+        # setiap tick, setelah semua motor update()
+        contacts.step(motors)
+        inputs = motor.get_radar_data() + [contacts.opponent_reading(i)]
+    """
+
+    def __init__(self, config: ContactConfig = None, contact: bool = True):
+        """
+        Args:
+            config: ContactConfig, None = default
+            contact: False = cuma sync posisi (untuk radar lawan), tanpa dorongan
+        """
+        self.config = config or ContactConfig()
+        self.contact = contact
+        self.grid = SpatialHash(max(self.config.cell_size, self.config.distance))
+        self.contacts = 0  # Jumlah pasangan contact sejak reset()
+
+    def reset(self) -> None:
+        self.grid.clear()
+        self.contacts = 0
+
+    # =========================================================================
+    # List Motor
+    # =========================================================================
+
+    def step(self, motors: List) -> int:
+        """
+        Sync posisi motor ke grid lalu selesaikan contact.
+
+        Returns:
+            Jumlah pasangan contact di tick ini
+        """
+        grid = self.grid
+        for i, motor in enumerate(motors):
+            if motor.alive and not motor.respawning:
+                grid.update(i, motor.x, motor.y)
+            else:
+                grid.remove(i)
+
+        if not self.contact:
+            return 0
+
+        pushes, pairs = self._resolve()
+        for i, (dx, dy) in pushes.items():
+            motor = motors[i]
+            zone_grid = motor.collision.zone_grid
+            new_x, new_y = motor.x + dx, motor.y + dy
+            if zone_grid is None or zone_grid.zone_at(new_x, new_y) not in (ZONE_WALL, ZONE_OUT):
+                motor.x, motor.y = new_x, new_y
+                grid.update(i, new_x, new_y)
+            motor.velocity *= self.config.damping
+        return pairs
+
+    # =========================================================================
+    # VectorMotorPool
+    # =========================================================================
+
+    def step_pool(self, pool) -> int:
+        """Versi step() untuk VectorMotorPool (array x, y, velocity)."""
+        grid = self.grid
+        active = pool.alive[:pool.size] & ~pool.respawning[:pool.size]
+        for i in np.flatnonzero(active).tolist():
+            grid.update(i, float(pool.x[i]), float(pool.y[i]))
+        for i in np.flatnonzero(~active).tolist():
+            grid.remove(i)
+
+        if not self.contact:
+            return 0
+
+        pushes, pairs = self._resolve()
+        zone_grid = pool.zone_grid
+        for i, (dx, dy) in pushes.items():
+            new_x, new_y = pool.x[i] + dx, pool.y[i] + dy
+            if zone_grid.zone_at(new_x, new_y) not in (ZONE_WALL, ZONE_OUT):
+                pool.x[i], pool.y[i] = new_x, new_y
+                grid.update(i, float(new_x), float(new_y))
+            pool.velocity[i] *= self.config.damping
+        return pairs
+
+    # =========================================================================
+    # Query
+    # =========================================================================
+
+    def opponent_distance(self, index: int) -> float:
+        """Jarak ke motor lain terdekat, sensor_range jika tidak ada."""
+        position = self.grid.positions.get(index)
+        if position is None:
+            return self.config.sensor_range
+        nearest = self.grid.nearest(position[0], position[1],
+                                    self.config.sensor_range, exclude=index)
+        return nearest[1] if nearest else self.config.sensor_range
+
+    def opponent_reading(self, index: int) -> int:
+        """Radar lawan skala 0-10 (10 = tidak ada motor dalam jangkauan)."""
+        return int(self.opponent_distance(index) / self.config.sensor_range * 10)
+
+    def opponent_readings(self, count: int) -> np.ndarray:
+        """opponent_reading() untuk index 0..count-1 sebagai array."""
+        return np.array([self.opponent_reading(i) for i in range(count)], dtype=np.float64)
+
+    def _resolve(self) -> Tuple[Dict[int, Tuple[float, float]], int]:
+        """Total dorongan (dx, dy) per motor dan jumlah pasangan yang overlap."""
+        distance = self.config.distance
+        positions = self.grid.positions
+        pushes: Dict[int, Tuple[float, float]] = {}
+
+        pairs = self.grid.pairs(distance)
+        for a, b, dist in pairs:
+            ax, ay = positions[a]
+            bx, by = positions[b]
+            if dist > 1e-6:
+                nx, ny = (bx - ax) / dist, (by - ay) / dist
+            else:
+                nx, ny = 1.0, 0.0  # Posisi sama persis, dorong sepanjang sumbu x
+            half = (distance - dist) / 2
+
+            pax, pay = pushes.get(a, (0.0, 0.0))
+            pbx, pby = pushes.get(b, (0.0, 0.0))
+            pushes[a] = (pax - nx * half, pay - ny * half)
+            pushes[b] = (pbx + nx * half, pby + ny * half)
+
+        self.contacts += len(pairs)
+        return pushes, len(pairs)
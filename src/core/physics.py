@@ -203,5 +203,5 @@ class PhysicsEngine:
         return int(abs(self.state.velocity) * 7.5)
     
     def reset(self) -> None:
-        """Reset state fisika ke default."""
-        self.state = PhysicsState(steering_rate=self.config.base_steering_rate)
+        """Reset state fisika ke default (in-place, tanpa object state baru)."""
+        self.state.__init__(steering_rate=self.config.base_steering_rate)
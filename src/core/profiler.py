@@ -0,0 +1,230 @@
+"""
+Frame Profiler Module
+=====================
+
+Waktu per subsistem (radar, collision, physics, network, render, HUD,
+event pygame, sisa Motor.update) per frame dan per generasi.
+
+Instrumentasi dipasang dengan membungkus method di INSTANCE (misal
+motor.radar.update) dan dilepas lagi dengan uninstall(). Saat profiler
+mati tidak ada wrapper sama sekali, jadi biayanya nol.
+
+Waktu yang dicatat eksklusif: Motor.update yang memanggil radar dan
+collision hanya dihitung sisanya sebagai "motor".
+
+Usage:
+    profiler = FrameProfiler()
+    profiler.instrument_motor(motor)
+    profiler.wrap(display, "render_track", "render")
+    ...
+    profiler.end_frame(frame_seconds)
+    print(profiler.averages())
+    profiler.uninstall()
+"""
+
+import csv
+import json
+import os
+import time
+from collections import deque
+from typing import Callable, Dict, List, Optional
+
+
+# Urutan section untuk overlay dan file output
+SECTIONS = ("motor", "physics", "collision", "radar", "network",
+            "render", "hud", "events")
+
+# Jumlah frame untuk rata-rata overlay
+HISTORY_FRAMES = 60
+
+
+class FrameProfiler:
+    """
+    Akumulator waktu per section dengan wrapper yang bisa dilepas.
+
+    - frame: total per section sejak end_frame() terakhir
+    - history: HISTORY_FRAMES frame terakhir (untuk overlay)
+    - generation: total per section sejak end_generation() terakhir
+    """
+
+    def __init__(self, history: int = HISTORY_FRAMES):
+        self.frame: Dict[str, float] = dict.fromkeys(SECTIONS, 0.0)
+        self.generation: Dict[str, float] = dict.fromkeys(SECTIONS, 0.0)
+        self.history = deque(maxlen=history)
+        self.frames = 0
+        self.generation_frames = 0
+        self.rows: List[dict] = []
+
+        # Waktu anak yang sedang berjalan (untuk waktu eksklusif)
+        self._stack: List[float] = []
+        self._installed: List[tuple] = []
+
+    # =========================================================================
+    # Instrumentasi
+    # =========================================================================
+
+    def wrap(self, owner, name: str, section: str) -> None:
+        """
+        Bungkus owner.name supaya waktunya dicatat ke `section`.
+
+        Wrapper dipasang sebagai atribut owner (instance atau module),
+        atribut asli dikembalikan oleh uninstall().
+        """
+        if section not in self.frame:
+            self.frame[section] = 0.0
+            self.generation[section] = 0.0
+        original = getattr(owner, name)
+        had_attribute = name in getattr(owner, "__dict__", {})
+        setattr(owner, name, self._timed(original, section))
+        self._installed.append((owner, name, original, had_attribute))
+
+    def wrap_prefix(self, owner, prefix: str, section: str) -> None:
+        """wrap() untuk semua method owner yang namanya diawali `prefix`."""
+        for name in dir(owner):
+            if name.startswith(prefix) and callable(getattr(owner, name)):
+                self.wrap(owner, name, section)
+
+    def instrument_motor(self, motor) -> None:
+        """Pasang wrapper di Motor dan komponennya (physics, collision, radar)."""
+        self.wrap(motor, "update", "motor")
+        for name in ("apply_acceleration", "apply_steering", "calculate_movement"):
+            self.wrap(motor.physics, name, "physics")
+        self.wrap(motor.collision, "check_masking_collision", "collision")
+        for name in ("update", "update_from_grid", "update_from_field"):
+            self.wrap(motor.radar, name, "radar")
+
+    def uninstall(self) -> None:
+        """Lepas semua wrapper (urutan terbalik, aman untuk wrap ganda)."""
+        for owner, name, original, had_attribute in reversed(self._installed):
+            if had_attribute:
+                setattr(owner, name, original)
+            else:
+                delattr(owner, name)  # Kembali ke method class
+        self._installed = []
+        self._stack = []
+
+    @property
+    def installed(self) -> bool:
+        return bool(self._installed)
+
+    def _timed(self, function: Callable, section: str) -> Callable:
+        stack = self._stack
+        frame = self.frame
+        clock = time.perf_counter
+
+        def timed(*args, **kwargs):
+            stack.append(0.0)
+            start = clock()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                elapsed = clock() - start
+                child = stack.pop()
+                frame[section] += elapsed - child
+                if stack:
+                    stack[-1] += elapsed
+
+        return timed
+
+    def drain(self) -> Dict[str, float]:
+        """Ambil total frame berjalan lalu reset (shard -> trainer)."""
+        totals = dict(self.frame)
+        for section in self.frame:
+            self.frame[section] = 0.0
+        return totals
+
+    def merge(self, totals: Dict[str, float]) -> None:
+        """Tambah total dari profiler lain (misal proses worker) ke generasi ini."""
+        for section, value in totals.items():
+            self.generation[section] = self.generation.get(section, 0.0) + value
+
+    # =========================================================================
+    # Agregasi
+    # =========================================================================
+
+    def end_frame(self, frame_seconds: Optional[float] = None) -> Dict[str, float]:
+        """
+        Tutup frame: simpan ke history dan total generasi.
+
+        Args:
+            frame_seconds: Durasi frame total, sisanya dicatat sebagai "other"
+
+        Returns:
+            Waktu per section frame ini (detik)
+        """
+        totals = dict(self.frame)
+        if frame_seconds is not None:
+            totals["other"] = max(0.0, frame_seconds - sum(totals.values()))
+        for section, value in totals.items():
+            self.generation[section] = self.generation.get(section, 0.0) + value
+        for section in self.frame:
+            self.frame[section] = 0.0
+
+        self.history.append(totals)
+        self.frames += 1
+        self.generation_frames += 1
+        return totals
+
+    def averages(self) -> Dict[str, float]:
+        """Rata-rata ms per frame per section dari history."""
+        if not self.history:
+            return {}
+        count = len(self.history)
+        sections = {section for totals in self.history for section in totals}
+        return {section: sum(totals.get(section, 0.0) for totals in self.history) * 1000 / count
+                for section in sections}
+
+    def end_generation(self, generation: int, frames: Optional[int] = None, **extra) -> dict:
+        """
+        Ringkasan generasi (total ms dan ms per frame) lalu reset total.
+
+        Frame yang belum ditutup dengan end_frame() ikut dihitung.
+
+        Args:
+            generation: Nomor generasi
+            frames: Jumlah frame/tick generasi ini, None = jumlah end_frame()
+            extra: Kolom tambahan (misal elapsed, motor_ticks)
+
+        Returns:
+            Row yang juga disimpan di self.rows
+        """
+        self.merge(self.drain())
+        if frames is None:
+            frames = self.generation_frames
+        row = {"generation": generation, "frames": frames}
+        row.update(extra)
+        for section, value in self.generation.items():
+            row[f"{section}_ms"] = round(value * 1000, 3)
+            row[f"{section}_ms_per_frame"] = round(value * 1000 / max(1, frames), 5)
+        self.rows.append(row)
+
+        self.generation = {section: 0.0 for section in self.generation}
+        self.generation_frames = 0
+        return row
+
+    # =========================================================================
+    # Output
+    # =========================================================================
+
+    def write_csv(self, path: str) -> None:
+        """Semua row generasi ke CSV (kolom = gabungan semua row)."""
+        _make_parent(path)
+        fields: List[str] = []
+        for row in self.rows:
+            fields.extend(key for key in row if key not in fields)
+        with open(path, "w", newline="", encoding="utf-8") as f:
+            writer = csv.DictWriter(f, fieldnames=fields)
+            writer.writeheader()
+            writer.writerows(self.rows)
+
+    def write_json(self, path: str) -> None:
+        """Semua row generasi ke JSON (list of dict)."""
+        _make_parent(path)
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.rows, f, indent=2)
+
+
+def _make_parent(path: str) -> None:
+    folder = os.path.dirname(path)
+    if folder:
+        os.makedirs(folder, exist_ok=True)
@@ -0,0 +1,217 @@
+"""
+Progress Field Module
+=====================
+
+Field "arc-length sepanjang track" per pixel masking: berapa pixel dari
+garis checkpoint 1 (start) sebuah posisi kalau mengikuti arah balapan
+(CP1 -> CP2 -> CP3 -> CP4 -> CP1). Dipakai untuk progress lap yang
+sebenarnya dengan lookup O(1): fitness, ranking leaderboard, dan deteksi
+motor yang tidak maju (muter di tempat tidak menambah progress).
+
+Cara hitung (sekali per map, lalu di-cache lewat MapCache):
+- BFS jarak geodesik (langkah 4-tetangga) dari tiap garis checkpoint
+  lewat semua pixel non-wall.
+- Segmen k = CP_k -> CP_k+1 dengan panjang L_k = jarak geodesik antar
+  garis. Tiap pixel masuk ke segmen dengan jalan memutar paling kecil
+  (d_k + d_k+1 - L_k), jadi garis checkpoint yang tidak menutup penuh
+  lebar track (bocor lewat slow zone) tidak masalah.
+- Nilai pixel = offset_k + L_k * d_k / (d_k + d_k+1), dalam pixel world
+  (perkiraan, di-scale dari resolusi masking).
+
+Progress lap-aware dihitung dari nilai field + jumlah checkpoint yang
+sudah dilewati (lap_count, checkpoint_count), jadi tidak perlu state
+tambahan dan tidak bisa "melompat" lebih dari setengah lap.
+"""
+
+import math
+from typing import Optional, Tuple
+
+import numpy as np
+
+from core.zone_grid import ZONE_WALL, ZONE_CP1, ZONE_CP4
+
+
+NUM_SEGMENTS = ZONE_CP4 - ZONE_CP1 + 1
+
+
+def _geodesic_distance(passable: np.ndarray, seeds: np.ndarray, width: int) -> np.ndarray:
+    """
+    BFS jarak (langkah 4-tetangga) dari `seeds` di grid flat.
+
+    Args:
+        passable: Array bool flat, border grid harus False (tanpa wrap)
+        seeds: Index flat titik awal
+        width: Lebar grid (stride baris)
+
+    Returns:
+        Array int32 flat, -1 untuk pixel yang tidak terjangkau
+    """
+    dist = np.full(passable.size, -1, dtype=np.int32)
+    dist[seeds] = 0
+    offsets = np.array([-1, 1, -width, width], dtype=np.int64)
+
+    frontier = seeds
+    step = 0
+    while frontier.size:
+        step += 1
+        neighbors = (frontier[:, None] + offsets).ravel()
+        neighbors = neighbors[passable[neighbors] & (dist[neighbors] < 0)]
+        frontier = np.unique(neighbors)
+        dist[frontier] = step
+    return dist
+
+
+def compute_progress_field(zones: np.ndarray, scale: float = 1.0
+                           ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Hitung progress field dari grid zona (resolusi masking).
+
+    Args:
+        zones: Array label ZONE_* (height, width)
+        scale: Pixel world per pixel masking (panjang hasil dalam pixel world)
+
+    Returns:
+        (values, lengths): values float32 (height, width), NaN untuk wall
+        dan pixel yang tidak terjangkau; lengths float64 panjang tiap segmen
+    """
+    zones = np.asarray(zones)
+    height, width = zones.shape
+
+    # Border 1 pixel wall supaya BFS flat tidak wrap ke baris lain
+    padded = np.pad(zones, 1, constant_values=ZONE_WALL).ravel()
+    stride = width + 2
+    passable = padded != ZONE_WALL
+
+    distances = [_geodesic_distance(passable, np.flatnonzero(padded == ZONE_CP1 + k), stride)
+                 for k in range(NUM_SEGMENTS)]
+
+    lengths = np.zeros(NUM_SEGMENTS, dtype=np.float64)
+    best_excess = np.full(padded.size, np.inf)
+    values = np.full(padded.size, np.nan)
+    offset = 0.0
+    for k in range(NUM_SEGMENTS):
+        start, end = distances[k], distances[(k + 1) % NUM_SEGMENTS]
+        reached = (start >= 0) & (end >= 0)
+        if not reached.any():
+            raise ValueError(f"Checkpoint {k + 1} dan {(k + 1) % NUM_SEGMENTS + 1} "
+                             f"tidak terhubung di masking")
+
+        total = (start + end).astype(np.float64)
+        length = total[reached].min()
+        lengths[k] = length
+
+        excess = np.where(reached, total - length, np.inf)
+        closer = excess < best_excess
+        best_excess[closer] = excess[closer]
+        values[closer] = offset + length * start[closer] / np.maximum(total[closer], 1.0)
+        offset += length
+
+    values = values.reshape(height + 2, width + 2)[1:-1, 1:-1] * scale
+    return values.astype(np.float32), lengths * scale
+
+
+class ProgressField:
+    """
+    Lookup progress sepanjang track di posisi world.
+
+    Field disimpan di resolusi masking dengan mapping world -> pixel yang
+    sama dengan ZoneGrid.
+
+    Usage:
+        field = ProgressField.load_or_build(game.zone_grid, game.map_cache)
+        progress = field.progress(x, y, lap_count, checkpoint_count)
+    """
+
+    def __init__(self, values: np.ndarray, lengths: np.ndarray, zone_grid):
+        """
+        Args:
+            values: Array float32 (native_height, native_width), NaN = tidak diketahui
+            lengths: Panjang tiap segmen checkpoint (pixel world)
+            zone_grid: ZoneGrid map (ukuran world dan index per sumbu)
+        """
+        self.values = np.ascontiguousarray(values, dtype=np.float32)
+        self.lengths = np.asarray(lengths, dtype=np.float64)
+        self.offsets = np.concatenate(([0.0], np.cumsum(self.lengths)[:-1]))
+        self.lap_length = float(self.lengths.sum())
+        self.width, self.height = zone_grid.width, zone_grid.height
+        self.native_width = zone_grid.native_width
+        self.x_index = zone_grid.x_index
+        self.y_index = zone_grid.y_index
+
+        # Versi list + view flat untuk lookup scalar cepat dari Python
+        self._x_cells = self.x_index.tolist()
+        self._y_rows = (self.y_index * self.native_width).tolist()
+        self._cells = memoryview(self.values).cast('B').cast('f')
+        self._offsets = self.offsets.tolist()
+
+    @classmethod
+    def load_or_build(cls, zone_grid, cache=None) -> "ProgressField":
+        """
+        Load field dari MapCache (mmap), atau hitung baru dari zone grid.
+
+        Args:
+            zone_grid: ZoneGrid map
+            cache: Optional MapCache, None = selalu hitung
+        """
+        scale = (zone_grid.width / zone_grid.native_width +
+                 zone_grid.height / zone_grid.native_height) / 2
+
+        values = cache.load("progress") if cache else None
+        lengths = cache.load("progress-lengths") if cache else None
+        if values is None or lengths is None:
+            values, lengths = compute_progress_field(zone_grid.zones, scale)
+            if cache:
+                cache.save("progress", values)
+                cache.save("progress-lengths", lengths)
+        return cls(values, lengths, zone_grid)
+
+    def value_at(self, x: float, y: float) -> float:
+        """Posisi dalam lap (0..lap_length) di (x, y), NaN jika wall/luar map."""
+        ix = int(x)
+        iy = int(y)
+        if ix < 0 or ix >= self.width or iy < 0 or iy >= self.height:
+            return math.nan
+        return self._cells[self._y_rows[iy] + self._x_cells[ix]]
+
+    def values_at(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """Versi vectorized dari value_at()."""
+        ix = np.asarray(xs).astype(np.int64)  # Truncate seperti int()
+        iy = np.asarray(ys).astype(np.int64)
+        inside = (ix >= 0) & (ix < self.width) & (iy >= 0) & (iy < self.height)
+
+        result = np.full(ix.shape, np.nan, dtype=np.float64)
+        result[inside] = self.values[self.y_index[iy[inside]], self.x_index[ix[inside]]]
+        return result
+
+    def progress(self, x: float, y: float, lap_count: int,
+                 checkpoint_count: int) -> Optional[float]:
+        """
+        Progress total sejak garis start (pixel world, lap-aware).
+
+        Checkpoint terakhir yang dilewati jadi acuan, posisi field dihitung
+        relatif terhadapnya dalam rentang +- setengah lap (mundur melewati
+        checkpoint = progress berkurang).
+
+        Returns:
+            Progress, atau None jika posisi tidak ada di field
+        """
+        value = self.value_at(x, y)
+        if value != value:  # NaN
+            return None
+        passed = lap_count * NUM_SEGMENTS + checkpoint_count - 1
+        laps, segment = divmod(passed, NUM_SEGMENTS)
+        anchor = self._offsets[segment]
+        half = self.lap_length / 2
+        delta = (value - anchor + half) % self.lap_length - half
+        return laps * self.lap_length + anchor + delta
+
+    def progress_batch(self, xs: np.ndarray, ys: np.ndarray, lap_count: np.ndarray,
+                       checkpoint_count: np.ndarray) -> np.ndarray:
+        """Versi vectorized dari progress(), NaN untuk posisi di luar field."""
+        value = self.values_at(xs, ys)
+        passed = np.asarray(lap_count) * NUM_SEGMENTS + np.asarray(checkpoint_count) - 1
+        laps, segment = np.divmod(passed, NUM_SEGMENTS)
+        anchor = self.offsets[segment]
+        half = self.lap_length / 2
+        delta = np.mod(value - anchor + half, self.lap_length) - half
+        return laps * self.lap_length + anchor + delta
@@ -8,8 +8,15 @@ Digunakan dengan composition pattern oleh Motor class.
 
 import math
 from dataclasses import dataclass, field
-from typing import List, Tuple, Optional, Set
-import pygame
+from typing import List, Tuple, Optional, TYPE_CHECKING
+
+from core.zone_grid import ZoneGrid, ZONE_WALL, ZONE_OUT
+from core.distance_field import DistanceField
+from core.progress_field import ProgressField
+from core.visit_grid import VisitGrid, VISIT_CELL_SIZE, get_visit_grid
+
+if TYPE_CHECKING:
+    import pygame
 
 
 @dataclass
@@ -25,8 +32,9 @@ class AIState:
     """State untuk AI tracking dan fitness."""
     time_spent: int = 0
     distance_traveled: float = 0
-    unique_positions: Set[Tuple[int, int]] = field(default_factory=set)
-    last_grid_pos: Optional[Tuple[int, int]] = None
+    novelty: int = 0                      # Jumlah cell VisitGrid berbeda yang dikunjungi
+    last_grid_x: Optional[int] = None     # Cell terakhir (koordinat grid, tanpa batas)
+    last_grid_y: Optional[int] = None
     consecutive_same_pos: int = 0
     max_distance_reached: float = 0
     stuck_timer: int = 0
@@ -34,6 +42,12 @@ class AIState:
     total_rotation: float = 0
     prev_x: float = 0
     prev_y: float = 0
+    
+    # Progress sepanjang track (ProgressField), pixel world sejak garis start
+    track_progress: float = 0
+    start_progress: Optional[float] = None  # Progress di posisi spawn
+    max_progress: float = 0
+    progress_idle: int = 0                  # Tick sejak max_progress terakhir naik
 
 
 class Radar:
@@ -49,9 +63,12 @@ class Radar:
     def __init__(self, config: RadarConfig = None):
         self.config = config or RadarConfig()
         self.radars: List[Tuple[Tuple[int, int], int]] = []
+        
+        # Optional: kalau di-set, update pakai sphere tracing
+        self.distance_field: Optional[DistanceField] = None
     
     def update(self, x: float, y: float, angle: float, 
-               surface: pygame.Surface, masking_mode: bool = True) -> None:
+               surface: "pygame.Surface", masking_mode: bool = True) -> None:
         """
         Update semua radar rays.
         
@@ -112,6 +129,63 @@ class Radar:
             dist = int(math.sqrt((end_x - x)**2 + (end_y - y)**2))
             self.radars.append(((end_x, end_y), dist))
     
+    def update_from_grid(self, x: float, y: float, angle: float,
+                         zone_grid: ZoneGrid) -> None:
+        """
+        Update radar memakai ZoneGrid (setara update() dengan masking_mode).
+        
+        Ray berhenti di wall atau di luar map. Sudut tiap ray cuma
+        dihitung sekali, bukan per step.
+        """
+        self.radars.clear()
+        
+        zone_at = zone_grid.zone_at
+        max_length = self.config.max_length
+        angle_deg = 360 - math.degrees(angle)
+        
+        for degree in self.config.radar_angles:
+            radar_angle = math.radians(360 - (angle_deg + degree))
+            cos_a = math.cos(radar_angle)
+            sin_a = math.sin(radar_angle)
+            
+            length = 0
+            end_x = int(x)
+            end_y = int(y)
+            
+            while length < max_length:
+                end_x = int(x + cos_a * length)
+                end_y = int(y + sin_a * length)
+                
+                zone = zone_at(end_x, end_y)
+                if zone == ZONE_WALL or zone == ZONE_OUT:
+                    break
+                
+                length += 5
+            
+            dist = int(math.sqrt((end_x - x)**2 + (end_y - y)**2))
+            self.radars.append(((end_x, end_y), dist))
+    
+    def update_from_field(self, x: float, y: float, angle: float,
+                          field: DistanceField) -> None:
+        """
+        Update radar dengan sphere tracing di DistanceField.
+        
+        Jumlah step tergantung jarak ke wall, bukan max_length,
+        jadi max_length bisa dinaikkan tanpa bikin radar lebih lambat.
+        """
+        self.radars.clear()
+        
+        max_length = self.config.max_length
+        angle_deg = 360 - math.degrees(angle)
+        
+        for degree in self.config.radar_angles:
+            radar_angle = math.radians(360 - (angle_deg + degree))
+            _, end_x, end_y = field.trace(x, y, math.cos(radar_angle),
+                                          math.sin(radar_angle), max_length)
+            
+            dist = int(math.sqrt((end_x - x)**2 + (end_y - y)**2))
+            self.radars.append(((end_x, end_y), dist))
+    
     def get_data(self) -> List[int]:
         """
         Get normalized radar data untuk neural network.
@@ -125,9 +199,11 @@ class Radar:
                 data[i] = int(radar[1] / 30)  # Normalize to 0-10
         return data
     
-    def draw(self, screen: pygame.Surface, camera_x: int, camera_y: int,
+    def draw(self, screen: "pygame.Surface", camera_x: int, camera_y: int,
              x: float, y: float) -> None:
         """Draw radar lines untuk debug."""
+        import pygame
+        
         for (end_pos, dist) in self.radars:
             color = (0, 255, 0) if dist > 50 else (255, 0, 0)
             pygame.draw.line(
@@ -143,8 +219,39 @@ class FitnessCalculator:
     Calculator untuk fitness score AI.
     """
     
-    def __init__(self, start_x: float = 0, start_y: float = 0):
+    def __init__(self, start_x: float = 0, start_y: float = 0,
+                 visit_grid: Optional[VisitGrid] = None):
         self.state = AIState(prev_x=start_x, prev_y=start_y)
+        
+        # Cell yang sudah dikunjungi (1 byte per cell, layout bersama)
+        self.visit_grid = visit_grid or get_visit_grid()
+        self.visited = self.visit_grid.new_buffer()
+        
+        # Optional: kalau di-set, progress track dihitung tiap update
+        self.progress_field: Optional[ProgressField] = None
+    
+    def set_visit_grid(self, grid: VisitGrid) -> None:
+        """Ganti layout grid kunjungan (misal sesuai ukuran map), kunjungan di-reset."""
+        if grid is not self.visit_grid:
+            self.visit_grid = grid
+            self.visited = grid.new_buffer()
+        self.visit_grid.clear(self.visited)
+        self.state.novelty = 0
+        self.state.last_grid_x = self.state.last_grid_y = None
+    
+    def set_progress_field(self, field: Optional[ProgressField]) -> None:
+        """Pasang progress field, progress dihitung dari posisi sekarang."""
+        self.progress_field = field
+        self._reset_progress()
+    
+    def _reset_progress(self) -> None:
+        """Progress awal dari posisi spawn (prev_x, prev_y)."""
+        if self.progress_field is None:
+            return
+        value = self.progress_field.progress(self.state.prev_x, self.state.prev_y, 0, 0)
+        if value is not None:
+            self.state.track_progress = self.state.max_progress = value
+        self.state.start_progress = value
     
     def update(self, x: float, y: float, angle_change: float) -> None:
         """
@@ -164,16 +271,21 @@ class FitnessCalculator:
         self.state.max_distance_reached = max(self.state.max_distance_reached, 
                                                self.state.distance_traveled)
         
-        # Track unique positions (grid-based)
-        grid_pos = (int(x // 50), int(y // 50))
-        if grid_pos != self.state.last_grid_pos:
-            self.state.unique_positions.add(grid_pos)
+        # Track unique positions (grid-based, O(1) lewat buffer kunjungan)
+        grid_x = int(x // VISIT_CELL_SIZE)
+        grid_y = int(y // VISIT_CELL_SIZE)
+        if grid_x != self.state.last_grid_x or grid_y != self.state.last_grid_y:
+            cell = self.visit_grid.cell_index(grid_x, grid_y)
+            if cell >= 0 and not self.visited[cell]:
+                self.visited[cell] = 1
+                self.state.novelty += 1
             self.state.consecutive_same_pos = 0
             self.state.stuck_timer = 0
         else:
             self.state.consecutive_same_pos += 1
             self.state.stuck_timer += 1
-        self.state.last_grid_pos = grid_pos
+        self.state.last_grid_x = grid_x
+        self.state.last_grid_y = grid_y
         
         # Track rotation
         self.state.total_rotation += abs(math.degrees(angle_change))
@@ -182,6 +294,40 @@ class FitnessCalculator:
         self.state.prev_x = x
         self.state.prev_y = y
     
+    def update_progress(self, x: float, y: float, lap_count: int, checkpoint_count: int) -> None:
+        """
+        Update progress track setelah checkpoint frame ini diproses.
+        Tidak melakukan apa pun tanpa progress field.
+        
+        Args:
+            x, y: Posisi motor
+            lap_count, checkpoint_count: State CheckpointTracker
+        """
+        if self.progress_field is None:
+            return
+        
+        state = self.state
+        value = self.progress_field.progress(x, y, lap_count, checkpoint_count)
+        if value is None:
+            state.progress_idle += 1
+            return
+        
+        if state.start_progress is None:
+            state.start_progress = state.max_progress = value
+        state.track_progress = value
+        if value > state.max_progress:
+            state.max_progress = value
+            state.progress_idle = 0
+        else:
+            state.progress_idle += 1
+    
+    @property
+    def progress_gain(self) -> float:
+        """Progress terjauh sepanjang track sejak spawn (0 tanpa progress field)."""
+        if self.state.start_progress is None:
+            return 0.0
+        return self.state.max_progress - self.state.start_progress
+    
     def calculate(self, lap_count: int = 0) -> float:
         """
         Calculate fitness score.
@@ -194,7 +340,7 @@ class FitnessCalculator:
         """
         if lap_count == 0:
             # Belum complete lap: fokus exploration
-            novelty_score = len(self.state.unique_positions)
+            novelty_score = self.state.novelty
             if novelty_score < 5:
                 return -100
             
@@ -209,7 +355,7 @@ class FitnessCalculator:
             lap_bonus = (lap_count ** 2) * 1000
             efficiency = self.state.distance_traveled / max(self.state.time_spent, 1)
             efficiency_bonus = efficiency * 50
-            novelty_bonus = len(self.state.unique_positions) * 3
+            novelty_bonus = self.state.novelty * 3
             
             return lap_bonus + efficiency_bonus + novelty_bonus
     
@@ -218,5 +364,7 @@ class FitnessCalculator:
         return self.state.stuck_timer > threshold
     
     def reset(self, start_x: float = 0, start_y: float = 0) -> None:
-        """Reset semua tracking state."""
-        self.state = AIState(prev_x=start_x, prev_y=start_y)
+        """Reset semua tracking state (in-place)."""
+        self.state.__init__(prev_x=start_x, prev_y=start_y)
+        self.visit_grid.clear(self.visited)
+        self._reset_progress()
@@ -0,0 +1,161 @@
+"""
+Spatial Hash Module
+===================
+
+Grid seragam (cell persegi) untuk query tetangga antar motor tanpa
+membandingkan semua pasangan (O(N^2)).
+
+- Posisi di-update incremental tiap tick: motor cuma pindah bucket
+  kalau cell-nya berubah.
+- neighbors(): key di sekitar satu titik (radar lawan terdekat).
+- pairs(): semua pasangan yang berdekatan (contact), tiap cell cukup
+  dibandingkan dengan dirinya dan 4 cell tetangga "ke depan", jadi
+  biayanya linear terhadap jumlah motor selama kepadatannya wajar.
+"""
+
+import math
+from typing import Dict, Hashable, List, Optional, Set, Tuple
+
+
+# Cell tetangga yang dicek pairs() (setengah ring, pasangan tidak dobel)
+_FORWARD_CELLS = ((1, -1), (1, 0), (1, 1), (0, 1))
+
+
+class SpatialHash:
+    """
+    Bucket key (misal index motor) per cell grid.
+
+    Usage:
+        grid = SpatialHash(cell_size=100)
+        for i, motor in enumerate(motors):
+            grid.update(i, motor.x, motor.y)
+        for a, b in grid.pairs(30):
+            ...
+    """
+
+    def __init__(self, cell_size: float = 100.0):
+        """
+        Args:
+            cell_size: Ukuran cell (pixel world), minimal sebesar jarak pairs()
+        """
+        self.cell_size = float(cell_size)
+        self._cells: Dict[Tuple[int, int], Set[Hashable]] = {}
+        self._cell_of: Dict[Hashable, Tuple[int, int]] = {}
+        self.positions: Dict[Hashable, Tuple[float, float]] = {}
+
+    def __len__(self) -> int:
+        return len(self.positions)
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self.positions
+
+    def cell_at(self, x: float, y: float) -> Tuple[int, int]:
+        """Koordinat cell untuk posisi world."""
+        return (math.floor(x / self.cell_size), math.floor(y / self.cell_size))
+
+    def update(self, key: Hashable, x: float, y: float) -> None:
+        """Set posisi key, pindah bucket hanya jika cell berubah."""
+        cell = self.cell_at(x, y)
+        old = self._cell_of.get(key)
+        if old != cell:
+            if old is not None:
+                bucket = self._cells[old]
+                bucket.discard(key)
+                if not bucket:
+                    del self._cells[old]
+            self._cells.setdefault(cell, set()).add(key)
+            self._cell_of[key] = cell
+        self.positions[key] = (x, y)
+
+    def remove(self, key: Hashable) -> None:
+        """Hapus key (misal motor mati), tidak apa-apa jika tidak ada."""
+        cell = self._cell_of.pop(key, None)
+        if cell is None:
+            return
+        bucket = self._cells[cell]
+        bucket.discard(key)
+        if not bucket:
+            del self._cells[cell]
+        del self.positions[key]
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._cell_of.clear()
+        self.positions.clear()
+
+    def neighbors(self, x: float, y: float, radius: float,
+                  exclude: Optional[Hashable] = None) -> List[Tuple[Hashable, float]]:
+        """
+        Key dalam jarak `radius` dari (x, y).
+
+        Returns:
+            List (key, jarak), urut dari yang terdekat
+        """
+        cx0, cy0 = self.cell_at(x - radius, y - radius)
+        cx1, cy1 = self.cell_at(x + radius, y + radius)
+        radius_sq = radius * radius
+
+        found = []
+        cells = self._cells
+        positions = self.positions
+        for cx in range(cx0, cx1 + 1):
+            for cy in range(cy0, cy1 + 1):
+                bucket = cells.get((cx, cy))
+                if not bucket:
+                    continue
+                for key in bucket:
+                    if key == exclude:
+                        continue
+                    px, py = positions[key]
+                    dist_sq = (px - x) ** 2 + (py - y) ** 2
+                    if dist_sq <= radius_sq:
+                        found.append((key, math.sqrt(dist_sq)))
+
+        found.sort(key=lambda item: item[1])
+        return found
+
+    def nearest(self, x: float, y: float, radius: float,
+                exclude: Optional[Hashable] = None) -> Optional[Tuple[Hashable, float]]:
+        """(key, jarak) terdekat dalam `radius`, None jika tidak ada."""
+        found = self.neighbors(x, y, radius, exclude)
+        return found[0] if found else None
+
+    def pairs(self, distance: float) -> List[Tuple[Hashable, Hashable, float]]:
+        """
+        Semua pasangan dengan jarak < `distance` (butuh distance <= cell_size).
+
+        Returns:
+            List (key_a, key_b, jarak) dengan key_a < key_b, terurut
+            (hasil deterministik, tidak tergantung urutan update)
+        """
+        if distance > self.cell_size:
+            raise ValueError(f"distance {distance} lebih besar dari cell_size {self.cell_size}")
+
+        distance_sq = distance * distance
+        cells = self._cells
+        positions = self.positions
+        found = []
+
+        def check(a, b):
+            ax, ay = positions[a]
+            bx, by = positions[b]
+            dist_sq = (ax - bx) ** 2 + (ay - by) ** 2
+            if dist_sq < distance_sq:
+                if b < a:
+                    a, b = b, a
+                found.append((a, b, math.sqrt(dist_sq)))
+
+        for (cx, cy), bucket in cells.items():
+            keys = sorted(bucket)
+            for i, a in enumerate(keys):
+                for b in keys[i + 1:]:
+                    check(a, b)
+            for dx, dy in _FORWARD_CELLS:
+                other = cells.get((cx + dx, cy + dy))
+                if other:
+                    for a in keys:
+                        for b in other:
+                            check(a, b)
+
+        found.sort()
+        return found
@@ -0,0 +1,113 @@
+"""
+Sprite Cache Module
+===================
+
+Cache sprite motor untuk satu proses. Setiap kombinasi (warna, ukuran)
+cukup di-decode, convert_alpha(), rotate dan scale sekali; semua Motor
+memakai Surface yang sama (read-only).
+
+Rotasi juga di-cache: sprite di-render sekali untuk ROTATION_STEPS
+heading diskrit, lalu draw() cukup ambil heading terdekat (tanpa
+pygame.transform.rotate dan alokasi Surface baru per frame).
+
+Simulasi headless tidak pernah memanggil modul ini, jadi pygame dan
+file PNG sprite tidak disentuh sama sekali.
+"""
+
+import math
+import os
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pygame
+
+BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+MOTOR_SPRITE_DIR = os.path.join(BASE_DIR, "assets", "motor")
+
+# Jumlah heading yang di-render (1 derajat per step)
+ROTATION_STEPS = 360
+
+# (warna, width, height) -> Surface, None = sprite tidak ada/gagal load
+_motor_sprites: Dict[Tuple[str, float, float], Optional["pygame.Surface"]] = {}
+
+# (warna, width, height, steps) -> list Surface per heading
+_motor_rotations: Dict[Tuple[str, float, float, int], Optional[List["pygame.Surface"]]] = {}
+
+
+def get_motor_sprite(color: str, size: Tuple[float, float]) -> Optional["pygame.Surface"]:
+    """
+    Sprite motor yang sudah di-rotate (menghadap kanan) dan di-scale.
+
+    Butuh display pygame aktif (convert_alpha) saat pertama kali dipanggil.
+
+    Args:
+        color: Nama file sprite tanpa .png (misal "pink")
+        size: Ukuran sprite (length, width)
+
+    Returns:
+        Surface bersama (jangan diubah), atau None jika tidak bisa di-load
+    """
+    key = (color, size[0], size[1])
+    if key in _motor_sprites:
+        return _motor_sprites[key]
+
+    import pygame
+
+    sprite = None
+    sprite_path = os.path.join(MOTOR_SPRITE_DIR, f"{color}.png")
+    if os.path.exists(sprite_path):
+        try:
+            frame = pygame.image.load(sprite_path).convert_alpha()
+            rotated = pygame.transform.rotate(frame, -90)  # Sesuaikan rotasi asli asset
+            sprite = pygame.transform.scale(rotated, size)
+        except Exception as e:
+            print(f"[ERROR] Gagal load sprite {color}: {e}")
+    else:
+        print(f"[WARN] Sprite tidak ditemukan: {sprite_path}")
+
+    # Gagal juga di-cache supaya warning tidak muncul per motor
+    _motor_sprites[key] = sprite
+    return sprite
+
+
+def get_motor_rotations(color: str, size: Tuple[float, float],
+                        steps: int = ROTATION_STEPS) -> Optional[List["pygame.Surface"]]:
+    """
+    Sprite motor yang sudah di-rotate ke `steps` heading.
+
+    Elemen ke-i = sprite dengan angle motor i * 360 / steps derajat
+    (searah jarum jam di layar, sama dengan rotate(-degrees(angle))).
+
+    Args:
+        color: Nama file sprite tanpa .png
+        size: Ukuran sprite (length, width)
+        steps: Jumlah heading diskrit
+
+    Returns:
+        List Surface bersama, atau None jika sprite tidak bisa di-load
+    """
+    key = (color, size[0], size[1], steps)
+    if key in _motor_rotations:
+        return _motor_rotations[key]
+
+    import pygame
+
+    sprite = get_motor_sprite(color, size)
+    rotations = None
+    if sprite is not None:
+        rotations = [pygame.transform.rotate(sprite, -i * 360.0 / steps)
+                     for i in range(steps)]
+
+    _motor_rotations[key] = rotations
+    return rotations
+
+
+def heading_index(angle: float, steps: int = ROTATION_STEPS) -> int:
+    """Index heading terdekat untuk angle (radians)."""
+    return int(round(math.degrees(angle) * steps / 360.0)) % steps
+
+
+def clear_sprite_cache() -> None:
+    """Buang semua sprite (misal setelah display dibuat ulang)."""
+    _motor_sprites.clear()
+    _motor_rotations.clear()
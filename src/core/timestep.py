@@ -0,0 +1,75 @@
+"""
+Fixed Timestep Module
+=====================
+
+Loop simulasi dengan tick tetap (default 60 tick/detik) yang terpisah dari
+frame render. Semua konstanta fisika (PhysicsEngine, respawn, checkpoint)
+dihitung per tick, jadi satu tick selalu mewakili dt = 1 / tick_rate detik
+berapa pun FPS layarnya.
+
+Usage:
+    timestep = FixedTimestep(tick_rate=60, speed=1.0)
+    while running:
+        for _ in range(timestep.advance(frame_dt)):
+            simulate_one_tick()
+        render(alpha=timestep.alpha)
+        frame_dt = display.tick(fps)
+"""
+
+from dataclasses import dataclass
+
+
+# Tick rate simulasi (sama dengan asumsi konstanta fisika dan training)
+TICK_RATE = 60
+
+
+@dataclass
+class FixedTimestep:
+    """
+    Accumulator waktu nyata -> jumlah tick simulasi per frame.
+
+    - speed > 1 = fast-forward (lebih banyak tick per detik nyata)
+    - max_ticks_per_frame mencegah spiral (frame lambat -> makin banyak
+      tick -> makin lambat); sisa waktu yang tidak terkejar dibuang
+    - alpha = posisi di antara tick terakhir dan tick berikutnya (0-1),
+      untuk interpolasi render
+    """
+    tick_rate: int = TICK_RATE
+    speed: float = 1.0
+    max_ticks_per_frame: int = 8
+    accumulator: float = 0.0
+
+    @property
+    def dt(self) -> float:
+        """Durasi satu tick simulasi (detik)."""
+        return 1.0 / self.tick_rate
+
+    @property
+    def alpha(self) -> float:
+        """Fraksi tick yang sudah lewat tapi belum disimulasikan."""
+        return min(1.0, self.accumulator / self.dt)
+
+    def advance(self, elapsed: float) -> int:
+        """
+        Tambah waktu nyata yang lewat, kembalikan jumlah tick yang harus jalan.
+
+        Args:
+            elapsed: Detik sejak frame sebelumnya
+
+        Returns:
+            Jumlah tick simulasi untuk frame ini
+        """
+        self.accumulator += max(0.0, elapsed) * self.speed
+        ticks = int(self.accumulator / self.dt)
+
+        limit = max(1, int(self.max_ticks_per_frame * self.speed))
+        if ticks > limit:
+            ticks = limit
+            self.accumulator = 0.0  # Terlalu tertinggal, lanjut dari sekarang
+        else:
+            self.accumulator -= ticks * self.dt
+        return ticks
+
+    def reset(self) -> None:
+        """Buang waktu yang terkumpul (misal saat pause)."""
+        self.accumulator = 0.0
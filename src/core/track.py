@@ -1,6 +1,8 @@
 import os
 import math
-import pygame as pg
+import numpy as np
+
+from core.distance_field import DistanceField, DEFAULT_MAX_DISTANCE
 
 # Naik 2 level dari src/object/ ke root project
 BASE_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -27,6 +29,8 @@ class Track:
         self.road_threshold = road_threshold
         self.image_path = os.path.join(TRACK_DIR, f"{name}.png")
         
+        import pygame as pg
+        
         # Load gambar trek
         if os.path.exists(self.image_path):
             original_image = pg.image.load(self.image_path)
@@ -36,6 +40,23 @@ class Track:
         
         self.width = self.screen_width
         self.height = self.screen_height
+        
+        # Optional: distance field untuk raycast sphere tracing
+        self.distance_field = None
+    
+    def build_distance_field(self, max_distance: int = DEFAULT_MAX_DISTANCE) -> DistanceField:
+        """
+        Hitung distance field dari wall (aturan sama dengan is_wall).
+        Setelah ini raycast() pakai sphere tracing, bukan step 5 px.
+        """
+        import pygame as pg
+        
+        rgb = pg.surfarray.array3d(self.image).transpose(1, 0, 2).astype(np.float64)
+        brightness = rgb[..., 0] * 0.299 + rgb[..., 1] * 0.587 + rgb[..., 2] * 0.114
+        road = (brightness < self.road_threshold) | (brightness == 250)
+        
+        self.distance_field = DistanceField.from_wall_mask(~road, max_distance)
+        return self.distance_field
     
     def get_pixel_at(self, x: int, y: int) -> tuple:
         """
@@ -110,6 +131,10 @@ class Track:
         dx = math.cos(angle)
         dy = math.sin(angle)
         
+        if self.distance_field is not None:
+            distance, _, _ = self.distance_field.trace(start_x, start_y, dx, dy, max_distance)
+            return distance
+        
         # Step size (semakin kecil = lebih akurat tapi lebih lambat)
         step = 5
         
@@ -171,6 +196,8 @@ class Track:
         """
         Gambar visualisasi sensor rays (untuk debugging)
         """
+        import pygame as pg
+        
         distances = self.get_sensor_distances(x, y, angle, num_sensors, fov, max_distance)
         
         if num_sensors == 1:
@@ -0,0 +1,544 @@
+"""
+Vector Motor Pool Module
+========================
+
+Simulasi banyak motor sekaligus dalam bentuk structure-of-arrays.
+Semua state (posisi, fisika, checkpoint, fitness counter) disimpan
+sebagai array NumPy dan di-step bersamaan, dengan aturan yang sama
+persis dengan Motor + PhysicsEngine + CollisionHandler +
+CheckpointTracker + FitnessCalculator.
+
+Dipakai untuk training headless supaya pop_size bisa dinaikkan tanpa
+menambah waktu per generasi.
+"""
+
+from typing import Optional
+
+import numpy as np
+
+from core.physics import PhysicsConfig
+from core.radar import RadarConfig
+from core.zone_grid import (ZoneGrid, ZONE_WALL, ZONE_SLOW, ZONE_OUT,
+                            ZONE_CP1, ZONE_CP4)
+from core.distance_field import DistanceField
+from core.progress_field import ProgressField
+from core.visit_grid import VISIT_CELL_SIZE, get_visit_grid
+from core.batch_radar import BatchRadar
+
+
+# Konstanta yang di Motor/FitnessCalculator masih hardcoded
+STUCK_THRESHOLD = 30         # Motor.update: is_stuck(30)
+RESPAWN_DISTANCE = 150       # Motor.update: mundur saat respawn
+RESPAWN_DURATION = 60        # Motor.respawn_duration
+TOTAL_CHECKPOINTS = 4        # CheckpointState.total_checkpoints
+HITBOX_RATIO = 0.4           # CollisionHandler: hitbox 40% ukuran motor
+
+
+class VectorMotorPool:
+    """
+    Pool motor berbasis array.
+
+    Usage:
+        pool = VectorMotorPool(150, game.zone_grid)
+        pool.reset(150, spawn_x, spawn_y, angle, velocity=pool.config.max_speed)
+        while pool.alive.any():
+            inputs = pool.radar_data()          # (N, num_radars)
+            steering, throttle = ...            # dari network
+            pool.step(steering, throttle)
+    """
+
+    def __init__(self, capacity: int, zone_grid: ZoneGrid,
+                 physics_config: PhysicsConfig = None,
+                 radar_config: RadarConfig = None,
+                 distance_field: Optional[DistanceField] = None,
+                 length: float = 140 // 1.5, width: float = 80 // 1.5,
+                 swept: bool = True, progress_field: Optional[ProgressField] = None):
+        """
+        Args:
+            capacity: Jumlah slot awal (akan membesar otomatis)
+            zone_grid: ZoneGrid dari GameManager.load_masking()
+            physics_config: Konstanta fisika, default sama dengan Motor
+            radar_config: Konfigurasi radar
+            distance_field: Optional, radar pakai sphere tracing
+            length, width: Ukuran motor (sama dengan Motor)
+            swept: Cek garis dari posisi sebelumnya ke wall (sama dengan
+                   CollisionHandler.swept)
+            progress_field: Optional, progress track per motor (sama dengan
+                   FitnessCalculator.update_progress)
+        """
+        self.config = physics_config or PhysicsConfig(length=length, width=width)
+        self.radar_config = radar_config or RadarConfig()
+        self.zone_grid = zone_grid
+        self.swept = swept
+        self.progress_field = progress_field
+
+        # Optional MotorContacts (contact antar motor), dijalankan sebelum radar
+        self.contacts = None
+        self.radar = BatchRadar.from_zone_grid(zone_grid, self.radar_config,
+                                               distance_field=distance_field)
+
+        # Corner hitbox relatif terhadap center (urutan sama dengan CollisionHandler)
+        hl = length * HITBOX_RATIO / 2
+        hw = width * HITBOX_RATIO / 2
+        self.corner_dx = np.array([-hl, hl, hl, -hl])
+        self.corner_dy = np.array([-hw, -hw, hw, hw])
+
+        # Grid kunjungan (layout sama dengan FitnessCalculator di map ini)
+        self.visit_grid = get_visit_grid(zone_grid.width, zone_grid.height)
+
+        self.size = 0
+        self.capacity = 0
+        self._allocate(max(1, capacity))
+
+    def _allocate(self, capacity: int) -> None:
+        """Alokasi semua array state untuk `capacity` motor."""
+        f8 = lambda: np.zeros(capacity, dtype=np.float64)
+        i8 = lambda: np.zeros(capacity, dtype=np.int64)
+        b1 = lambda: np.zeros(capacity, dtype=bool)
+
+        self.capacity = capacity
+
+        # Posisi & status
+        self.x, self.y, self.angle = f8(), f8(), f8()
+        self.alive = b1()
+        self.invincible = b1()
+        self.respawning = b1()
+        self.respawn_timer = i8()
+        self.steering_input = f8()
+
+        # PhysicsState
+        self.velocity = f8()
+        self.lateral_velocity = f8()
+        self.grip = f8()
+        self.weight_transfer = f8()
+        self.steering_rate = f8()
+        self.drift_angle = f8()
+        self.is_drifting = b1()
+        self.drift_direction = i8()
+
+        # CheckpointState
+        self.lap_count = i8()
+        self.checkpoint_count = i8()
+        self.expected_checkpoint = i8()
+        self.last_checkpoint_time = i8()
+        self.on_checkpoint = b1()
+        self.lap_start_time = i8()
+        self.best_lap_time = f8()
+
+        # AIState
+        self.time_spent = i8()
+        self.distance_traveled = f8()
+        self.max_distance_reached = f8()
+        self.consecutive_same_pos = i8()
+        self.stuck_timer = i8()
+        self.total_rotation = f8()
+        self.prev_x, self.prev_y = f8(), f8()
+        self.last_grid_x, self.last_grid_y = f8(), f8()
+        self.has_grid_pos = b1()
+        self.visited = np.zeros((capacity, self.visit_grid.size), dtype=bool)
+        self.novelty = i8()
+        self.track_progress = f8()
+        self.start_progress = f8()     # NaN = belum diketahui
+        self.max_progress = f8()
+        self.progress_idle = i8()
+
+        # Radar (jarak mentah per ray)
+        self.radar_distances = np.zeros((capacity, len(self.radar_config.radar_angles)),
+                                        dtype=np.int64)
+
+    def reset(self, count: int, x: float, y: float, angle: float = 0.0,
+              velocity: float = 0.0, invincible: bool = False) -> None:
+        """
+        Spawn `count` motor baru di posisi yang sama (setara Motor baru).
+
+        Array hanya dialokasi ulang kalau count > capacity.
+        """
+        if count > self.capacity:
+            self._allocate(count)
+        self.size = count
+        n = slice(0, count)
+
+        self.x[n] = x
+        self.y[n] = y
+        self.angle[n] = angle
+        self.alive[n] = True
+        self.invincible[n] = invincible
+        self.respawning[n] = False
+        self.respawn_timer[n] = 0
+        self.steering_input[n] = 0
+
+        self.velocity[n] = velocity
+        self.lateral_velocity[n] = 0.0
+        self.grip[n] = 1.0
+        self.weight_transfer[n] = 0.0
+        self.steering_rate[n] = self.config.base_steering_rate
+        self.drift_angle[n] = 0.0
+        self.is_drifting[n] = False
+        self.drift_direction[n] = 0
+
+        self.lap_count[n] = 0
+        self.checkpoint_count[n] = 0
+        self.expected_checkpoint[n] = 1
+        self.last_checkpoint_time[n] = 0
+        self.on_checkpoint[n] = False
+        self.lap_start_time[n] = 0
+        self.best_lap_time[n] = np.inf
+
+        self.time_spent[n] = 0
+        self.distance_traveled[n] = 0.0
+        self.max_distance_reached[n] = 0.0
+        self.consecutive_same_pos[n] = 0
+        self.stuck_timer[n] = 0
+        self.total_rotation[n] = 0.0
+        self.prev_x[n] = x
+        self.prev_y[n] = y
+        self.has_grid_pos[n] = False
+        self.visited[n] = False
+        self.novelty[n] = 0
+        start = np.nan
+        if self.progress_field is not None:
+            value = self.progress_field.progress(x, y, 0, 0)
+            start = np.nan if value is None else value
+        self.track_progress[n] = 0.0 if start != start else start
+        self.start_progress[n] = start
+        self.max_progress[n] = self.track_progress[n]
+        self.progress_idle[n] = 0
+
+        self.radar_distances[n] = 0
+
+    # =========================================================================
+    # Input & step
+    # =========================================================================
+
+    def radar_data(self) -> np.ndarray:
+        """Input network (setara Radar.get_data()), shape (size, num_radars)."""
+        return self.radar_distances[:self.size] // 30
+
+    def step(self, steering: np.ndarray, throttle: np.ndarray,
+             drift: Optional[np.ndarray] = None) -> np.ndarray:
+        """
+        Satu frame untuk semua motor yang masih hidup.
+
+        Setara dengan memanggil motor.set_ai_input(steering, throttle)
+        lalu motor.update() untuk tiap motor.
+
+        Args:
+            steering, throttle: Array (size,), index sama dengan motor
+            drift: Optional array bool (size,)
+
+        Returns:
+            Index motor yang diproses frame ini (alive di awal frame)
+        """
+        idx = np.flatnonzero(self.alive[:self.size])
+        if idx.size == 0:
+            return idx
+
+        steer = np.clip(np.asarray(steering, dtype=np.float64)[idx], -1, 1)
+        thr = np.asarray(throttle, dtype=np.float64)[idx]
+        is_drift = (np.zeros(idx.size, dtype=bool) if drift is None
+                    else np.asarray(drift, dtype=bool)[idx])
+
+        # set_ai_input()
+        self.steering_input[idx] = steer
+        self._apply_acceleration(idx, thr)
+        self.angle[idx] += self._apply_steering(idx, steer, is_drift)
+
+        # update(): motor yang sedang respawn cuma hitung mundur timer
+        resp = self.respawning[idx]
+        if resp.any():
+            r_idx = idx[resp]
+            self.respawn_timer[r_idx] -= 1
+            done = self.respawn_timer[r_idx] <= 0
+            self.respawning[r_idx[done]] = False
+            self.respawn_timer[r_idx[done]] = 0
+
+        movers = idx[~resp]
+        if movers.size:
+            self._update_movers(movers)
+            if self.contacts is not None:
+                self.contacts.step_pool(self)
+
+        # Radar untuk motor yang masih jalan, satu pass BatchRadar
+        sense = idx[self.alive[idx] & ~self.respawning[idx]]
+        if sense.size:
+            self.radar_distances[sense] = self.radar.compute(
+                self.x[sense], self.y[sense], self.angle[sense])[0]
+
+        return idx
+
+    # =========================================================================
+    # PhysicsEngine (vectorized)
+    # =========================================================================
+
+    def _apply_acceleration(self, idx: np.ndarray, throttle: np.ndarray) -> None:
+        """Setara PhysicsEngine.apply_acceleration()."""
+        cfg = self.config
+        throttle = np.clip(throttle, -1, 1)
+        v = self.velocity[idx]
+        wt = self.weight_transfer[idx]
+
+        gas = throttle > 0
+        brake = throttle < 0
+        coast = ~(gas | brake)
+
+        speed_ratio = np.abs(v) / cfg.max_speed
+        accel_modifier = 1.0 - (speed_ratio * 0.5)
+        v = np.where(gas, v + cfg.acceleration_rate * throttle * accel_modifier, v)
+        v = np.where(brake, v - cfg.brake_power, v)
+        v = np.where(coast, v * cfg.friction, v)
+
+        wt = np.where(gas, 0.3, np.where(brake, -0.5, wt * 0.9))
+
+        self.velocity[idx] = np.clip(v, -cfg.max_speed * 0.5, cfg.max_speed)
+        self.weight_transfer[idx] = wt
+
+    def _apply_steering(self, idx: np.ndarray, steer: np.ndarray,
+                        is_drift: np.ndarray) -> np.ndarray:
+        """Setara PhysicsEngine.apply_steering(), return perubahan angle."""
+        cfg = self.config
+        self.is_drifting[idx] = is_drift
+
+        v = self.velocity[idx]
+        grip = self.grip[idx]
+        lat = self.lateral_velocity[idx]
+        drift_angle = self.drift_angle[idx]
+
+        moving = np.abs(v) > 0.1
+        speed_ratio = np.abs(v) / cfg.max_speed
+        abs_steer = np.abs(steer)
+
+        drifting = moving & is_drift & (steer != 0)
+        normal = moving & ~drifting
+
+        angle_change = np.zeros(idx.size, dtype=np.float64)
+
+        # Drift mode
+        if drifting.any():
+            d_steer = steer[drifting]
+            self.drift_direction[idx[drifting]] = d_steer.astype(np.int64)
+            angle_change[drifting] = np.radians(cfg.base_steering_rate * 1.5) * d_steer
+            drift_angle[drifting] = np.clip(drift_angle[drifting] + d_steer * 0.08, -0.5, 0.5)
+            v[drifting] *= 0.995
+            grip[drifting] = np.maximum(0.3, grip[drifting] - 0.05)
+            lat[drifting] += d_steer * 0.5
+
+        # Normal steering
+        if normal.any():
+            n_steer = steer[normal]
+            n_ratio = speed_ratio[normal]
+            steering_rate = cfg.base_steering_rate - (
+                (cfg.base_steering_rate - cfg.min_steering_rate) * n_ratio)
+            self.steering_rate[idx[normal]] = steering_rate
+            understeer = 1.0 - (n_ratio * cfg.understeer_factor)
+            angle_change[normal] = np.radians(steering_rate) * n_steer * understeer
+
+            turning = abs_steer[normal] > 0
+            speed_loss = cfg.turn_speed_penalty * (abs_steer[normal] * n_ratio)
+            v[normal] = np.where(turning, v[normal] * (1.0 - speed_loss), v[normal])
+
+            grip[normal] = np.minimum(cfg.base_grip, grip[normal] + 0.02)
+            drift_angle[normal] *= 0.85
+            lat[normal] *= cfg.lateral_friction
+
+        lat = np.where(moving, np.clip(lat, -3.0, 3.0), lat)
+
+        grip_loss = moving & (abs_steer > 0) & (speed_ratio > 0.6)
+        grip = np.where(grip_loss,
+                        np.maximum(0.5, grip - cfg.turn_grip_loss * speed_ratio * abs_steer),
+                        grip)
+
+        self.velocity[idx] = v
+        self.grip[idx] = grip
+        self.lateral_velocity[idx] = lat
+        self.drift_angle[idx] = drift_angle
+        return angle_change
+
+    # =========================================================================
+    # Motor.update() (vectorized)
+    # =========================================================================
+
+    def _update_movers(self, idx: np.ndarray) -> None:
+        cfg = self.config
+        prev_x = self.x[idx]
+        prev_y = self.y[idx]
+        angle = self.angle[idx]
+        prev_angle = angle.copy()
+        v = self.velocity[idx]
+
+        # calculate_movement()
+        move_angle = np.where(self.is_drifting[idx], angle + self.drift_angle[idx], angle)
+        x = prev_x + np.cos(move_angle) * v
+        y = prev_y + np.sin(move_angle) * v
+
+        # check_masking_collision(): 4 corner hitbox
+        cos_a = np.cos(angle)[:, None]
+        sin_a = np.sin(angle)[:, None]
+        corner_x = x[:, None] + (self.corner_dx * cos_a - self.corner_dy * sin_a)
+        corner_y = y[:, None] + (self.corner_dx * sin_a + self.corner_dy * cos_a)
+        zones = self.zone_grid.zones_at(corner_x, corner_y)
+
+        # Corner diproses berurutan: corner pertama yang wall/out menentukan hasil
+        blocking = (zones == ZONE_WALL) | (zones == ZONE_OUT)
+        collided = blocking.any(axis=1)
+        first_block = np.take_along_axis(zones, blocking.argmax(axis=1)[:, None], axis=1)[:, 0]
+        out_of_bounds = collided & (first_block == ZONE_OUT)
+        wall = collided & ~out_of_bounds
+
+        # Swept: lintasan corner dari posisi lama kena wall (corner akhir aman)
+        if self.swept:
+            shift_x = (prev_x - x)[:, None]
+            shift_y = (prev_y - y)[:, None]
+            crossed = self.zone_grid.segments_hit_wall(
+                (corner_x + shift_x).ravel(), (corner_y + shift_y).ravel(),
+                corner_x.ravel(), corner_y.ravel()).reshape(corner_x.shape).any(axis=1)
+            crossed &= ~collided
+            wall |= crossed
+            collided |= crossed
+
+        slow = ~collided & (zones == ZONE_SLOW).any(axis=1)
+
+        is_cp = (zones >= ZONE_CP1) & (zones <= ZONE_CP4)
+        last_cp = 3 - np.argmax(is_cp[:, ::-1], axis=1)
+        checkpoint = np.where(is_cp.any(axis=1),
+                              zones[np.arange(idx.size), last_cp].astype(np.int64) - ZONE_CP1 + 1,
+                              0)
+        checkpoint[collided] = 0
+
+        invincible = self.invincible[idx]
+        alive = self.alive[idx]
+
+        # Keluar map
+        alive &= ~(out_of_bounds & ~invincible)
+        bounce = out_of_bounds & invincible
+        x[bounce] = prev_x[bounce]
+        y[bounce] = prev_y[bounce]
+        v[bounce] *= -0.3
+
+        # Nabrak wall
+        explode = wall & (np.abs(v) > cfg.wall_explode_speed)
+        alive &= ~(explode & ~invincible)
+        respawn = explode & invincible
+        if respawn.any():
+            x[respawn] = prev_x[respawn] - np.cos(angle[respawn]) * RESPAWN_DISTANCE
+            y[respawn] = prev_y[respawn] - np.sin(angle[respawn]) * RESPAWN_DISTANCE
+            v[respawn] = 0
+            self.respawning[idx[respawn]] = True
+            self.respawn_timer[idx[respawn]] = RESPAWN_DURATION
+        soft = wall & ~explode
+        v[soft] *= -0.4
+        x[soft] = prev_x[soft]
+        y[soft] = prev_y[soft]
+
+        # Slow zone
+        v[slow] *= 0.99
+
+        # Checkpoint / keluar dari area checkpoint
+        on_cp = ~collided & ~slow & (checkpoint > 0)
+        self._process_checkpoints(idx[on_cp], checkpoint[on_cp])
+        self.on_checkpoint[idx[~collided & ~slow & (checkpoint == 0)]] = False
+
+        self.x[idx] = x
+        self.y[idx] = y
+        self.velocity[idx] = v
+
+        # FitnessCalculator.update()
+        self._update_fitness(idx, x, y, self.angle[idx] - prev_angle)
+        if self.progress_field is not None:
+            self._update_progress(idx, x, y)
+
+        # Stuck
+        alive &= ~((self.stuck_timer[idx] > STUCK_THRESHOLD) & ~invincible)
+        self.alive[idx] = alive
+
+    def _process_checkpoints(self, idx: np.ndarray, checkpoint: np.ndarray) -> None:
+        """Setara CheckpointTracker.process_checkpoint()."""
+        if idx.size == 0:
+            return
+
+        valid = ~self.on_checkpoint[idx] & (checkpoint == self.expected_checkpoint[idx])
+        idx = idx[valid]
+        checkpoint = checkpoint[valid]
+        if idx.size == 0:
+            return
+
+        now = self.time_spent[idx]
+        self.on_checkpoint[idx] = True
+        self.last_checkpoint_time[idx] = now
+
+        lap = (checkpoint == 1) & (self.checkpoint_count[idx] >= TOTAL_CHECKPOINTS)
+
+        l_idx = idx[lap]
+        if l_idx.size:
+            lap_time = now[lap] - self.lap_start_time[l_idx]
+            better = (lap_time < self.best_lap_time[l_idx]) & (self.lap_count[l_idx] > 0)
+            self.best_lap_time[l_idx] = np.where(better, lap_time, self.best_lap_time[l_idx])
+            self.lap_count[l_idx] += 1
+            self.checkpoint_count[l_idx] = 1
+            self.expected_checkpoint[l_idx] = 2
+            self.lap_start_time[l_idx] = now[lap]
+
+        c_idx = idx[~lap]
+        self.checkpoint_count[c_idx] += 1
+        self.expected_checkpoint[c_idx] = (self.expected_checkpoint[c_idx] % TOTAL_CHECKPOINTS) + 1
+
+    def _update_progress(self, idx: np.ndarray, x: np.ndarray, y: np.ndarray) -> None:
+        """Setara FitnessCalculator.update_progress()."""
+        value = self.progress_field.progress_batch(x, y, self.lap_count[idx],
+                                                   self.checkpoint_count[idx])
+        known = ~np.isnan(value)
+        first = known & np.isnan(self.start_progress[idx])
+        if first.any():
+            self.start_progress[idx[first]] = value[first]
+            self.max_progress[idx[first]] = value[first]
+
+        best = self.max_progress[idx]
+        improved = known & (value > best)
+        self.track_progress[idx[known]] = value[known]
+        self.max_progress[idx] = np.where(improved, value, best)
+        self.progress_idle[idx] = np.where(improved, 0, self.progress_idle[idx] + 1)
+
+    def coverage(self) -> np.ndarray:
+        """Heatmap coverage (cells_y, cells_x): jumlah motor yang pernah lewat tiap cell."""
+        return self.visit_grid.coverage(self.visited[:self.size])
+
+    def progress_gain(self) -> np.ndarray:
+        """Progress terjauh sejak spawn per motor (setara FitnessCalculator.progress_gain)."""
+        n = self.size
+        gain = self.max_progress[:n] - self.start_progress[:n]
+        return np.where(np.isnan(gain), 0.0, gain)
+
+    def _update_fitness(self, idx: np.ndarray, x: np.ndarray, y: np.ndarray,
+                        angle_change: np.ndarray) -> None:
+        """Setara FitnessCalculator.update()."""
+        self.time_spent[idx] += 1
+
+        dx = x - self.prev_x[idx]
+        dy = y - self.prev_y[idx]
+        distance = self.distance_traveled[idx] + np.sqrt(dx * dx + dy * dy)
+        self.distance_traveled[idx] = distance
+        self.max_distance_reached[idx] = np.maximum(self.max_distance_reached[idx], distance)
+
+        # Unique position grid
+        grid_x = np.floor_divide(x, VISIT_CELL_SIZE)
+        grid_y = np.floor_divide(y, VISIT_CELL_SIZE)
+        moved = ~self.has_grid_pos[idx] | (grid_x != self.last_grid_x[idx]) | \
+                (grid_y != self.last_grid_y[idx])
+
+        self.consecutive_same_pos[idx] = np.where(moved, 0, self.consecutive_same_pos[idx] + 1)
+        self.stuck_timer[idx] = np.where(moved, 0, self.stuck_timer[idx] + 1)
+        self.last_grid_x[idx] = grid_x
+        self.last_grid_y[idx] = grid_y
+        self.has_grid_pos[idx] = True
+
+        cell = self.visit_grid.cell_indices(grid_x, grid_y)
+        inside = moved & (cell >= 0)
+        if inside.any():
+            m_idx = idx[inside]
+            cell = cell[inside]
+            self.novelty[m_idx] += ~self.visited[m_idx, cell]
+            self.visited[m_idx, cell] = True
+
+        self.total_rotation[idx] += np.abs(np.degrees(angle_change))
+
+        self.prev_x[idx] = x
+        self.prev_y[idx] = y
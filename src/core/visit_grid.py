@@ -0,0 +1,102 @@
+"""
+Visit Grid Module
+=================
+
+Layout grid kunjungan (cell 50 px) yang dipakai bersama oleh
+FitnessCalculator (bytearray per motor) dan VectorMotorPool (array bool
+seluruh populasi). Novelty = jumlah cell berbeda yang pernah dikunjungi,
+dihitung O(1) per tick tanpa set/tuple.
+
+Grid mencakup ukuran world +1 cell di tiap sisi, karena posisi terakhir
+motor yang keluar map tetap dihitung. Posisi di luar itu diabaikan.
+
+Karena semua motor memakai layout yang sama, coverage populasi (berapa
+motor yang pernah lewat tiap cell) cukup penjumlahan array kunjungan.
+"""
+
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+# Ukuran cell (pixel world)
+VISIT_CELL_SIZE = 50
+
+# Ukuran world default kalau motor dibuat tanpa map (cukup untuk map 3x)
+DEFAULT_WORLD_SIZE = (8192, 8192)
+
+
+class VisitGrid:
+    """
+    Layout cell kunjungan untuk satu ukuran world.
+
+    Usage:
+        grid = VisitGrid(map_width, map_height)
+        visited = grid.new_buffer()
+        cell = grid.cell_index(int(x // VISIT_CELL_SIZE), int(y // VISIT_CELL_SIZE))
+    """
+
+    def __init__(self, width: int, height: int, cell_size: int = VISIT_CELL_SIZE):
+        """
+        Args:
+            width, height: Ukuran world (pixel)
+            cell_size: Ukuran cell (pixel)
+        """
+        self.cell_size = cell_size
+        self.cells_x = -(-int(width) // cell_size) + 2
+        self.cells_y = -(-int(height) // cell_size) + 2
+        self.size = self.cells_x * self.cells_y
+        self._zeros = bytes(self.size)
+
+    def cell_index(self, grid_x: int, grid_y: int) -> int:
+        """Index flat cell (grid_x, grid_y), -1 jika di luar grid."""
+        cell_x = grid_x + 1
+        cell_y = grid_y + 1
+        if cell_x < 0 or cell_x >= self.cells_x or cell_y < 0 or cell_y >= self.cells_y:
+            return -1
+        return cell_y * self.cells_x + cell_x
+
+    def cell_indices(self, grid_x: np.ndarray, grid_y: np.ndarray) -> np.ndarray:
+        """Versi vectorized dari cell_index()."""
+        cell_x = np.asarray(grid_x).astype(np.int64) + 1
+        cell_y = np.asarray(grid_y).astype(np.int64) + 1
+        inside = (cell_x >= 0) & (cell_x < self.cells_x) & (cell_y >= 0) & (cell_y < self.cells_y)
+        return np.where(inside, cell_y * self.cells_x + cell_x, -1)
+
+    def new_buffer(self) -> bytearray:
+        """Buffer kunjungan satu motor (1 byte per cell)."""
+        return bytearray(self.size)
+
+    def clear(self, buffer: bytearray) -> None:
+        """Kosongkan buffer in-place (memcpy, tanpa alokasi baru)."""
+        buffer[:] = self._zeros
+
+    def coverage(self, visited) -> np.ndarray:
+        """
+        Heatmap coverage dari array kunjungan (N, size) atau kumpulan buffer.
+
+        Returns:
+            Array int64 (cells_y, cells_x), jumlah motor yang pernah
+            mengunjungi tiap cell
+        """
+        if isinstance(visited, np.ndarray):
+            counts = visited.reshape(-1, self.size).sum(axis=0, dtype=np.int64)
+        else:
+            counts = np.zeros(self.size, dtype=np.int64)
+            for buffer in visited:
+                counts += np.frombuffer(buffer, dtype=np.uint8)
+        return counts.reshape(self.cells_y, self.cells_x)
+
+
+# Layout dipakai bersama per ukuran world
+_grids: Dict[Tuple[int, int], VisitGrid] = {}
+
+
+def get_visit_grid(width: int = DEFAULT_WORLD_SIZE[0],
+                   height: int = DEFAULT_WORLD_SIZE[1]) -> VisitGrid:
+    """VisitGrid bersama untuk ukuran world ini (dibuat sekali)."""
+    key = (int(width), int(height))
+    grid = _grids.get(key)
+    if grid is None:
+        grid = _grids[key] = VisitGrid(*key)
+    return grid
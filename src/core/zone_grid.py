@@ -0,0 +1,419 @@
+"""
+Zone Grid Module
+================
+
+Grid uint8 hasil klasifikasi masking yang dibangun SEKALI saat load.
+Collision dan radar cukup baca index integer, tanpa get_at() dan
+klasifikasi warna per frame.
+
+Grid disimpan di resolusi asli masking (1 byte/pixel). Koordinat world
+dipetakan ke pixel masking dengan index per sumbu yang sama persis
+dengan pygame.transform.scale, jadi hasil query identik dengan masking
+yang di-scale ke ukuran map.
+
+Sweep (segment_hits_wall) menelusuri pixel masking yang dilewati garis
+(misal lintasan corner hitbox antar tick) dengan DDA, supaya motor cepat
+tidak menembus wall tipis.
+"""
+
+from typing import Optional, Tuple
+
+import numpy as np
+
+
+# Label zona (nilai di dalam grid)
+ZONE_TRACK = 0
+ZONE_WALL = 1
+ZONE_SLOW = 2
+ZONE_CP1 = 3
+ZONE_CP2 = 4
+ZONE_CP3 = 5
+ZONE_CP4 = 6
+
+# Hanya dikembalikan oleh query, tidak pernah disimpan di grid
+ZONE_OUT = 255
+
+# Ukuran blok (pixel masking) untuk early-out sweep: blok tanpa wall dilewati
+WALL_BLOCK_SIZE = 16
+
+ZONE_NAMES = {
+    ZONE_TRACK: 'track',
+    ZONE_WALL: 'wall',
+    ZONE_SLOW: 'slow',
+    ZONE_CP1: 'cp1',
+    ZONE_CP2: 'cp2',
+    ZONE_CP3: 'cp3',
+    ZONE_CP4: 'cp4',
+    ZONE_OUT: 'out',
+}
+
+
+def checkpoint_number(zone: int) -> int:
+    """Nomor checkpoint (1-4) dari label zona, 0 jika bukan checkpoint."""
+    if ZONE_CP1 <= zone <= ZONE_CP4:
+        return zone - ZONE_CP1 + 1
+    return 0
+
+
+def classify_rgb(rgb: np.ndarray) -> np.ndarray:
+    """
+    Klasifikasi array warna (..., 3) ke label zona.
+
+    Aturan sama persis dengan CollisionHandler._classify_color,
+    urutan prioritas: track > wall > cp1 > cp2 > cp3 > cp4 > slow.
+    """
+    r = rgb[..., 0].astype(np.int16)
+    g = rgb[..., 1].astype(np.int16)
+    b = rgb[..., 2].astype(np.int16)
+
+    zones = np.full(r.shape, ZONE_SLOW, dtype=np.uint8)
+
+    # Assign dari prioritas terendah, yang lebih tinggi menimpa
+    zones[(r > 150) & (b > 150) & (g < 150)] = ZONE_CP4
+    zones[(r > 150) & (g > 150) & (b < 150)] = ZONE_CP3
+    zones[(g > 150) & (b > 150) & (r < 150)] = ZONE_CP2
+    zones[(g > 150) & (r < 150) & (b < 150) & (g > r) & (g > b)] = ZONE_CP1
+    zones[(r > 150) & (g < 100) & (b < 100)] = ZONE_WALL
+    # avg < 50  <=>  r + g + b < 150 (semua integer)
+    zones[(r + g + b) < 150] = ZONE_TRACK
+
+    return zones
+
+
+def stretch_index(src_size: int, dst_size: int) -> np.ndarray:
+    """
+    Index pixel sumber untuk tiap pixel tujuan saat scale satu sumbu.
+
+    Algoritma sama dengan stretch() di pygame.transform.scale
+    (nearest neighbor dengan error term integer).
+    """
+    index = []
+    src = 0
+    err = 2 * src_size - 2 * dst_size
+    for _ in range(dst_size):
+        index.append(src)
+        while err >= 0:
+            src += 1
+            err -= 2 * dst_size
+        err += 2 * src_size
+    return np.array(index, dtype=np.int64)
+
+
+class ZoneGrid:
+    """
+    Grid label zona (uint8) untuk query collision & radar.
+
+    Koordinat query adalah koordinat world (pixel map yang sudah di-scale),
+    sama seperti get_at() di masking surface yang di-scale. Grid sendiri
+    boleh lebih kecil (resolusi asli masking).
+    """
+
+    def __init__(self, zones: np.ndarray, size: Optional[Tuple[int, int]] = None,
+                 walls: Optional[np.ndarray] = None):
+        """
+        Args:
+            zones: Array (height, width) berisi label ZONE_* (resolusi masking)
+            size: Ukuran world (width, height), None = sama dengan zones
+            walls: Optional, wall bitmap resolusi masking yang sudah ada (cache)
+        """
+        self.zones = np.ascontiguousarray(zones, dtype=np.uint8)
+        self._walls = walls
+        self.native_height, self.native_width = self.zones.shape
+        self.width, self.height = size or (self.native_width, self.native_height)
+
+        # Index world -> pixel masking per sumbu
+        self.x_index = stretch_index(self.native_width, self.width)
+        self.y_index = stretch_index(self.native_height, self.height)
+
+        # Versi list + view flat untuk akses scalar cepat dari Python
+        self._x_cells = self.x_index.tolist()
+        self._y_rows = (self.y_index * self.native_width).tolist()
+        self._cells = memoryview(self.zones).cast('B')
+
+        # Tabel sweep (dibangun saat pertama dipakai)
+        self._sweep_ready = False
+
+    @classmethod
+    def from_surface(cls, surface, size: Optional[Tuple[int, int]] = None,
+                     chunk_columns: int = 512) -> "ZoneGrid":
+        """
+        Bangun grid dari pygame.Surface masking (resolusi asli).
+
+        Diproses per potongan kolom supaya array sementara tidak
+        sebesar seluruh masking sekaligus.
+
+        Args:
+            surface: Masking surface, tidak perlu di-scale
+            size: Ukuran world (width, height) tempat masking di-scale
+        """
+        import pygame
+
+        width, height = surface.get_size()
+        zones = np.empty((height, width), dtype=np.uint8)
+
+        if surface.get_bitsize() >= 24:
+            pixels = pygame.surfarray.pixels3d(surface)  # (width, height, 3)
+        else:
+            # Masking 8/16-bit (PNG indexed): pixels3d tidak bisa, salin warnanya
+            pixels = pygame.surfarray.array3d(surface)
+        try:
+            for start in range(0, width, chunk_columns):
+                stop = min(width, start + chunk_columns)
+                zones[:, start:stop] = classify_rgb(pixels[start:stop]).T
+        finally:
+            del pixels  # Lepas lock surface
+
+        return cls(zones, size)
+
+    @classmethod
+    def from_rgb(cls, rgb: np.ndarray, size: Optional[Tuple[int, int]] = None) -> "ZoneGrid":
+        """Bangun grid dari array (height, width, 3)."""
+        return cls(classify_rgb(rgb), size)
+
+    def zone_at(self, x: float, y: float) -> int:
+        """
+        Label zona di posisi world (x, y).
+
+        Returns:
+            ZONE_* atau ZONE_OUT jika di luar map
+        """
+        ix = int(x)
+        iy = int(y)
+        if ix < 0 or ix >= self.width or iy < 0 or iy >= self.height:
+            return ZONE_OUT
+        return self._cells[self._y_rows[iy] + self._x_cells[ix]]
+
+    def zones_at(self, xs: np.ndarray, ys: np.ndarray) -> np.ndarray:
+        """
+        Versi vectorized dari zone_at().
+
+        Args:
+            xs, ys: Array koordinat world (float atau int, shape sama)
+
+        Returns:
+            Array uint8 label zona, ZONE_OUT untuk yang di luar map
+        """
+        ix = np.asarray(xs).astype(np.int64)  # Truncate seperti int()
+        iy = np.asarray(ys).astype(np.int64)
+        inside = (ix >= 0) & (ix < self.width) & (iy >= 0) & (iy < self.height)
+
+        result = np.full(ix.shape, ZONE_OUT, dtype=np.uint8)
+        result[inside] = self.zones[self.y_index[iy[inside]], self.x_index[ix[inside]]]
+        return result
+
+    def native_wall_mask(self) -> np.ndarray:
+        """Bitmap bool resolusi masking, True di pixel wall."""
+        if self._walls is None:
+            self._walls = self.zones == ZONE_WALL
+        return self._walls
+
+    def wall_mask(self) -> np.ndarray:
+        """
+        Bitmap bool ukuran world (height, width), True di pixel wall.
+
+        Dibuat penuh, hanya untuk precompute (misal distance field).
+        """
+        native = self.native_wall_mask()
+        return native[self.y_index][:, self.x_index]
+
+    # =========================================================================
+    # Sweep (DDA)
+    # =========================================================================
+
+    def _build_sweep_tables(self) -> None:
+        """Batas world tiap kolom/baris masking + blok wall untuk early-out."""
+        # col_start[c] = x world pertama yang jatuh ke kolom c (c = native_width -> width)
+        self.col_start = np.searchsorted(
+            self.x_index, np.arange(self.native_width + 1)).astype(np.float64)
+        self.row_start = np.searchsorted(
+            self.y_index, np.arange(self.native_height + 1)).astype(np.float64)
+
+        size = WALL_BLOCK_SIZE
+        rows = -(-self.native_height // size)
+        cols = -(-self.native_width // size)
+        padded = np.zeros((rows * size, cols * size), dtype=bool)
+        # Bitmap wall sementara kalau belum ada (tidak disimpan, cukup blok-nya)
+        walls = self._walls if self._walls is not None else self.zones == ZONE_WALL
+        padded[:self.native_height, :self.native_width] = walls
+        self.wall_blocks = padded.reshape(rows, size, cols, size).any(axis=(1, 3))
+
+        # Versi list/bytes untuk segment_hits_wall() (scalar). Pixel wall dibaca
+        # langsung dari self._cells (1 byte/pixel), tanpa salinan per pixel.
+        self._col_start = self.col_start.tolist()
+        self._row_start = self.row_start.tolist()
+        self._y_cells = self.y_index.tolist()
+        self._block_cols = cols
+        self._wall_blocks = self.wall_blocks.astype(np.uint8).tobytes()
+        self._sweep_ready = True
+
+    def area_has_wall(self, x_min: float, y_min: float, x_max: float, y_max: float) -> bool:
+        """
+        Apakah ada blok wall yang beririsan dengan kotak world ini.
+
+        Cek kasar per blok (WALL_BLOCK_SIZE): False berarti pasti tidak ada
+        pixel wall di dalam kotak, True belum tentu ada.
+        """
+        if not self._sweep_ready:
+            self._build_sweep_tables()
+
+        if x_max < 0 or y_max < 0 or x_min >= self.width or y_min >= self.height:
+            return False
+        ix0 = int(x_min) if x_min > 0 else 0
+        iy0 = int(y_min) if y_min > 0 else 0
+        ix1 = int(x_max) if x_max < self.width else self.width - 1
+        iy1 = int(y_max) if y_max < self.height else self.height - 1
+
+        size = WALL_BLOCK_SIZE
+        blocks = self._wall_blocks
+        block_cols = self._block_cols
+        bx0 = self._x_cells[ix0] // size
+        bx1 = self._x_cells[ix1] // size
+        for by in range(self._y_cells[iy0] // size, self._y_cells[iy1] // size + 1):
+            row = by * block_cols
+            if blocks.find(1, row + bx0, row + bx1 + 1) >= 0:
+                return True
+        return False
+
+    def segment_hits_wall(self, x0: float, y0: float, x1: float, y1: float) -> bool:
+        """
+        Apakah garis (x0, y0) -> (x1, y1) melewati pixel wall.
+
+        Pixel masking ditelusuri satu per satu dengan DDA (termasuk pixel
+        akhir, tidak termasuk pixel awal). Garis yang ujungnya di luar map
+        tidak dicek (sudah ditangani collision biasa).
+        """
+        if not self._sweep_ready:
+            self._build_sweep_tables()
+
+        width, height = self.width, self.height
+        if not (0 <= x0 < width and 0 <= y0 < height and 0 <= x1 < width and 0 <= y1 < height):
+            return False
+
+        cx = self._x_cells[int(x0)]
+        cy = self._y_cells[int(y0)]
+        ex = self._x_cells[int(x1)]
+        ey = self._y_cells[int(y1)]
+        if cx == ex and cy == ey:
+            return False
+
+        # Early-out: tidak ada wall di blok yang dicakup garis (garis pendek: 1-4 blok)
+        size = WALL_BLOCK_SIZE
+        blocks = self._wall_blocks
+        block_cols = self._block_cols
+        bx0, bx1 = cx // size, ex // size
+        by0, by1 = cy // size, ey // size
+        if bx0 == bx1 and by0 == by1:
+            if not blocks[by0 * block_cols + bx0]:
+                return False
+        else:
+            if bx0 > bx1:
+                bx0, bx1 = bx1, bx0
+            if by0 > by1:
+                by0, by1 = by1, by0
+            for by in range(by0, by1 + 1):
+                row = by * block_cols
+                if blocks.find(1, row + bx0, row + bx1 + 1) >= 0:
+                    break
+            else:
+                return False
+
+        col_start = self._col_start
+        row_start = self._row_start
+        cells = self._cells
+        native_width = self.native_width
+        dx = x1 - x0
+        dy = y1 - y0
+
+        # t (0-1) saat garis keluar dari kolom/baris sekarang
+        step_x = 1 if ex > cx else -1
+        step_y = 1 if ey > cy else -1
+        t_x = ((col_start[cx + 1] if step_x > 0 else col_start[cx]) - x0) / dx if cx != ex else 0.0
+        t_y = ((row_start[cy + 1] if step_y > 0 else row_start[cy]) - y0) / dy if cy != ey else 0.0
+
+        while cx != ex or cy != ey:
+            if cx != ex and (cy == ey or t_x <= t_y):
+                cx += step_x
+                if cx != ex:
+                    t_x = ((col_start[cx + 1] if step_x > 0 else col_start[cx]) - x0) / dx
+            else:
+                cy += step_y
+                if cy != ey:
+                    t_y = ((row_start[cy + 1] if step_y > 0 else row_start[cy]) - y0) / dy
+            if cells[cy * native_width + cx] == ZONE_WALL:
+                return True
+        return False
+
+    def segments_hit_wall(self, x0: np.ndarray, y0: np.ndarray,
+                          x1: np.ndarray, y1: np.ndarray) -> np.ndarray:
+        """Versi array dari segment_hits_wall(), hasil sama persis per elemen."""
+        if not self._sweep_ready:
+            self._build_sweep_tables()
+
+        x0 = np.asarray(x0, dtype=np.float64)
+        y0 = np.asarray(y0, dtype=np.float64)
+        x1 = np.asarray(x1, dtype=np.float64)
+        y1 = np.asarray(y1, dtype=np.float64)
+        hit = np.zeros(x0.shape, dtype=bool)
+
+        inside = ((x0 >= 0) & (x0 < self.width) & (y0 >= 0) & (y0 < self.height) &
+                  (x1 >= 0) & (x1 < self.width) & (y1 >= 0) & (y1 < self.height))
+        lanes = np.flatnonzero(inside)
+        if lanes.size == 0:
+            return hit
+
+        cx = self.x_index[x0[lanes].astype(np.int64)]
+        cy = self.y_index[y0[lanes].astype(np.int64)]
+        ex = self.x_index[x1[lanes].astype(np.int64)]
+        ey = self.y_index[y1[lanes].astype(np.int64)]
+
+        # Early-out per blok (garis pendek: paling banyak 2x2 blok, sisanya dicek DDA)
+        size = WALL_BLOCK_SIZE
+        bx0, bx1 = np.minimum(cx, ex) // size, np.maximum(cx, ex) // size
+        by0, by1 = np.minimum(cy, ey) // size, np.maximum(cy, ey) // size
+        blocks = self.wall_blocks
+        near = (blocks[by0, bx0] | blocks[by0, bx1] | blocks[by1, bx0] | blocks[by1, bx1] |
+                (bx1 - bx0 > 1) | (by1 - by0 > 1))
+        keep = near & ((cx != ex) | (cy != ey))
+        lanes, cx, cy, ex, ey = lanes[keep], cx[keep], cy[keep], ex[keep], ey[keep]
+        if lanes.size == 0:
+            return hit
+
+        ox, oy = x0[lanes], y0[lanes]
+        dx, dy = x1[lanes] - ox, y1[lanes] - oy
+        step_x = np.where(ex > cx, 1, -1)
+        step_y = np.where(ey > cy, 1, -1)
+        col_start, row_start = self.col_start, self.row_start
+        zones = self.zones
+
+        def exit_t_x(cx, moving):
+            edge = col_start[np.where(step_x > 0, cx + 1, cx)]
+            return np.where(moving, (edge - ox) / np.where(moving, dx, 1.0), 0.0)
+
+        def exit_t_y(cy, moving):
+            edge = row_start[np.where(step_y > 0, cy + 1, cy)]
+            return np.where(moving, (edge - oy) / np.where(moving, dy, 1.0), 0.0)
+
+        t_x = exit_t_x(cx, cx != ex)
+        t_y = exit_t_y(cy, cy != ey)
+        active = np.ones(lanes.size, dtype=bool)
+
+        for _ in range(int((np.abs(ex - cx) + np.abs(ey - cy)).max())):
+            active &= (cx != ex) | (cy != ey)
+            if not active.any():
+                break
+            move_x = active & (cx != ex) & ((cy == ey) | (t_x <= t_y))
+            move_y = active & ~move_x
+
+            cx = cx + np.where(move_x, step_x, 0)
+            cy = cy + np.where(move_y, step_y, 0)
+            t_x = np.where(move_x, exit_t_x(cx, cx != ex), t_x)
+            t_y = np.where(move_y, exit_t_y(cy, cy != ey), t_y)
+
+            hit_now = active & (zones[cy, cx] == ZONE_WALL)
+            hit[lanes[hit_now]] = True
+            active &= ~hit_now
+
+        return hit
+
+    def get_size(self):
+        return (self.width, self.height)
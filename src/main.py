@@ -5,6 +5,7 @@ import pickle
 import neat
 import pygame
 import random
+import time
 import wave
 
 # Setup path
@@ -15,10 +16,16 @@ sys.path.insert(0, os.path.join(BASE_DIR, "config"))
 # Import modules
 from core.game_manager import GameManager, GameConfig
 from core.display_manager import DisplayManager
+from core.timestep import FixedTimestep, TICK_RATE
+from core.motor_contact import MotorContacts
+from core.event_log import EventLog
+from core.profiler import FrameProfiler
 from screens.main_menu import MainMenuScreen
 from screens.pick_map import PickMapScreen
 from ui.hud import GameHUD
 from ui.components import PausePopup
+from ai.compiled_net import CompiledNetwork
+from ai.output_cache import MemoizedNetwork
 import game_config as cfg
 
 
@@ -26,7 +33,10 @@ def load_ai(model_path, config_path):
     config = neat.Config(neat.DefaultGenome, neat.DefaultReproduction, 
                          neat.DefaultSpeciesSet, neat.DefaultStagnation, config_path)
     with open(model_path, 'rb') as f: genome = pickle.load(f)
-    return neat.nn.FeedForwardNetwork.create(genome, config)
+    net = CompiledNetwork.create(genome, config)
+    if cfg.AI_OUTPUT_CACHE_SIZE > 0:
+        net = MemoizedNetwork(net, cfg.AI_OUTPUT_CACHE_SIZE)
+    return net
 
 def find_model(base_dir, model_name):
     paths = [os.path.join(base_dir, "models", model_name), os.path.join(base_dir, model_name)]
@@ -144,6 +154,11 @@ def main():
         spawn_angle=map_data["spawn_angle"],
         masking_file=map_data["masking_file"],
         masking_subfolder=cfg.MASKING_SUBFOLDER,
+        use_distance_field=cfg.USE_DISTANCE_FIELD,
+        use_progress_field=cfg.USE_PROGRESS_FIELD,
+        swept_collision=cfg.SWEPT_COLLISION,
+        motor_contact=cfg.MOTOR_CONTACT,
+        opponent_radar=cfg.OPPONENT_RADAR,
         fullscreen=cfg.FULLSCREEN
     )
 
@@ -152,7 +167,7 @@ def main():
     config_path = os.path.join(BASE_DIR, "config.txt")
     
     game = GameManager(BASE_DIR, game_cfg)
-    game.load_track()
+    display.set_track(game.load_track(), (game.map_width, game.map_height))
     game.load_masking()
     hud = GameHUD((display.width, display.height))
     pause_popup = PausePopup((display.width, display.height))
@@ -193,6 +208,20 @@ def main():
 
     all_racers = [player] + ai_cars
     
+    # Event checkpoint/lap ke logs/ (pengganti print), id = index di all_racers
+    log_ext = "bin" if cfg.EVENT_LOG_FORMAT == "binary" else "jsonl"
+    events = EventLog(cfg.EVENT_LOG_LEVEL,
+                      os.path.join(BASE_DIR, "logs", f"race-{time.strftime('%Y%m%d-%H%M%S')}.{log_ext}"),
+                      cfg.EVENT_LOG_FORMAT, threaded=cfg.EVENT_LOG_THREADED, echo=cfg.EVENT_LOG_ECHO)
+    for index, racer in enumerate(all_racers):
+        racer.checkpoint.events = events
+        racer.checkpoint.event_id = index
+    
+    # Contact antar motor & radar lawan (index sama dengan all_racers)
+    contacts = None
+    if game_cfg.motor_contact or game_cfg.opponent_radar:
+        contacts = MotorContacts(contact=game_cfg.motor_contact)
+    
     # Game State
     running = True
     is_paused = False
@@ -201,8 +230,16 @@ def main():
     countdown = 180 
     rev_played = False
     race_started = False
+    
+    # Simulasi 60 tick/detik terlepas dari FPS render (GAME_SPEED > 1 = fast-forward)
+    timestep = FixedTimestep(tick_rate=TICK_RATE, speed=cfg.GAME_SPEED)
+    frame_dt = 0.0
+    
+    # Profiler per subsistem (F3), wrapper hanya terpasang saat overlay aktif
+    profiler = None
 
     while running:
+        frame_start = time.perf_counter()
         for event in pygame.event.get():
             if event.type == pygame.QUIT: running = False
             
@@ -220,6 +257,7 @@ def main():
                         rev_played = False
                         
                         snd_countdown_rev.stop()
+                        if contacts is not None: contacts.reset()
                         
                         player.reset(sx, sy, s_angle)
                         for i, ai in enumerate(ai_cars):
@@ -233,8 +271,28 @@ def main():
                     is_paused = not is_paused
                     pause_popup.is_visible = is_paused
                     pause_popup.action = None
+                elif event.key == pygame.K_F3:
+                    if profiler is None:
+                        profiler = FrameProfiler()
+                        for racer in all_racers: profiler.instrument_motor(racer)
+                        for net in ai_nets: profiler.wrap(net, "activate", "network")
+                        profiler.wrap_prefix(display, "render_", "render")
+                        profiler.wrap_prefix(hud, "render_", "hud")
+                        profiler.wrap(pygame.event, "get", "events")
+                    else:
+                        profiler.uninstall()
+                        profiler = None
 
-        if not is_paused:
+        # --- SIMULASI (fixed timestep, bisa beberapa tick per frame) ---
+        if is_paused:
+            timestep.reset()
+            ticks = 0
+        else:
+            ticks = timestep.advance(frame_dt)
+        
+        for _ in range(ticks):
+            for racer in all_racers: racer.begin_tick()
+            
             # --- COUNTDOWN ---
             if countdown > 0:
                 if not rev_played:
@@ -244,6 +302,8 @@ def main():
                 if countdown <= 0:
                     race_started = True
                     for ai in ai_cars: ai.velocity = 7
+            elif race_started and countdown > -60:
+                countdown -= 1  # Durasi tulisan GO
             
             if race_started and not game_over:
                 # Player
@@ -258,9 +318,12 @@ def main():
                         game_over = True
                 
                 # AI
-                for ai, net in zip(ai_cars, ai_nets):
+                for index, (ai, net) in enumerate(zip(ai_cars, ai_nets), start=1):
                     if ai.alive:
-                        out = net.activate(ai.get_radar_data())
+                        inputs = ai.get_radar_data()
+                        if game_cfg.opponent_radar:
+                            inputs = inputs + [contacts.opponent_reading(index)]
+                        out = net.activate(inputs)
                         steering = max(-1, min(1, out[0] + random.uniform(-0.1, 0.1)))
                         throttle = max(0.3, min(1, out[1]))
                         ai.set_ai_input(steering, throttle)
@@ -270,18 +333,23 @@ def main():
                             ai.velocity = 0
                             winner = f"AI ({ai.color.upper()})"
                             game_over = True
+                
+                if contacts is not None: contacts.step(all_racers)
 
-        # Render
+        # Render (posisi di-interpolasi antar tick)
+        alpha = timestep.alpha
         target = player if player.alive else (ai_cars[0] if ai_cars and ai_cars[0].alive else player)
-        if not is_paused: display.update_camera(target.x, target.y, game.map_width, game.map_height)
+        if not is_paused:
+            target_x, target_y, _ = target.render_position(alpha)
+            display.update_camera(target_x, target_y, game.map_width, game.map_height, frame_dt)
         
-        display.render_track(game.track_surface)
+        display.render_track()
         for ai in ai_cars: 
-            if ai.alive: display.render_motor(ai)
-        if player.alive: display.render_motor(player)
+            if ai.alive: display.render_motor(ai, alpha=alpha)
+        if player.alive: display.render_motor(player, alpha=alpha)
         
         if countdown > 0: display.render_countdown((countdown // 60) + 1)
-        elif race_started and countdown > -60: display.render_go(); countdown -= 1 if not is_paused else 0
+        elif race_started and countdown > -60: display.render_go()
             
         hud.render_leaderboard(display.screen, all_racers)
         # DEBUG: Print lap count setiap frame
@@ -291,8 +359,18 @@ def main():
         
         if game_over and winner: hud.render_game_over(display.screen, winner)
         if is_paused: pause_popup.draw(display.screen)
+        if profiler is not None:
+            hud.render_profiler(display.screen, profiler.averages())
+            profiler.end_frame(time.perf_counter() - frame_start)
         
-        display.tick(60)
+        events.flush()
+        frame_dt = display.tick(cfg.RENDER_FPS)
+
+    events.close()
+    for ai, net in zip(ai_cars, ai_nets):
+        if isinstance(net, MemoizedNetwork):
+            print(f"[MEMO] AI {ai.color}: hit rate {net.cache.hit_rate * 100:.1f}% "
+                  f"({net.cache.hits}/{net.cache.lookups})")
 
     display.quit()
 
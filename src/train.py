@@ -47,6 +47,93 @@ def main():
         help='Render setiap N frame, misal 10 = render setiap 10 frame (default: 1)'
     )
     
+    parser.add_argument(
+        '--render-fps',
+        type=int,
+        default=None,
+        help='FPS render mode visual, simulasi tetap jalan secepatnya (default: TRAINING_RENDER_FPS)'
+    )
+    
+    parser.add_argument(
+        '--distance-field',
+        action='store_true',
+        help='Radar pakai distance field (sphere tracing), default ikut game_config'
+    )
+    
+    parser.add_argument(
+        '--no-progress-field',
+        action='store_true',
+        help='Fitness pakai jarak tempuh (lama), bukan progress sepanjang track'
+    )
+    
+    parser.add_argument(
+        '--vectorized',
+        action='store_true',
+        help='Simulasi seluruh populasi sekaligus dengan array NumPy (hasil sama, lebih cepat)'
+    )
+    
+    parser.add_argument(
+        '--workers', '-w',
+        type=int,
+        default=1,
+        help='Jumlah proses evaluasi paralel, >1 otomatis headless (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--tick-budget',
+        type=int,
+        default=None,
+        help='Budget tick per generasi, di-reset tiap lap baru (default: GENERATION_TICK_BUDGET)'
+    )
+    
+    parser.add_argument(
+        '--memo',
+        type=int,
+        default=0,
+        help='Kapasitas output cache per network (input radar sama = tanpa forward), 0 = mati'
+    )
+    
+    parser.add_argument(
+        '--log-level',
+        type=int,
+        choices=[0, 1, 2, 3],
+        default=None,
+        help='Event log: 0 mati, 1 ringkasan generasi, 2 + lap/death/stuck, 3 + checkpoint (default: EVENT_LOG_LEVEL)'
+    )
+    
+    parser.add_argument(
+        '--log-format',
+        choices=['jsonl', 'binary'],
+        default=None,
+        help='Format event log di logs/ (default: EVENT_LOG_FORMAT)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        action='store_true',
+        help='Catat waktu per subsistem (radar, collision, physics, network, render) ke logs/profile-*.csv/json'
+    )
+    
+    parser.add_argument(
+        '--cull',
+        choices=['off', 'halving', 'percentile'],
+        default=None,
+        help='Early culling genome tertinggal di milestone tick (default: CULL_MODE)'
+    )
+    
+    parser.add_argument(
+        '--fitness-cache',
+        type=int,
+        default=None,
+        help='Kapasitas fitness cache genome identik, 0 = simulasikan semua (default: FITNESS_CACHE_SIZE)'
+    )
+    
+    parser.add_argument(
+        '--coverage',
+        action='store_true',
+        help='Simpan heatmap coverage populasi per generasi ke logs/coverage-*.npy'
+    )
+    
     parser.add_argument(
         '--checkpoint', '-c',
         type=str,
@@ -64,7 +151,12 @@ def main():
         print(f"ERROR: Config tidak ditemukan: {config_path}")
         sys.exit(1)
     
-    mode_str = "HEADLESS" if args.headless else f"Visual (render every {args.render_interval} frame)"
+    if args.workers > 1:
+        mode_str = f"HEADLESS ({args.workers} workers)"
+    elif args.headless:
+        mode_str = "HEADLESS"
+    else:
+        mode_str = f"Visual (render every {args.render_interval} frame)"
     
     print("=" * 60)
     print("  TABRAK BAHLIL - NEAT AI Training")
@@ -73,6 +165,8 @@ def main():
     print(f"Generations : {args.generations}")
     print(f"Target Laps : {args.laps}")
     print(f"Mode        : {mode_str}")
+    if args.tick_budget:
+        print(f"Tick Budget : {args.tick_budget} tick/generasi")
     print(f"Config      : {config_path}")
     if args.checkpoint:
         print(f"Checkpoint  : {args.checkpoint} (RESUME)")
@@ -84,7 +178,20 @@ def main():
         config_path=config_path,
         track_name=args.track,
         headless=args.headless,
-        render_interval=args.render_interval
+        render_interval=args.render_interval,
+        use_distance_field=True if args.distance_field else None,
+        vectorized=args.vectorized,
+        workers=args.workers,
+        tick_budget=args.tick_budget,
+        memo_size=args.memo,
+        render_fps=args.render_fps,
+        log_level=args.log_level,
+        log_format=args.log_format,
+        profile=args.profile,
+        cull=args.cull,
+        fitness_cache=args.fitness_cache,
+        use_progress_field=False if args.no_progress_field else None,
+        coverage=True if args.coverage else None
     )
     trainer.target_laps = args.laps
     
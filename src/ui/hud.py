@@ -27,8 +27,8 @@ class GameHUD:
         pygame.draw.rect(surface, self.colors['border'], rect, 4, border_radius=border_radius)
 
     def render_leaderboard(self, surface, cars):
-        """Render Ranking berdasarkan jarak tempuh (Live Rank)."""
-        sorted_cars = sorted(cars, key=lambda c: c.distance_traveled, reverse=True)
+        """Render Ranking berdasarkan progress sepanjang track (Live Rank)."""
+        sorted_cars = sorted(cars, key=lambda c: c.race_progress, reverse=True)
         
         panel_w, panel_h = 220, 180
         panel_x, panel_y = 20, 20
@@ -132,4 +132,28 @@ class GameHUD:
         
         # 4. Positioning (Centered)
         surface.blit(t1, t1.get_rect(center=(rect.centerx, rect.centery - 40)))
-        surface.blit(t2, t2.get_rect(center=(rect.centerx, rect.centery + 50)))
\ No newline at end of file
+        surface.blit(t2, t2.get_rect(center=(rect.centerx, rect.centery + 50)))
+
+    def render_profiler(self, surface, averages):
+        """Overlay profiler (F3): rata-rata ms per frame tiap subsistem."""
+        rows = sorted(averages.items(), key=lambda item: -item[1])
+        total = sum(averages.values())
+        
+        panel_w, panel_h = 230, 60 + 22 * len(rows)
+        rect = pygame.Rect(self.width - panel_w - 20, 20, panel_w, panel_h)
+        self.draw_panel(surface, rect)
+        
+        title = self.font_small.render(f"FRAME {total:.2f} ms", True, self.colors['text'])
+        surface.blit(title, (rect.x + 15, rect.y + 15))
+        
+        for i, (section, ms) in enumerate(rows):
+            y_pos = rect.y + 45 + i * 22
+            share = ms / total if total > 0 else 0.0
+            
+            name = self.font_small.render(section, True, self.colors['text'])
+            value = self.font_small.render(f"{ms:.2f}", True, self.colors['text'])
+            surface.blit(name, (rect.x + 15, y_pos))
+            surface.blit(value, (rect.right - 60, y_pos))
+            
+            bar = pygame.Rect(rect.x + 95, y_pos + 5, int(60 * share), 8)
+            pygame.draw.rect(surface, self.colors['bar_fill'], bar)